@@ -0,0 +1,67 @@
+"""
+Benchmarks of the vectorized multiclass curves against computing the binary curve of each class in a loop,
+and of the error of the binned curve approximations against the exact scores.
+"""
+import time
+
+import pytest
+import torch
+
+from pytorch_lightning.metrics.functional.classification import (
+    auroc,
+    average_precision,
+    binned_auroc,
+    binned_average_precision,
+    multiclass_precision_recall_curve,
+    multiclass_roc,
+    precision_recall_curve,
+    roc,
+)
+
+
+def _looped_roc(pred, target):
+    return tuple(roc(pred[:, c], target, pos_label=c) for c in range(pred.size(1)))
+
+
+def _looped_precision_recall_curve(pred, target):
+    return tuple(precision_recall_curve(pred[:, c], target, pos_label=c) for c in range(pred.size(1)))
+
+
+def _best_time(fn, *args, num_runs=3):
+    times = []
+    for _ in range(num_runs):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+@pytest.mark.parametrize(['vectorized', 'looped'], [
+    pytest.param(multiclass_roc, _looped_roc, id='roc'),
+    pytest.param(multiclass_precision_recall_curve, _looped_precision_recall_curve, id='precision_recall_curve'),
+])
+def test_multiclass_curve_speed(vectorized, looped, num_samples=1000, num_classes=1000):
+    torch.manual_seed(0)
+    pred = torch.softmax(torch.randn(num_samples, num_classes), dim=1)
+    target = torch.arange(num_samples) % num_classes
+
+    vectorized_time = _best_time(vectorized, pred, target)
+    looped_time = _best_time(looped, pred, target)
+    print(f'{vectorized.__name__}: vectorized {vectorized_time:.3f}s, looped over classes {looped_time:.3f}s')
+    assert vectorized_time < looped_time
+
+
+@pytest.mark.parametrize(['binned', 'exact'], [
+    pytest.param(binned_auroc, auroc, id='auroc'),
+    pytest.param(binned_average_precision, average_precision, id='average_precision'),
+])
+def test_binned_curve_error(binned, exact, num_samples=100000):
+    torch.manual_seed(0)
+    target = torch.randint(2, (num_samples,))
+    pred = torch.sigmoid(torch.randn(num_samples) + target.float())
+
+    exact_score = exact(pred, target)
+    for num_bins in (10, 100, 1000, 10000):
+        error = (binned(pred, target, num_bins=num_bins) - exact_score).abs().item()
+        print(f'{binned.__name__} with {num_bins} bins: absolute error {error:.2e}')
+    assert error < 1e-3
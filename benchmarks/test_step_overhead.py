@@ -0,0 +1,152 @@
+"""
+Micro-benchmarks of the bookkeeping the training loop does on every batch.
+"""
+import time
+from collections import ChainMap
+from copy import copy, deepcopy
+
+import torch
+from torch import nn
+
+from pytorch_lightning import Callback, LightningModule, Trainer
+from pytorch_lightning.accelerators.base_backend import clip_grad_norm
+from pytorch_lightning.core.step_result import TrainResult
+from pytorch_lightning.utilities.model_utils import _is_overridden, is_overridden
+from tests.base import EvalModelTemplate
+
+# the model hooks the training loop dispatches on every batch
+_BATCH_HOOKS = ('on_batch_start', 'on_train_batch_start', 'on_after_backward', 'training_step_end',
+                'on_batch_end', 'on_train_batch_end')
+
+
+def _time_per_call(fn, num_calls=200):
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        fn()
+    return (time.perf_counter() - start) / num_calls
+
+
+def test_monitor_metrics_view_overhead():
+    """The per-step view on monitor metrics replaced a deepcopy of all `callback_metrics`."""
+    callback_metrics = {f'metric_{i}': torch.rand(1).squeeze() for i in range(64)}
+    batch_log_metrics = {'loss': torch.tensor(0.5)}
+
+    def copy_metrics():
+        monitor_metrics = deepcopy(callback_metrics)
+        monitor_metrics.update(batch_log_metrics)
+        return monitor_metrics.get('metric_0')
+
+    def view_metrics():
+        return ChainMap(batch_log_metrics, callback_metrics).get('metric_0')
+
+    assert copy_metrics() == view_metrics()
+
+    copy_time = _time_per_call(copy_metrics)
+    view_time = _time_per_call(view_metrics)
+    print(f'deepcopy: {copy_time * 1e6:.1f} us/step, view: {view_time * 1e6:.1f} us/step')
+    assert view_time < copy_time
+
+
+def _looped_clip_grad_norm(parameters, max_norm, norm_type=2.0, eps=1e-6):
+    # the former per-parameter implementation of `Accelerator._clip_gradients`
+    parameters = [p for p in parameters if p.grad is not None]
+    device = parameters[0].device
+    out = torch.empty(len(parameters), device=device)
+    for i, p in enumerate(parameters):
+        torch.norm(p.grad.data.to(device), norm_type, out=out[i])
+    total_norm = torch.norm(out, norm_type)
+    clip_coef = torch.tensor(max_norm, device=device) / (total_norm + eps)
+    clip_coef = torch.min(clip_coef, torch.ones_like(clip_coef))
+    for p in parameters:
+        p.grad.data.mul_(clip_coef.to(p.grad.data.device))
+    return total_norm
+
+
+def test_clip_gradients_many_parameters(num_layers=500):
+    """Clipping a model with many small parameters, where the per-tensor overhead dominates."""
+    model = nn.Sequential(*[nn.Linear(8, 8) for _ in range(num_layers)])
+    for p in model.parameters():
+        p.grad = torch.randn_like(p)
+    grads = [p.grad.clone() for p in model.parameters()]
+
+    def reset_grads():
+        for p, grad in zip(model.parameters(), grads):
+            p.grad.copy_(grad)
+
+    looped_norm = _looped_clip_grad_norm(model.parameters(), max_norm=1.)
+    looped_grads = [p.grad.clone() for p in model.parameters()]
+    reset_grads()
+    fused_norm = clip_grad_norm(model.parameters(), max_norm=1.)
+    assert torch.allclose(looped_norm, fused_norm)
+    assert all(torch.allclose(a, p.grad) for a, p in zip(looped_grads, model.parameters()))
+
+    looped_time = _time_per_call(lambda: _looped_clip_grad_norm(model.parameters(), max_norm=1e6), num_calls=50)
+    fused_time = _time_per_call(lambda: clip_grad_norm(model.parameters(), max_norm=1e6), num_calls=50)
+    print(f'{num_layers * 2} parameters, looped: {looped_time * 1e3:.2f} ms/step, grouped: {fused_time * 1e3:.2f} ms/step')
+    assert fused_time < looped_time
+
+
+def test_hook_dispatch_overhead(tmpdir):
+    """Looking up which hooks a model overrides, for the hooks of a training step."""
+    model = EvalModelTemplate()
+
+    def uncached_lookup():
+        return [_is_overridden(hook, model, LightningModule) for hook in _BATCH_HOOKS]
+
+    def cached_lookup():
+        return [is_overridden(hook, model) for hook in _BATCH_HOOKS]
+
+    assert uncached_lookup() == cached_lookup()
+
+    uncached_time = _time_per_call(uncached_lookup, num_calls=2000)
+    cached_time = _time_per_call(cached_lookup, num_calls=2000)
+
+    # the full dispatch of the hooks without arguments, which the model does not override
+    trainer = Trainer(default_root_dir=tmpdir)
+    trainer.model = model
+    dispatch_time = _time_per_call(
+        lambda: [trainer.call_hook(hook) for hook in ('on_batch_start', 'on_after_backward', 'on_batch_end')],
+        num_calls=2000,
+    )
+    print(f'is_overridden per step, uncached: {uncached_time * 1e6:.1f} us, cached: {cached_time * 1e6:.1f} us,'
+          f' empty call_hook x3: {dispatch_time * 1e6:.1f} us')
+    assert cached_time < uncached_time
+
+
+def test_callback_dispatch_overhead(tmpdir, num_callbacks=10):
+    """Dispatching the hooks of a training step to callbacks which implement none of them."""
+    trainer = Trainer(default_root_dir=tmpdir, callbacks=[Callback() for _ in range(num_callbacks)])
+    trainer.model = EvalModelTemplate()
+
+    def dispatch():
+        for hook in ('on_batch_start', 'on_after_backward', 'on_batch_end'):
+            trainer.call_hook(hook)
+
+    all_callbacks_time = _time_per_call(dispatch, num_calls=2000)
+    trainer.build_callback_hook_table()
+    table_time = _time_per_call(dispatch, num_calls=2000)
+    print(f'{len(trainer.callbacks)} callbacks, without table: {all_callbacks_time * 1e6:.1f} us/step,'
+          f' with table: {table_time * 1e6:.1f} us/step')
+    assert table_time < all_callbacks_time
+
+
+def test_result_logging_overhead(num_metrics=10):
+    """Building the result of a training step which logs a few metrics, and its detached copy."""
+    weight = torch.ones(1, requires_grad=True)
+    metrics = [torch.rand(1).squeeze() for _ in range(num_metrics)]
+
+    def training_step():
+        result = TrainResult(minimize=weight.sum())
+        for i, value in enumerate(metrics):
+            result.log(f'metric_{i}', value, on_epoch=i % 2 == 0, prog_bar=i == 0)
+        return result, copy(result)
+
+    steps = [training_step()[0] for _ in range(100)]
+    # the options of a key are built once and shared by all steps
+    assert all(step['meta']['metric_1'] is steps[0]['meta']['metric_1'] for step in steps)
+    distinct_options = {id(options) for step in steps for k, options in step['meta'].items() if k != '_internal'}
+    assert len(distinct_options) == len({id(options) for options in steps[0]['meta'].values()}) - 1
+
+    step_time = _time_per_call(training_step, num_calls=500)
+    print(f'{num_metrics} logged metrics: {step_time * 1e6:.1f} us/step')
@@ -1,9 +1,8 @@
 import torch
-from typing import Any
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from pytorch_lightning.utilities.apply_func import move_data_to_device
 from pytorch_lightning.utilities import AMPType, rank_zero_warn
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
-import math
 
 
 try:
@@ -14,6 +13,9 @@ except ImportError:
 EPSILON = 1e-6
 EPSILON_FP16 = 1e-5
 
+# older versions convert a tensor factor of `_foreach_mul_` to a python scalar, which syncs with the device
+_FOREACH_MUL_TENSOR = hasattr(torch, '_foreach_mul_') and hasattr(torch.ops.aten._foreach_mul_, 'Tensor')
+
 
 class Accelerator(object):
 
@@ -129,26 +131,77 @@ class Accelerator(object):
             parameters = model.parameters()
 
         max_norm = float(self.trainer.gradient_clip_val)
-        norm_type = float(2.0)
-
-        if isinstance(parameters, torch.Tensor):
-            parameters = [parameters]
-        parameters = list(filter(lambda p: p.grad is not None, parameters))
-
-        if norm_type == math.inf:
-            total_norm = max(p.grad.data.abs().max() for p in parameters)
-        else:
-            device = parameters[0].device
-            out = torch.empty(len(parameters), device=device)
-            for i, p in enumerate(parameters):
-                torch.norm(p.grad.data.to(device), norm_type, out=out[i])
-            total_norm = torch.norm(out, norm_type)
-
+        norm_type = float(self.trainer.gradient_clip_norm_type)
         eps = EPSILON_FP16 if self.trainer.precision == 16 else EPSILON
-        clip_coef = torch.tensor(max_norm, device=device) / (total_norm + eps)
-        clip_coef = torch.min(clip_coef, torch.ones_like(clip_coef))
-        for p in parameters:
-            p.grad.data.mul_(clip_coef.to(p.grad.data.device))
+        clip_grad_norm(parameters, max_norm, norm_type=norm_type, eps=eps)
 
     def on_train_epoch_end(self):
         pass
+
+
+def _group_tensors(tensors: List[torch.Tensor]) -> Dict[Tuple[torch.device, torch.dtype], List[torch.Tensor]]:
+    groups = {}
+    for tensor in tensors:
+        groups.setdefault((tensor.device, tensor.dtype), []).append(tensor)
+    return groups
+
+
+def _tensor_norms(tensors: List[torch.Tensor], norm_type: float) -> torch.Tensor:
+    # the multi tensor kernels only pay off without a dtype conversion of the results
+    if hasattr(torch, '_foreach_norm') and tensors[0].dtype in (torch.float32, torch.float64):
+        return torch.stack(torch._foreach_norm(tensors, norm_type))
+    # accumulate half precision norms in float32 to avoid overflowing
+    return torch.stack([torch.norm(t, norm_type, dtype=torch.float32) for t in tensors])
+
+
+def clip_grad_norm(
+        parameters: Union[torch.Tensor, Iterable[torch.Tensor]],
+        max_norm: float,
+        norm_type: float = 2.0,
+        eps: float = EPSILON,
+) -> Optional[torch.Tensor]:
+    """
+    Clips the gradients to a total p-norm of ``max_norm``, like :func:`torch.nn.utils.clip_grad_norm_`.
+
+    The gradients are grouped by device and dtype and each group is handled with multi tensor
+    kernels when available. The clip coefficient is clamped to one on the device instead of skipping
+    the multiplication, so the host never waits for the norm.
+
+    Args:
+        parameters: tensors whose gradients are clipped in place
+        max_norm: the maximal total norm of the gradients
+        norm_type: the p of the p-norm, can be ``inf``
+        eps: added to the total norm to avoid a division by zero
+
+    Return:
+        The total norm of the gradients before clipping, ``None`` if no parameter has a gradient.
+
+    Example:
+
+        >>> weight = torch.nn.Parameter(torch.zeros(2))
+        >>> weight.grad = torch.tensor([3., 4.])
+        >>> clip_grad_norm(weight, max_norm=1., eps=0.)
+        tensor(5.)
+        >>> weight.grad
+        tensor([0.6000, 0.8000])
+    """
+    if isinstance(parameters, torch.Tensor):
+        parameters = [parameters]
+    grads = [p.grad.detach() for p in parameters if p.grad is not None]
+    if not grads:
+        return None
+
+    groups = _group_tensors(grads)
+    device = grads[0].device
+    group_norms = [_tensor_norms(tensors, norm_type).to(device).float() for tensors in groups.values()]
+    total_norm = torch.cat(group_norms).norm(norm_type)
+
+    clip_coef = (max_norm / (total_norm + eps)).clamp_max(1.0)
+    for (group_device, _), tensors in groups.items():
+        group_coef = clip_coef.to(group_device)
+        if _FOREACH_MUL_TENSOR:
+            torch._foreach_mul_(tensors, group_coef.to(tensors[0].dtype))
+        else:
+            for tensor in tensors:
+                tensor.mul_(group_coef.to(tensor.dtype))
+    return total_norm
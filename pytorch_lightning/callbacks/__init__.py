@@ -1,4 +1,5 @@
 from pytorch_lightning.callbacks.base import Callback
+from pytorch_lightning.callbacks.dataloader_monitor import DataLoaderMonitor
 from pytorch_lightning.callbacks.early_stopping import EarlyStopping
 from pytorch_lightning.callbacks.gpu_stats_monitor import GPUStatsMonitor
 from pytorch_lightning.callbacks.gpu_usage_logger import GpuUsageLogger
@@ -11,6 +12,7 @@ from pytorch_lightning.callbacks.progress import ProgressBar, ProgressBarBase
 
 __all__ = [
     'Callback',
+    'DataLoaderMonitor',
     'EarlyStopping',
     'GPUStatsMonitor',
     'GpuUsageLogger',
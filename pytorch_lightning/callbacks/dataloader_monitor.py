@@ -0,0 +1,144 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+DataLoader Monitor
+==================
+
+Monitor and logs the throughput of the input pipeline during training.
+
+"""
+
+import time
+from typing import Optional
+
+import torch
+
+from pytorch_lightning.callbacks.base import Callback
+from pytorch_lightning.utilities import rank_zero_only, rank_zero_warn
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
+
+
+class DataLoaderMonitor(Callback):
+    r"""
+    Automatically monitors and logs whether training is bound by the input pipeline. ``DataLoaderMonitor``
+    is a callback and in order to use it you need to assign a logger in the ``Trainer``.
+
+    Every ``row_log_interval`` training batches, the following is logged:
+
+    - **data/samples_per_sec** and **data/batches_per_sec** – The throughput since the last log.
+    - **data/wait_time (s)** – The time spent waiting for the train dataloader since the last log.
+    - **data/compute_time (s)** – The time spent in the training batches since the last log.
+    - **data/wait_fraction** – The fraction of the step time, i.e. data wait plus compute, spent waiting for data.
+    - **data/ready_batches** – The mean number of batches the dataloader workers loaded ahead and which wait to
+      be consumed when a training batch starts, only with ``num_workers > 0``. If it stays close to zero,
+      the workers cannot keep up.
+
+    Args:
+        warn_wait_fraction: Warn once if the fraction of the step time spent waiting for data exceeds it.
+            Set to ``None`` to never warn. Default: ``0.5``.
+
+    Example::
+
+        >>> from pytorch_lightning import Trainer
+        >>> from pytorch_lightning.callbacks import DataLoaderMonitor
+        >>> dataloader_monitor = DataLoaderMonitor(warn_wait_fraction=0.3)
+        >>> trainer = Trainer(callbacks=[dataloader_monitor])
+
+    """
+
+    def __init__(self, warn_wait_fraction: Optional[float] = 0.5):
+        super().__init__()
+        if warn_wait_fraction is not None and not 0 <= warn_wait_fraction <= 1:
+            raise MisconfigurationException(
+                f'warn_wait_fraction should be between 0 and 1 or None, got {warn_wait_fraction}.'
+            )
+        self.warn_wait_fraction = warn_wait_fraction
+        self._warned = False
+
+    def on_train_start(self, trainer, pl_module):
+        if not trainer.logger:
+            raise MisconfigurationException(
+                'Cannot use DataLoaderMonitor callback with Trainer that has no logger.'
+            )
+
+    def on_train_epoch_start(self, trainer, pl_module):
+        self._reset_interval(trainer)
+
+    def on_train_batch_start(self, trainer, pl_module, batch, batch_idx, dataloader_idx):
+        self._batch_start_time = time.perf_counter()
+        self._num_batches += 1
+        self._num_samples += _batch_size(batch)
+
+        ready_batches = trainer.data_connector.train_ready_batches
+        if ready_batches is not None:
+            self._ready_batches.append(ready_batches)
+
+    def on_train_batch_end(self, trainer, pl_module, batch, batch_idx, dataloader_idx):
+        self._compute_time += time.perf_counter() - self._batch_start_time
+
+        if (batch_idx + 1) % trainer.row_log_interval == 0:
+            self._log_interval(trainer)
+            self._reset_interval(trainer)
+
+    def _reset_interval(self, trainer):
+        self._interval_start_time = time.perf_counter()
+        self._interval_start_wait_time = trainer.data_connector.train_data_wait_time
+        self._num_batches = 0
+        self._num_samples = 0
+        self._compute_time = 0.0
+        self._ready_batches = []
+
+    def _log_interval(self, trainer):
+        elapsed = time.perf_counter() - self._interval_start_time
+        wait_time = trainer.data_connector.train_data_wait_time - self._interval_start_wait_time
+        step_time = wait_time + self._compute_time
+        wait_fraction = wait_time / step_time if step_time > 0 else 0.0
+
+        stats = {
+            'data/samples_per_sec': self._num_samples / elapsed,
+            'data/batches_per_sec': self._num_batches / elapsed,
+            'data/wait_time (s)': wait_time,
+            'data/compute_time (s)': self._compute_time,
+            'data/wait_fraction': wait_fraction,
+        }
+        if self._ready_batches:
+            stats['data/ready_batches'] = sum(self._ready_batches) / len(self._ready_batches)
+        self._log_stats(trainer, stats)
+
+        if self.warn_wait_fraction is not None and wait_fraction > self.warn_wait_fraction and not self._warned:
+            self._warned = True
+            rank_zero_warn(
+                f'The training spent {wait_fraction:.0%} of the step time waiting for the train dataloader.'
+                ' Consider increasing `num_workers` of the DataLoader, setting `pin_memory=True`'
+                ' or making the data loading cheaper.', RuntimeWarning
+            )
+
+    @rank_zero_only
+    def _log_stats(self, trainer, stats):
+        trainer.logger.log_metrics(stats, step=trainer.global_step)
+
+
+def _batch_size(batch) -> int:
+    """The size of the first dimension of the first tensor in the batch, 0 if there is none."""
+    if isinstance(batch, torch.Tensor):
+        return len(batch) if batch.ndim else 1
+    if isinstance(batch, dict):
+        batch = list(batch.values())
+    if isinstance(batch, (list, tuple)):
+        for value in batch:
+            size = _batch_size(value)
+            if size:
+                return size
+    return 0
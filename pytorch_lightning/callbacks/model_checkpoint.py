@@ -348,7 +348,7 @@ class ModelCheckpoint(Callback):
         ckpt_name_metrics = trainer.logger_connector.logged_metrics
         filepath = self.format_checkpoint_name(epoch, ckpt_name_metrics)
         version_cnt = 0
-        while self._fs.exists(filepath):
+        while self._fs.exists(filepath) or trainer.checkpoint_writer.is_pending(filepath):
             filepath = self.format_checkpoint_name(epoch, ckpt_name_metrics, ver=version_cnt)
             # this epoch called before
             version_cnt += 1
@@ -414,7 +414,8 @@ class ModelCheckpoint(Callback):
 
         for cur_path in del_list:
             if cur_path != filepath:
-                self._del_model(cur_path)
+                # only delete once the new checkpoint has been written
+                trainer.checkpoint_writer.submit(self._del_model, cur_path)
 
     def on_save_checkpoint(self, trainer, pl_module):
         return {
@@ -15,7 +15,8 @@
 """
 Module to describe gradients
 """
-from typing import Dict, Union
+from collections import OrderedDict
+from typing import Dict, Optional, Union
 
 import torch
 from torch.nn import Module
@@ -23,34 +24,72 @@ from torch.nn import Module
 
 class GradInformation(Module):
 
-    def grad_norm(self, norm_type: Union[float, int, str]) -> Dict[str, float]:
+    def grad_norm(self, norm_type: Union[float, int, str], group_depth: Optional[int] = None) -> Dict[str, float]:
         """Compute each parameter's gradient's norm and their overall norm.
 
         The overall norm is computed over all gradients together, as if they
-        were concatenated into a single vector.
+        were concatenated into a single vector. All norms are computed on the
+        device and copied to the host at once.
 
         Args:
             norm_type: The type of the used p-norm, cast to float if necessary.
                 Can be ``'inf'`` for infinity norm.
+            group_depth: If set, the norms of the parameters are combined per module
+                given by the first ``group_depth`` components of the parameter names,
+                e.g. ``group_depth=1`` returns one norm per child module. Set through the
+                ``track_grad_norm_depth`` argument of the Trainer.
 
         Return:
-            norms: The dictionary of p-norms of each parameter's gradient and
-                a special entry for the total p-norm of the gradients viewed
+            norms: The dictionary of p-norms of each parameter's (or group's) gradient
+                and a special entry for the total p-norm of the gradients viewed
                 as a single vector.
+
+        Example:
+
+            >>> import torch.nn as nn
+            >>> class Model(GradInformation):
+            ...     def __init__(self):
+            ...         super().__init__()
+            ...         self.layer = nn.Linear(2, 2)
+            >>> model = Model()
+            >>> model.layer.weight.grad = torch.full((2, 2), 1.)
+            >>> model.layer.bias.grad = torch.full((2,), 2.)
+            >>> model.grad_norm(2)
+            {'grad_2.0_norm_layer.weight': 2.0, 'grad_2.0_norm_layer.bias': 2.828, 'grad_2.0_norm_total': 3.464}
+            >>> model.grad_norm(2, group_depth=1)
+            {'grad_2.0_norm_layer': 3.464, 'grad_2.0_norm_total': 3.464}
         """
         norm_type = float(norm_type)
 
-        norms, all_norms = {}, []
+        names, param_norms = [], []
         for name, p in self.named_parameters():
             if p.grad is None:
                 continue
 
-            param_norm = float(p.grad.data.norm(norm_type))
-            norms[f'grad_{norm_type}_norm_{name}'] = round(param_norm, 3)
+            names.append(name)
+            param_norms.append(p.grad.detach().norm(norm_type).float())
+
+        if not param_norms:
+            return {f'grad_{norm_type}_norm_total': 0.}
+
+        device = param_norms[0].device
+        param_norms = torch.stack([norm.to(device) for norm in param_norms])
+
+        if group_depth is not None:
+            groups = OrderedDict()
+            for idx, name in enumerate(names):
+                groups.setdefault('.'.join(name.split('.')[:group_depth]), []).append(idx)
+            names = list(groups)
+            param_norms = torch.stack([
+                param_norms.index_select(0, torch.tensor(indices, device=device)).norm(norm_type)
+                for indices in groups.values()
+            ])
 
-            all_norms.append(param_norm)
+        total_norm = param_norms.norm(norm_type)
+        # a single device to host copy for all norms
+        all_norms = torch.cat([param_norms, total_norm.view(1)]).tolist()
 
-        total_norm = float(torch.tensor(all_norms).norm(norm_type))
-        norms[f'grad_{norm_type}_norm_total'] = round(total_norm, 3)
+        norms = {f'grad_{norm_type}_norm_{name}': round(norm, 3) for name, norm in zip(names, all_norms)}
+        norms[f'grad_{norm_type}_norm_total'] = round(all_norms[-1], 3)
 
         return norms
@@ -19,11 +19,78 @@ from typing import Optional, Dict, Union, Sequence, Callable, MutableMapping, An
 import torch
 from torch import Tensor
 import os
+import weakref
 
-from pytorch_lightning.metrics.converters import sync_ddp_if_available
+from pytorch_lightning.metrics.converters import sync_ddp_bucketed_if_available, sync_ddp_if_available
+
+
+class LogOptions(object):
+    """The options a value was logged with. The options are immutable and interned by :meth:`intern`, so all
+    keys and steps logged with the same options share one instance instead of a dict each. They can be read
+    like a dict, e.g. ``options['on_epoch']``."""
+
+    _FIELDS = ('prog_bar', 'logger', 'on_step', 'on_epoch', 'reduce_fx', 'tbptt_reduce_fx', 'tbptt_pad_token')
+    __slots__ = _FIELDS + ('__weakref__',)
+
+    # only holds the options still in use, so a `reduce_fx` built per step is not kept alive
+    _interned = weakref.WeakValueDictionary()
+
+    def __init__(self, prog_bar, logger, on_step, on_epoch, reduce_fx, tbptt_reduce_fx, tbptt_pad_token):
+        for name, value in zip(self._FIELDS, (prog_bar, logger, on_step, on_epoch, reduce_fx, tbptt_reduce_fx,
+                                              tbptt_pad_token)):
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def intern(cls, *options) -> 'LogOptions':
+        """The shared instance for the options, given in the order of :attr:`_FIELDS`."""
+        try:
+            return cls._interned[options]
+        except KeyError:
+            return cls._interned.setdefault(options, cls(*options))
+        except TypeError:
+            # unhashable options, like a tbptt_pad_token tensor, are not interned
+            return cls(*options)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('LogOptions are shared and cannot be changed.')
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._FIELDS:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return getattr(self, name) if name in self._FIELDS else default
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._FIELDS
+
+    def __iter__(self):
+        return iter(self._FIELDS)
+
+    def __reduce__(self):
+        return LogOptions.intern, tuple(getattr(self, name) for name in self._FIELDS)
+
+    def keys(self):
+        return self._FIELDS
+
+    def items(self):
+        return [(name, getattr(self, name)) for name in self._FIELDS]
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({", ".join(f"{k}={v}" for k, v in self.items())})'
 
 
 class Result(Dict):
+    # attributes computed from the meta of the logged values
+    _METRIC_GETTERS = {
+        'callback_metrics': 'get_callback_metrics',
+        'batch_log_metrics': 'get_batch_log_metrics',
+        'batch_pbar_metrics': 'get_batch_pbar_metrics',
+        'epoch_log_metrics': 'get_epoch_log_metrics',
+        'epoch_pbar_metrics': 'get_epoch_pbar_metrics',
+    }
+
     def __init__(
         self,
         minimize: Optional[Tensor] = None,
@@ -35,11 +102,13 @@ class Result(Dict):
         super().__init__()
 
         # temporary until dict results are deprecated
-        os.environ['PL_USING_RESULT_OBJ'] = '1'
+        if os.environ.get('PL_USING_RESULT_OBJ') != '1':
+            os.environ['PL_USING_RESULT_OBJ'] = '1'
 
         if early_stop_on is not None:
             self.early_stop_on = early_stop_on
-        if checkpoint_on is not None and checkpoint_on:
+        # `checkpoint_on=False` disables checkpointing, a tensor is not evaluated to avoid a sync with the device
+        if checkpoint_on is not None and checkpoint_on is not False:
             self.checkpoint_on = checkpoint_on
         if hiddens is not None:
             self.hiddens = hiddens.detach()
@@ -60,19 +129,9 @@ class Result(Dict):
             return super().__getitem__(f'step_{key}')
 
     def __getattr__(self, key: str) -> Any:
+        getter = self._METRIC_GETTERS.get(key)
         try:
-            if key == 'callback_metrics':
-                return self.get_callback_metrics()
-            elif key == 'batch_log_metrics':
-                return self.get_batch_log_metrics()
-            elif key == 'batch_pbar_metrics':
-                return self.get_batch_pbar_metrics()
-            elif key == 'epoch_log_metrics':
-                return self.get_epoch_log_metrics()
-            elif key == 'epoch_pbar_metrics':
-                return self.get_epoch_pbar_metrics()
-            else:
-                return self[key]
+            return getattr(self, getter)() if getter else self[key]
         except KeyError:
             return None
 
@@ -177,6 +236,22 @@ class Result(Dict):
             # set the value
             self.__setitem__(name, value)
 
+    @staticmethod
+    def _sync_dict(
+        dictionary: dict,
+        enable_graph: bool,
+        sync_dist: bool,
+        sync_dist_group: Optional[Any],
+        sync_dist_op: Union[Any, str],
+    ) -> dict:
+        """Reduces all tensors of ``dictionary`` at once instead of with one collective per value."""
+        if not sync_dist:
+            return {}
+        names = [k for k, v in dictionary.items() if isinstance(v, torch.Tensor)]
+        values = [dictionary[k] if enable_graph else dictionary[k].detach() for k in names]
+        values = sync_ddp_bucketed_if_available(values, group=sync_dist_group, reduce_op=sync_dist_op)
+        return dict(zip(names, values))
+
     def __set_meta(
         self,
         name: str,
@@ -190,20 +265,10 @@ class Result(Dict):
         tbptt_reduce_fx: Callable,
     ):
         # set the meta for the item
-        meta_value = value
-        meta = dict(
-            prog_bar=prog_bar,
-            logger=logger,
-            on_step=on_step,
-            on_epoch=on_epoch,
-            reduce_fx=reduce_fx,
-            value=meta_value,
-            tbptt_reduce_fx=tbptt_reduce_fx,
-            tbptt_pad_token=tbptt_pad_token,
+        self['meta'][name] = LogOptions.intern(
+            prog_bar, logger, on_step, on_epoch, reduce_fx, tbptt_reduce_fx, tbptt_pad_token
         )
 
-        self['meta'][name] = meta
-
         # track whether any input requires reduction on epoch end
         _internal = self['meta']['_internal']
         _internal['_reduce_on_epoch'] = max(_internal['_reduce_on_epoch'], on_epoch)
@@ -299,9 +364,8 @@ class Result(Dict):
     def __copy__(self):
         newone = type(self)()
         for k, v in self.items():
-            if isinstance(v, torch.Tensor):
-                v = v.detach()
-            newone[k] = copy(v)
+            # detaching already creates a new tensor sharing the storage
+            newone[k] = v.detach() if isinstance(v, torch.Tensor) else copy(v)
         return newone
 
     @classmethod
@@ -340,10 +404,6 @@ class Result(Dict):
                     padding_key = meta[name]['tbptt_pad_token']
                 padded = torch.nn.utils.rnn.pad_sequence(value, batch_first=True, padding_value=padding_key)
                 result[name] = padded
-
-                # also update the result
-                if meta and not is_reserved:
-                    meta[name]['value'] = padded
         if meta:
             result['meta'] = meta
         return result
@@ -471,6 +531,214 @@ def collate_tensors(items: Union[List, Tuple]) -> Union[Tensor, List, Tuple]:
     return items
 
 
+class _GrowableTensor(object):
+    """Rows of tensors appended into preallocated storage, which doubles its capacity when full, so the
+    collected tensors stay contiguous without copying all of them at once."""
+
+    def __init__(self, value: Tensor, capacity: int = 16):
+        self.is_scalar = value.ndim == 0
+        self.device = value.device
+        rows = self._rows(value)
+        self.storage = torch.empty((max(capacity, len(rows)), *rows.shape[1:]), dtype=rows.dtype, device=self.device)
+        self.size = 0
+        self.lengths = []
+
+    def _rows(self, value: Tensor) -> Tensor:
+        return value.reshape(1) if self.is_scalar else value
+
+    def can_append(self, value: Tensor) -> bool:
+        if value.device != self.device or value.requires_grad:
+            return False
+        if self.is_scalar:
+            return value.ndim == 0
+        return value.ndim >= 1 and value.shape[1:] == self.storage.shape[1:]
+
+    def append(self, value: Tensor) -> None:
+        rows = self._rows(value)
+        dtype = torch.promote_types(self.storage.dtype, rows.dtype)
+        end = self.size + len(rows)
+        if end > len(self.storage) or dtype != self.storage.dtype:
+            storage = torch.empty((max(2 * len(self.storage), end), *self.storage.shape[1:]), dtype=dtype,
+                                  device=self.device)
+            storage[:self.size] = self.storage[:self.size]
+            self.storage = storage
+        self.storage[self.size:end] = rows
+        self.size = end
+        self.lengths.append(len(rows))
+
+    def view(self) -> Tensor:
+        return self.storage[:self.size]
+
+    def split(self) -> List[Tensor]:
+        if self.is_scalar:
+            return list(self.view().unbind())
+        return list(self.view().split(self.lengths))
+
+
+class _RunningReduction(object):
+    """Reduces the values of the steps of an epoch as they arrive, like ``reduce_fx`` of the stacked values."""
+
+    # the reduce functions which can be computed from running accumulators
+    REDUCE_FXS = (torch.mean, torch.sum, torch.max, torch.min)
+
+    def __init__(self, reduce_fx: Callable, weighted: bool = True):
+        self.reduce_fx = reduce_fx
+        self.weighted = weighted
+        self.value = None
+        self.weight = 0
+
+    def update(self, value: Tensor, batch_size: int) -> None:
+        value = value.detach()
+        if self.reduce_fx is torch.mean:
+            if self.weighted:
+                # the mean over the steps weighted by their batch sizes
+                if value.numel() != 1:
+                    raise ValueError('Only scalars can be averaged over the steps weighted by the batch size.')
+                value, weight = value.reshape(()).float() * batch_size, batch_size
+            else:
+                # the mean over all elements of all steps
+                value, weight = value.sum(), value.numel()
+            self.weight += weight
+        else:
+            value = self.reduce_fx(value)
+
+        if self.value is None:
+            self.value = value
+        elif self.reduce_fx in (torch.mean, torch.sum):
+            self.value = self.value + value
+        else:
+            self.value = self.reduce_fx(self.value, value)
+
+    def compute(self) -> Tensor:
+        if self.reduce_fx is torch.mean:
+            return self.value / float(self.weight)
+        return self.value
+
+
+class EpochResultBuffer(object):
+    """Collects the results of the steps of an epoch into a growable buffer per key, so that gathering and
+    reducing them at the end of the epoch works on contiguous tensors instead of stacking a list of results.
+
+    Gives the same results as :meth:`Result.gather` and :meth:`Result.reduce_on_epoch_end` of the appended results.
+    Values which cannot be buffered, like tensors of varying shapes or with graphs, are kept in a list.
+
+    With ``streaming=True``, only :meth:`reduce_on_epoch_end` is supported and the keys reduced at epoch end with
+    ``torch.mean`` (weighted by the batch size), ``torch.sum``, ``torch.max`` or ``torch.min``, as well as
+    ``checkpoint_on``, ``early_stop_on`` and ``minimize``, are reduced per step instead, so the memory does not
+    grow with the number of steps. Values which are not reduced at epoch end are dropped.
+
+    Example:
+        >>> buffer = EpochResultBuffer()
+        >>> for step in range(3):
+        ...     result = EvalResult()
+        ...     result.log('loss', torch.tensor(float(step)))
+        ...     result.track_batch_size(2 if step < 2 else 4)
+        ...     buffer.append(result)
+        >>> buffer.gather()['loss']
+        tensor([0., 1., 2.])
+        >>> buffer.reduce_on_epoch_end()['loss']
+        tensor(1.2500)
+    """
+
+    def __init__(self, streaming: bool = False):
+        self.streaming = streaming
+        self.result_cls = None
+        self.meta = None
+        self.values = {}
+        self.running = {}
+        self.dropped = set()
+        self.batch_sizes = []
+        self.num_steps = 0
+
+    def __len__(self):
+        return self.num_steps
+
+    def append(self, result: Result) -> None:
+        if self.result_cls is None:
+            self.result_cls = type(result)
+            self.meta = result['meta']
+        batch_sizes = result['meta']['_internal']['batch_sizes']
+
+        for k, v in result.items():
+            if k == 'meta' or k in self.dropped:
+                continue
+
+            if self.streaming:
+                running = self.running.get(k)
+                if running is None and k not in self.values:
+                    running = self._running_reduction(k, v)
+                    if running is None and not self._reduced_on_epoch_end(k):
+                        self.dropped.add(k)
+                        continue
+                if running is not None:
+                    self.running[k] = running
+                    running.update(v, batch_sizes[0] if batch_sizes else 1)
+                    continue
+
+            values = self.values.get(k)
+            if values is None:
+                is_buffered = isinstance(v, Tensor) and not v.requires_grad
+                values = self.values[k] = _GrowableTensor(v) if is_buffered else []
+            elif isinstance(values, _GrowableTensor) and not (isinstance(v, Tensor) and values.can_append(v)):
+                values = self.values[k] = values.split()
+
+            values.append(v)
+
+        if not self.streaming:
+            self.batch_sizes.extend(batch_sizes)
+        self.num_steps += 1
+
+    def _reduced_on_epoch_end(self, key: str) -> bool:
+        return key in {'checkpoint_on', 'early_stop_on', 'minimize'} or self.meta.get(key, {}).get('on_epoch', False)
+
+    def _running_reduction(self, key: str, value: Any) -> Optional[_RunningReduction]:
+        if not isinstance(value, Tensor):
+            return None
+        if key in {'checkpoint_on', 'early_stop_on', 'minimize'}:
+            return _RunningReduction(torch.mean, weighted=False)
+        option = self.meta.get(key)
+        if not option or not option['on_epoch'] or option['reduce_fx'] not in _RunningReduction.REDUCE_FXS:
+            return None
+        if option['reduce_fx'] is torch.mean and value.numel() != 1:
+            return None
+        return _RunningReduction(option['reduce_fx'])
+
+    def gather(self) -> Result:
+        """The values of all steps, like :meth:`Result.gather` of the appended results."""
+        if self.streaming:
+            raise RuntimeError('The values of the steps are not kept with `streaming=True`.')
+        return self._gather()
+
+    def _gather(self) -> Result:
+        result = self.result_cls()
+        for k, values in self.values.items():
+            result[k] = values.view() if isinstance(values, _GrowableTensor) else collate_tensors(values)
+        result['meta'] = self.meta
+        return result
+
+    def reduce_on_epoch_end(self) -> Result:
+        """The values reduced over all steps, like :meth:`Result.reduce_on_epoch_end` of the appended results."""
+        result = self._gather()
+        for k, running in self.running.items():
+            result[k] = running.compute()
+        batch_sizes = torch.tensor(self.batch_sizes)
+
+        for k, option in self.meta.items():
+            if k == '_internal' or k in self.running:
+                continue
+
+            if option['on_epoch']:
+                fx = option['reduce_fx']
+                if fx == torch.mean:
+                    reduced_val = weighted_mean(result[k], batch_sizes)
+                else:
+                    reduced_val = fx(result[k])
+
+                result[k] = reduced_val
+
+        return result
+
+
 class TrainResult(Result):
     def __init__(
         self,
@@ -611,17 +879,18 @@ class TrainResult(Result):
             sync_dist_op: the op to sync across
             sync_dist_group: the ddp group:
         """
+        synced = self._sync_dict(dictionary, enable_graph, sync_dist, sync_dist_group, sync_dist_op)
         for k, v in dictionary.items():
             self.log(
                 name=k,
-                value=v,
+                value=synced.get(k, v),
                 prog_bar=prog_bar,
                 logger=logger,
                 on_step=on_step,
                 on_epoch=on_epoch,
                 reduce_fx=reduce_fx,
                 enable_graph=enable_graph,
-                sync_dist=sync_dist,
+                sync_dist=sync_dist and k not in synced,
                 sync_dist_group=sync_dist_group,
                 sync_dist_op=sync_dist_op,
                 tbptt_pad_token=tbptt_pad_token,
@@ -765,17 +1034,18 @@ class EvalResult(Result):
             sync_dist_op: the op to sync across
             sync_dist_group: the ddp group
         """
+        synced = self._sync_dict(dictionary, enable_graph, sync_dist, sync_dist_group, sync_dist_op)
         for k, v in dictionary.items():
             self.log(
                 name=k,
-                value=v,
+                value=synced.get(k, v),
                 prog_bar=prog_bar,
                 logger=logger,
                 on_step=on_step,
                 on_epoch=on_epoch,
                 reduce_fx=reduce_fx,
                 enable_graph=enable_graph,
-                sync_dist=sync_dist,
+                sync_dist=sync_dist and k not in synced,
                 sync_dist_group=sync_dist_group,
                 sync_dist_op=sync_dist_op,
                 tbptt_pad_token=tbptt_pad_token,
@@ -798,6 +1068,17 @@ class EvalResult(Result):
             result.write('ids', [0, 1, 2])
             result.write('preds', ['cat', 'dog', 'dog'])
 
+        If ``filename`` ends with a slash, the predictions are instead streamed to that directory as the
+        batches arrive, with a file per column and rank and a manifest per rank, so they never have to fit into
+        memory. They can be read with
+        :func:`~pytorch_lightning.trainer.supporters.read_columnar_predictions`. With several processes, rank 0
+        merges the shards of the ranks into the shard ``'merged'`` in dataset order after testing, without the
+        samples repeated by the ``DistributedSampler``.
+
+        Example::
+
+            result.write('preds', logits.argmax(dim=1), 'predictions/')
+
         Args:
             name: Feature name that will turn into column header of predictions file
             values: Flat tensor or list of row values for given feature column 'name'.
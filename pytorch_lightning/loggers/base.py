@@ -15,6 +15,7 @@
 import argparse
 import functools
 import operator
+import time
 from abc import ABC, abstractmethod
 from argparse import Namespace
 from functools import wraps
@@ -43,8 +44,18 @@ class LightningLoggerBase(ABC):
     Note:
         The `agg_key_funcs` and `agg_default_func` arguments are used only when
         one logs metrics with the :meth:`~LightningLoggerBase.agg_and_log_metrics` method.
+
+    Note:
+        The Trainer doesn't call :meth:`save` after every logging call but :meth:`flush`,
+        which only saves when due according to the policy set with :meth:`update_flush_policy`.
     """
 
+    # flush policy, see `update_flush_policy`
+    _flush_every_n_steps: Optional[int] = None
+    _flush_every_n_seconds: Optional[float] = None
+    _steps_since_flush: int = 0
+    _last_flush_time: Optional[float] = None
+
     def __init__(
             self,
             agg_key_funcs: Optional[Mapping[str, Callable[[Sequence[float]], float]]] = None,
@@ -77,6 +88,44 @@ class LightningLoggerBase(ABC):
         if agg_default_func:
             self._agg_default_func = agg_default_func
 
+    def update_flush_policy(self, every_n_steps: Optional[int] = None, every_n_seconds: Optional[float] = None):
+        """
+        Update when :meth:`flush` saves the log data.
+        If neither condition is set, every call to :meth:`flush` saves.
+
+        Args:
+            every_n_steps:
+                Save after this many calls to :meth:`flush` since the last save.
+            every_n_seconds:
+                Save when at least this many seconds passed since the last save.
+        """
+        if every_n_steps:
+            self._flush_every_n_steps = every_n_steps
+        if every_n_seconds:
+            self._flush_every_n_seconds = every_n_seconds
+
+    def flush(self, force: bool = False) -> None:
+        """
+        Called once per training step. Saves the log data if it is due according to the flush policy.
+
+        Args:
+            force: Save regardless of the flush policy, e.g. at the end of an epoch.
+        """
+        self._steps_since_flush += 1
+        now = time.monotonic()
+        if self._last_flush_time is None:
+            self._last_flush_time = now
+
+        no_policy = self._flush_every_n_steps is None and self._flush_every_n_seconds is None
+        steps_due = self._flush_every_n_steps is not None and self._steps_since_flush >= self._flush_every_n_steps
+        time_due = self._flush_every_n_seconds is not None \
+            and now - self._last_flush_time >= self._flush_every_n_seconds
+
+        if force or no_policy or steps_due or time_due:
+            self.save()
+            self._steps_since_flush = 0
+            self._last_flush_time = time.monotonic()
+
     @property
     @abstractmethod
     def experiment(self) -> Any:
@@ -305,6 +354,14 @@ class LoggerCollection(LightningLoggerBase):
         for logger in self._logger_iterable:
             logger.update_agg_funcs(agg_key_funcs, agg_default_func)
 
+    def update_flush_policy(self, every_n_steps: Optional[int] = None, every_n_seconds: Optional[float] = None):
+        for logger in self._logger_iterable:
+            logger.update_flush_policy(every_n_steps, every_n_seconds)
+
+    def flush(self, force: bool = False) -> None:
+        for logger in self._logger_iterable:
+            logger.flush(force)
+
     @property
     def experiment(self) -> List[Any]:
         return [logger.experiment for logger in self._logger_iterable]
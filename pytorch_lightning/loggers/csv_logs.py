@@ -23,7 +23,7 @@ import csv
 import io
 import os
 from argparse import Namespace
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, List, Union
 
 import torch
 
@@ -40,6 +40,10 @@ class ExperimentWriter(object):
     Currently supports to log hyperparameters and metrics in YAML and CSV
     format, respectively.
 
+    Metrics are buffered in memory until :meth:`save` appends them to the CSV file,
+    which is kept open between saves. The file is only rewritten when a metric
+    that was not logged before appears, to extend the header with the new column.
+
     Args:
         log_dir: Directory for the experiment logs
     """
@@ -49,7 +53,13 @@ class ExperimentWriter(object):
 
     def __init__(self, log_dir: str) -> None:
         self.hparams = {}
+        # rows which have not been written to the CSV file yet
         self.metrics = []
+        # columns of the CSV file
+        self.metrics_keys = []
+        self._num_rows = 0
+        self._file = None
+        self._writer = None
 
         self.log_dir = log_dir
         if os.path.exists(self.log_dir):
@@ -73,29 +83,66 @@ class ExperimentWriter(object):
             return value
 
         if step is None:
-            step = len(self.metrics)
+            step = self._num_rows
 
         metrics = {k: _handle_value(v) for k, v in metrics_dict.items()}
         metrics['step'] = step
         self.metrics.append(metrics)
+        self._num_rows += 1
 
     def save(self) -> None:
-        """Save recorded hparams and metrics into files"""
+        """Save recorded hparams and append the recorded metrics to the CSV file"""
         hparams_file = os.path.join(self.log_dir, self.NAME_HPARAMS_FILE)
         save_hparams_to_yaml(hparams_file, self.hparams)
 
         if not self.metrics:
             return
 
-        last_m = {}
+        new_keys = []
         for m in self.metrics:
-            last_m.update(m)
-        metrics_keys = list(last_m.keys())
+            new_keys.extend(k for k in m if k not in self.metrics_keys and k not in new_keys)
+
+        if new_keys:
+            self._rewrite_header(self.metrics_keys + new_keys)
+        elif self._file is None:
+            self._open('a')
+
+        self._writer.writerows(self.metrics)
+        self._file.flush()
+        self.metrics = []
+
+    def close(self) -> None:
+        """Write pending metrics and close the CSV file"""
+        self.save()
+        if self._file is not None:
+            self._file.close()
+            self._file, self._writer = None, None
+
+    def _open(self, mode: str) -> None:
+        self._file = io.open(self.metrics_file_path, mode, newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=self.metrics_keys)
+
+    def _rewrite_header(self, metrics_keys: List[str]) -> None:
+        """Copy the rows written so far into a file with the extended header"""
+        if self._file is not None:
+            self._file.close()
+
+        if not self.metrics_keys:
+            # first save: previous log files are overwritten
+            self.metrics_keys = metrics_keys
+            self._open('w')
+            self._writer.writeheader()
+            return
+
+        tmp_path = self.metrics_file_path + '.tmp'
+        with io.open(self.metrics_file_path, 'r', newline='') as src, io.open(tmp_path, 'w', newline='') as dst:
+            writer = csv.DictWriter(dst, fieldnames=metrics_keys)
+            writer.writeheader()
+            writer.writerows(csv.DictReader(src))
+        os.replace(tmp_path, self.metrics_file_path)
 
-        with io.open(self.metrics_file_path, 'w', newline='') as f:
-            self.writer = csv.DictWriter(f, fieldnames=metrics_keys)
-            self.writer.writeheader()
-            self.writer.writerows(self.metrics)
+        self.metrics_keys = metrics_keys
+        self._open('a')
 
 
 class CSVLogger(LightningLoggerBase):
@@ -189,7 +236,8 @@ class CSVLogger(LightningLoggerBase):
 
     @rank_zero_only
     def finalize(self, status: str) -> None:
-        self.save()
+        super().save()
+        self.experiment.close()
 
     @property
     def name(self) -> str:
@@ -7,6 +7,8 @@ from pytorch_lightning.metrics.classification import (
     Recall,
     ROC,
     AUROC,
+    BinnedAUROC,
+    BinnedAveragePrecision,
     DiceCoefficient,
     MulticlassPrecisionRecallCurve,
     MulticlassROC,
@@ -15,7 +17,7 @@ from pytorch_lightning.metrics.classification import (
     IoU,
 )
 from pytorch_lightning.metrics.converters import numpy_metric, tensor_metric
-from pytorch_lightning.metrics.metric import Metric, TensorMetric, NumpyMetric
+from pytorch_lightning.metrics.metric import Metric, MetricCollection, TensorMetric, NumpyMetric, StatefulMetric
 from pytorch_lightning.metrics.nlp import BLEUScore
 from pytorch_lightning.metrics.regression import (
     MAE,
@@ -35,6 +37,8 @@ __classification_metrics = [
     "AUROC",
     "Accuracy",
     "AveragePrecision",
+    "BinnedAUROC",
+    "BinnedAveragePrecision",
     "ConfusionMatrix",
     "DiceCoefficient",
     "F1",
@@ -17,25 +17,94 @@ from typing import Any, Optional, Sequence, Tuple
 import torch
 
 from pytorch_lightning.metrics.functional.classification import (
-    accuracy,
     auroc,
     average_precision,
-    confusion_matrix,
+    binned_auroc_from_counts,
+    binned_average_precision_from_counts,
+    binned_clf_counts,
     dice_score,
-    f1_score,
-    fbeta_score,
+    get_num_classes,
     iou,
     multiclass_precision_recall_curve,
     multiclass_roc,
-    precision,
     precision_recall_curve,
-    recall,
-    roc
+    roc,
+    stat_scores_multiple_classes
 )
-from pytorch_lightning.metrics.metric import TensorCollectionMetric, TensorMetric
+from pytorch_lightning.metrics.functional.reduction import reduce
+from pytorch_lightning.metrics.metric import StatefulMetric, TensorCollectionMetric, TensorMetric
+from pytorch_lightning.utilities import rank_zero_warn
 
 
-class Accuracy(TensorMetric):
+def _warn_unused_reduce_op(reduce_op: Any):
+    if reduce_op is not None:
+        rank_zero_warn('`reduce_op` has no effect on stateful metrics since their states define their own reduction.'
+                       ' The argument is deprecated since v0.9.1 and will be removed in v0.11.0', DeprecationWarning)
+
+
+class _StatScoresMetric(StatefulMetric):
+    """
+    Base class for classification metrics computed from the true positives, false positives
+    and false negatives of each class accumulated over all batches.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            num_classes: Optional[int] = None,
+            reduction: str = 'elementwise_mean',
+            reduce_group: Any = None,
+            reduce_op: Any = None,
+    ):
+        super().__init__(name=name, reduce_group=reduce_group)
+        _warn_unused_reduce_op(reduce_op)
+        self.num_classes = num_classes
+        self.reduction = reduction
+
+        # without the number of classes, the states grow with the largest label seen
+        default = torch.zeros(num_classes or 0, dtype=torch.long)
+        for state in ('tps', 'fps', 'fns'):
+            self.add_state(state, default)
+
+    def update(self, pred: torch.Tensor, target: torch.Tensor):
+        """
+        Accumulates the statistics of a batch
+
+        Args:
+            pred: predicted labels
+            target: ground truth labels
+        """
+        tps, fps, _, fns, _ = stat_scores_multiple_classes(pred=pred, target=target, num_classes=self.num_classes)
+        self._update_state('tps', tps)
+        self._update_state('fps', fps)
+        self._update_state('fns', fns)
+
+    def _precision_recall(self) -> Tuple[torch.Tensor, torch.Tensor]:
+        tps = self.tps.to(torch.float)
+        fps = self.fps.to(torch.float)
+        fns = self.fns.to(torch.float)
+
+        precision = tps / (tps + fps)
+        recall = tps / (tps + fns)
+
+        precision[precision != precision] = 0
+        recall[recall != recall] = 0
+        return precision, recall
+
+    def _fbeta(self, beta: float) -> torch.Tensor:
+        prec, rec = self._precision_recall()
+
+        nom = (1 + beta ** 2) * prec * rec
+        denom = ((beta ** 2) * prec + rec)
+        fbeta = nom / denom
+
+        # drop NaN after zero division
+        fbeta[fbeta != fbeta] = 0
+
+        return reduce(fbeta, reduction=self.reduction)
+
+
+class Accuracy(_StatScoresMetric):
     """
     Computes the accuracy classification score
 
@@ -46,6 +115,10 @@ class Accuracy(TensorMetric):
         >>> metric = Accuracy()
         >>> metric(pred, target)
         tensor(0.7500)
+        >>> metric(torch.tensor([1, 1]), torch.tensor([1, 2]))
+        tensor(0.5000)
+        >>> metric.compute()
+        tensor(0.6667)
 
     """
 
@@ -65,30 +138,45 @@ class Accuracy(TensorMetric):
                 - none: pass array
                 - sum: add elements
             reduce_group: the process group to reduce metric results from DDP
-            reduce_op: the operation to perform for ddp reduction
+            reduce_op: deprecated, has no effect
         """
         super().__init__(name='accuracy',
+                         num_classes=num_classes,
+                         reduction=reduction,
                          reduce_group=reduce_group,
                          reduce_op=reduce_op)
-        self.num_classes = num_classes
-        self.reduction = reduction
 
-    def forward(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+    def update(self, pred: torch.Tensor, target: torch.Tensor):
         """
-        Actual metric computation
+        Accumulates the statistics of a batch
 
         Args:
             pred: predicted labels
             target: ground truth labels
+        """
+        if not (target > 0).any() and self.num_classes is None:
+            raise RuntimeError("cannot infer num_classes when target is all zero")
+        super().update(pred, target)
+
+    def compute_from_states(self) -> torch.Tensor:
+        """
+        Actual metric computation
 
         Return:
             A Tensor with the classification score.
         """
-        return accuracy(pred=pred, target=target,
-                        num_classes=self.num_classes, reduction=self.reduction)
+        possible_reductions = ('none', 'sum', 'elementwise_mean')
+        if self.reduction not in possible_reductions:
+            raise ValueError("reduction type %s not supported" % self.reduction)
 
+        tps = self.tps.to(torch.float)
+        sups = (self.tps + self.fns).to(torch.float)
+        if self.reduction == 'none':
+            return tps / sups
+        return tps.sum() / sups.sum()
 
-class ConfusionMatrix(TensorMetric):
+
+class ConfusionMatrix(StatefulMetric):
     """
     Computes the confusion matrix C where each entry C_{i,j} is the number of observations
     in group i that were predicted in group j.
@@ -115,26 +203,39 @@ class ConfusionMatrix(TensorMetric):
         Args:
             normalize: whether to compute a normalized confusion matrix
             reduce_group: the process group to reduce metric results from DDP
-            reduce_op: the operation to perform for ddp reduction
+            reduce_op: deprecated, has no effect
         """
         super().__init__(name='confusion_matrix',
-                         reduce_group=reduce_group,
-                         reduce_op=reduce_op)
+                         reduce_group=reduce_group)
+        _warn_unused_reduce_op(reduce_op)
         self.normalize = normalize
+        # the number of classes is inferred, so the matrix grows with the largest label seen
+        self.add_state('confmat', torch.zeros(0, 0, dtype=torch.long))
 
-    def forward(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+    def update(self, pred: torch.Tensor, target: torch.Tensor):
         """
-        Actual metric computation
+        Accumulates the confusion matrix of a batch
 
         Args:
             pred: predicted labels
             target: ground truth labels
+        """
+        num_classes = get_num_classes(pred, target, None)
+        unique_labels = (target.view(-1) * num_classes + pred.view(-1)).to(torch.long)
+        bins = torch.bincount(unique_labels, minlength=num_classes ** 2)
+        self._update_state('confmat', bins.reshape(num_classes, num_classes))
+
+    def compute_from_states(self) -> torch.Tensor:
+        """
+        Actual metric computation
 
         Return:
             A Tensor with the confusion matrix.
         """
-        return confusion_matrix(pred=pred, target=target,
-                                normalize=self.normalize)
+        cm = self.confmat.squeeze().float()
+        if self.normalize:
+            cm = cm / cm.sum(-1)
+        return cm
 
 
 class PrecisionRecallCurve(TensorCollectionMetric):
@@ -198,7 +299,7 @@ class PrecisionRecallCurve(TensorCollectionMetric):
                                       pos_label=self.pos_label)
 
 
-class Precision(TensorMetric):
+class Precision(_StatScoresMetric):
     """
     Computes the precision score
 
@@ -228,31 +329,25 @@ class Precision(TensorMetric):
                 - none: pass array
                 - sum: add elements
             reduce_group: the process group to reduce metric results from DDP
-            reduce_op: the operation to perform for ddp reduction
+            reduce_op: deprecated, has no effect
         """
         super().__init__(name='precision',
+                         num_classes=num_classes,
+                         reduction=reduction,
                          reduce_group=reduce_group,
                          reduce_op=reduce_op)
-        self.num_classes = num_classes
-        self.reduction = reduction
 
-    def forward(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+    def compute_from_states(self) -> torch.Tensor:
         """
         Actual metric computation
 
-        Args:
-            pred: predicted labels
-            target: ground truth labels
-
         Return:
             A Tensor with the classification score.
         """
-        return precision(pred=pred, target=target,
-                         num_classes=self.num_classes,
-                         reduction=self.reduction)
+        return reduce(self._precision_recall()[0], reduction=self.reduction)
 
 
-class Recall(TensorMetric):
+class Recall(_StatScoresMetric):
     """
     Computes the recall score
 
@@ -282,30 +377,22 @@ class Recall(TensorMetric):
                 - none: pass array
                 - sum: add elements
             reduce_group: the process group to reduce metric results from DDP
-            reduce_op: the operation to perform for ddp reduction
+            reduce_op: deprecated, has no effect
         """
         super().__init__(name='recall',
+                         num_classes=num_classes,
+                         reduction=reduction,
                          reduce_group=reduce_group,
                          reduce_op=reduce_op)
 
-        self.num_classes = num_classes
-        self.reduction = reduction
-
-    def forward(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+    def compute_from_states(self) -> torch.Tensor:
         """
         Actual metric computation
 
-        Args:
-            pred: predicted labels
-            target: ground truth labels
-
         Return:
             A Tensor with the classification score.
         """
-        return recall(pred=pred,
-                      target=target,
-                      num_classes=self.num_classes,
-                      reduction=self.reduction)
+        return reduce(self._precision_recall()[1], reduction=self.reduction)
 
 
 class AveragePrecision(TensorMetric):
@@ -416,7 +503,132 @@ class AUROC(TensorMetric):
                      pos_label=self.pos_label)
 
 
-class FBeta(TensorMetric):
+class _BinnedCurveMetric(StatefulMetric):
+    """
+    Base class for metrics approximating a curve with the false and true positives counted at
+    a fixed number of thresholds, accumulated over all batches in constant memory.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            num_bins: int = 100,
+            pos_label: int = 1,
+            reduce_group: Any = None,
+    ):
+        super().__init__(name=name, reduce_group=reduce_group)
+        self.num_bins = num_bins
+        self.pos_label = pos_label
+        self.add_state('fps', torch.zeros(num_bins, dtype=torch.float64))
+        self.add_state('tps', torch.zeros(num_bins, dtype=torch.float64))
+
+    def update(
+            self,
+            pred: torch.Tensor,
+            target: torch.Tensor,
+            sample_weight: Optional[Sequence] = None
+    ):
+        """
+        Accumulates the counts of a batch
+
+        Args:
+            pred: estimated probabilities
+            target: groundtruth labels
+            sample_weight: the weights per sample
+        """
+        fps, tps = binned_clf_counts(pred=pred, target=target, num_bins=self.num_bins,
+                                     sample_weight=sample_weight, pos_label=self.pos_label)
+        self._update_state('fps', fps)
+        self._update_state('tps', tps)
+
+
+class BinnedAUROC(_BinnedCurveMetric):
+    """
+    Approximates the area under curve (AUC) of the receiver operator characteristic (ROC)
+    with a fixed number of thresholds evenly spaced in [0, 1]. Unlike :class:`AUROC`, the memory
+    does not grow with the number of predictions and processes sync a single sum of counts.
+
+    Example:
+
+        >>> pred = torch.tensor([0.1, 0.4, 0.35, 0.8])
+        >>> target = torch.tensor([0, 0, 1, 1])
+        >>> metric = BinnedAUROC(num_bins=1000)
+        >>> metric(pred, target)
+        tensor(0.7500)
+
+    """
+
+    def __init__(
+            self,
+            num_bins: int = 100,
+            pos_label: int = 1,
+            reduce_group: Any = None,
+    ):
+        """
+        Args:
+            num_bins: number of thresholds, the approximation improves with more bins
+            pos_label: positive label indicator
+            reduce_group: the process group to reduce metric results from DDP
+        """
+        super().__init__(name='binned_auroc',
+                         num_bins=num_bins,
+                         pos_label=pos_label,
+                         reduce_group=reduce_group)
+
+    def compute_from_states(self) -> torch.Tensor:
+        """
+        Actual metric computation
+
+        Return:
+            torch.Tensor: classification score
+        """
+        return binned_auroc_from_counts(self.fps, self.tps)
+
+
+class BinnedAveragePrecision(_BinnedCurveMetric):
+    """
+    Approximates the average precision score with a fixed number of thresholds evenly spaced in [0, 1].
+    Unlike :class:`AveragePrecision`, the memory does not grow with the number of predictions and processes
+    sync a single sum of counts.
+
+    Example:
+
+        >>> pred = torch.tensor([0.1, 0.4, 0.35, 0.8])
+        >>> target = torch.tensor([0, 0, 1, 1])
+        >>> metric = BinnedAveragePrecision(num_bins=1000)
+        >>> metric(pred, target)
+        tensor(0.8333)
+
+    """
+
+    def __init__(
+            self,
+            num_bins: int = 100,
+            pos_label: int = 1,
+            reduce_group: Any = None,
+    ):
+        """
+        Args:
+            num_bins: number of thresholds, the approximation improves with more bins
+            pos_label: positive label indicator
+            reduce_group: the process group to reduce metric results from DDP
+        """
+        super().__init__(name='binned_AP',
+                         num_bins=num_bins,
+                         pos_label=pos_label,
+                         reduce_group=reduce_group)
+
+    def compute_from_states(self) -> torch.Tensor:
+        """
+        Actual metric computation
+
+        Return:
+            torch.Tensor: classification score
+        """
+        return binned_average_precision_from_counts(self.fps, self.tps)
+
+
+class FBeta(_StatScoresMetric):
     """
     Computes the FBeta Score, which is the weighted harmonic mean of precision and recall.
         It ranges between 1 and 0, where 1 is perfect and the worst value is 0.
@@ -448,33 +660,27 @@ class FBeta(TensorMetric):
                 - none: pass array
                 - sum: add elements
             reduce_group: the process group to reduce metric results from DDP
-            reduce_op: the operation to perform for DDP reduction
+            reduce_op: deprecated, has no effect
         """
         super().__init__(name='fbeta',
+                         num_classes=num_classes,
+                         reduction=reduction,
                          reduce_group=reduce_group,
                          reduce_op=reduce_op)
 
         self.beta = beta
-        self.num_classes = num_classes
-        self.reduction = reduction
 
-    def forward(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+    def compute_from_states(self) -> torch.Tensor:
         """
         Actual metric computation
 
-        Args:
-            pred: predicted labels
-            target: groundtruth labels
-
         Return:
             torch.Tensor: classification score
         """
-        return fbeta_score(pred=pred, target=target,
-                           beta=self.beta, num_classes=self.num_classes,
-                           reduction=self.reduction)
+        return self._fbeta(self.beta)
 
 
-class F1(TensorMetric):
+class F1(_StatScoresMetric):
     """
     Computes the F1 score, which is the harmonic mean of the precision and recall.
     It ranges between 1 and 0, where 1 is perfect and the worst value is 0.
@@ -504,29 +710,22 @@ class F1(TensorMetric):
                 - none: pass array
                 - sum: add elements
             reduce_group: the process group to reduce metric results from DDP
-            reduce_op: the operation to perform for ddp reduction
+            reduce_op: deprecated, has no effect
         """
         super().__init__(name='f1',
+                         num_classes=num_classes,
+                         reduction=reduction,
                          reduce_group=reduce_group,
                          reduce_op=reduce_op)
 
-        self.num_classes = num_classes
-        self.reduction = reduction
-
-    def forward(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+    def compute_from_states(self) -> torch.Tensor:
         """
         Actual metric computation
 
-        Args:
-            pred: predicted labels
-            target: groundtruth labels
-
         Return:
             torch.Tensor: classification score
         """
-        return f1_score(pred=pred, target=target,
-                        num_classes=self.num_classes,
-                        reduction=self.reduction)
+        return self._fbeta(1.)
 
 
 class ROC(TensorCollectionMetric):
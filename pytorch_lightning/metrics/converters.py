@@ -19,7 +19,8 @@ sync tensors between different processes in a DDP scenario, when needed.
 """
 
 import numbers
-from typing import Any, Callable, Optional, Union
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Sequence, Union
 
 import numpy as np
 import torch
@@ -258,16 +259,10 @@ def sync_ddp_if_available(result: Union[torch.Tensor],
     """
 
     if torch.distributed.is_available() and torch.distributed.is_initialized():
-        divide_by_world_size = False
-
         if group is None:
             group = torch.distributed.group.WORLD
 
-        if reduce_op is None:
-            reduce_op = torch.distributed.ReduceOp.SUM
-        elif isinstance(reduce_op, str) and reduce_op in ('avg', 'mean'):
-            reduce_op = torch.distributed.ReduceOp.SUM
-            divide_by_world_size = True
+        reduce_op, divide_by_world_size = _parse_reduce_op(reduce_op)
 
         # sync all processes before reduction
         torch.distributed.barrier(group=group)
@@ -280,6 +275,91 @@ def sync_ddp_if_available(result: Union[torch.Tensor],
     return result
 
 
+def _parse_reduce_op(reduce_op: Optional[Union[ReduceOp, str]]):
+    """Returns the torch reduction op and whether the result has to be divided by the world size."""
+    if reduce_op is None:
+        return torch.distributed.ReduceOp.SUM, False
+    if isinstance(reduce_op, str) and reduce_op in ('avg', 'mean'):
+        return torch.distributed.ReduceOp.SUM, True
+    return reduce_op, False
+
+
+def sync_ddp_bucketed_if_available(tensors: Sequence[torch.Tensor],
+                                   group: Optional[Any] = None,
+                                   reduce_op: Optional[Union[ReduceOp, str]] = None
+                                   ) -> List[torch.Tensor]:
+    """
+    Function to reduce several tensors across ddp processes with a single collective per device and dtype.
+    All tensors of the same device and dtype are flattened into one contiguous buffer, which is reduced
+    at once and split back into tensors of the original shapes.
+
+    Args:
+        tensors: the tensors to sync and reduce
+        group: the process group to gather results from. Defaults to all processes (world)
+        reduce_op: the reduction operation. Defaults to sum.
+            Can also be a string of 'avg', 'mean' to calculate the mean during reduction.
+
+    Return:
+        reduced tensors in the order of ``tensors``
+    """
+    tensors = list(tensors)
+    if not (torch.distributed.is_available() and torch.distributed.is_initialized()):
+        return tensors
+
+    if group is None:
+        group = torch.distributed.group.WORLD
+
+    reduce_op, divide_by_world_size = _parse_reduce_op(reduce_op)
+
+    buckets = OrderedDict()
+    for idx, tensor in enumerate(tensors):
+        buckets.setdefault((tensor.device, tensor.dtype), []).append(idx)
+
+    # sync all processes before reduction, once for all tensors like `sync_ddp_if_available` does per tensor
+    if buckets:
+        torch.distributed.barrier(group=group)
+
+    results = list(tensors)
+    for indices in buckets.values():
+        buffer = torch.cat([tensors[idx].reshape(-1) for idx in indices])
+        torch.distributed.all_reduce(buffer, op=reduce_op, group=group, async_op=False)
+
+        if divide_by_world_size:
+            buffer = buffer / torch.distributed.get_world_size(group)
+
+        for idx, reduced in zip(indices, buffer.split([tensors[idx].numel() for idx in indices])):
+            results[idx] = reduced.view(tensors[idx].shape)
+
+    return results
+
+
+def sync_ddp_collection_if_available(collection: Any,
+                                     group: Optional[Any] = None,
+                                     reduce_op: Optional[Union[ReduceOp, str]] = None
+                                     ) -> Any:
+    """
+    Function to reduce all tensors of a collection across ddp processes.
+    Uses :func:`sync_ddp_bucketed_if_available`, so there is one collective per device and dtype
+    instead of one per tensor.
+
+    Args:
+        collection: the collection of tensors to sync and reduce
+        group: the process group to gather results from. Defaults to all processes (world)
+        reduce_op: the reduction operation. Defaults to sum.
+            Can also be a string of 'avg', 'mean' to calculate the mean during reduction.
+
+    Return:
+        the collection with reduced tensors
+    """
+    if not (torch.distributed.is_available() and torch.distributed.is_initialized()):
+        return collection
+
+    tensors = []
+    apply_to_collection(collection, torch.Tensor, tensors.append)
+    reduced = iter(sync_ddp_bucketed_if_available(tensors, group=group, reduce_op=reduce_op))
+    return apply_to_collection(collection, torch.Tensor, lambda _: next(reduced))
+
+
 def gather_all_tensors_if_available(result: Union[torch.Tensor],
                                     group: Optional[Any] = None):
     """
@@ -327,8 +407,7 @@ def sync_ddp(group: Optional[Any] = None,
     """
 
     def decorator_fn(func_to_decorate):
-        return _apply_to_outputs(apply_to_collection, torch.Tensor,
-                                 sync_ddp_if_available, group=group,
+        return _apply_to_outputs(sync_ddp_collection_if_available, group=group,
                                  reduce_op=reduce_op)(func_to_decorate)
 
     return decorator_fn
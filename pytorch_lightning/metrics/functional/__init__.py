@@ -3,10 +3,13 @@ from pytorch_lightning.metrics.functional.classification import (
     auc,
     auroc,
     average_precision,
+    binned_auroc,
+    binned_average_precision,
     confusion_matrix,
     dice_score,
     f1_score,
     fbeta_score,
+    multiclass_auroc,
     multiclass_precision_recall_curve,
     multiclass_roc,
     precision,
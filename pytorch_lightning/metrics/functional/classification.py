@@ -563,6 +563,80 @@ def _binary_clf_curve(
     return fps, tps, pred[threshold_idxs]
 
 
+def _multiclass_clf_curve(
+        pred: torch.Tensor,
+        target: torch.Tensor,
+        num_classes: int,
+        sample_weight: Optional[Sequence] = None,
+) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+    """
+    Computes the one-vs-rest counts of all classes at once with a single sort of all class columns.
+
+    Return:
+        fps, tps, thresholds: tables of shape [num_samples, num_classes] with the counts when thresholding
+            each class at each of its sorted scores
+        distinct: boolean table marking the last position of every group of tied scores, i.e. the positions
+            :func:`_binary_clf_curve` returns for each class
+    """
+    if sample_weight is not None and not isinstance(sample_weight, torch.Tensor):
+        sample_weight = torch.tensor(sample_weight, device=pred.device, dtype=torch.float)
+
+    thresholds, desc_score_indices = torch.sort(pred[:, :num_classes], dim=0, descending=True)
+
+    classes = torch.arange(num_classes, device=pred.device)
+    target = (target[desc_score_indices] == classes).to(torch.long)
+
+    if sample_weight is not None:
+        weight = sample_weight[desc_score_indices]
+    else:
+        weight = 1.
+
+    # a group of tied scores ends where the next score differs, the last row ends every curve
+    distinct = torch.cat([thresholds[1:] != thresholds[:-1],
+                          torch.ones(1, num_classes, dtype=torch.bool, device=pred.device)])
+
+    tps = torch.cumsum(target * weight, dim=0)
+
+    if sample_weight is not None:
+        # express fps as a cumsum to ensure fps is increasing even in
+        # the presence of floating point errors
+        fps = torch.cumsum((1 - target) * weight, dim=0)
+    else:
+        fps = torch.arange(1, target.size(0) + 1, device=pred.device).unsqueeze(1) - tps
+
+    return fps, tps, thresholds, distinct
+
+
+def _split_classes(table: torch.Tensor, mask: torch.Tensor, counts: Sequence[int]) -> Tuple[torch.Tensor, ...]:
+    """Selects the masked entries of each class column of ``table``."""
+    return table.t()[mask.t()].split(counts)
+
+
+def _multiclass_roc_tables(
+        pred: torch.Tensor,
+        target: torch.Tensor,
+        num_classes: int,
+        sample_weight: Optional[Sequence] = None,
+) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+    fps, tps, thresholds, distinct = _multiclass_clf_curve(pred=pred, target=target, num_classes=num_classes,
+                                                           sample_weight=sample_weight)
+
+    # Add an extra threshold position
+    # to make sure that the curves start at (0, 0)
+    tps = torch.cat([torch.zeros_like(tps[:1]), tps])
+    fps = torch.cat([torch.zeros_like(fps[:1]), fps])
+    thresholds = torch.cat([thresholds[:1] + 1, thresholds])
+    distinct = torch.cat([torch.ones_like(distinct[:1]), distinct])
+
+    if (fps[-1] <= 0).any():
+        raise ValueError("No negative samples in targets, false positive value should be meaningless")
+
+    if (tps[-1] <= 0).any():
+        raise ValueError("No positive samples in targets, true positive value should be meaningless")
+
+    return fps / fps[-1], tps / tps[-1], thresholds, distinct
+
+
 def roc(
         pred: torch.Tensor,
         target: torch.Tensor,
@@ -651,14 +725,56 @@ def multiclass_roc(
     """
     num_classes = get_num_classes(pred, target, num_classes)
 
-    class_roc_vals = []
-    for c in range(num_classes):
-        pred_c = pred[:, c]
+    fpr, tpr, thresholds, distinct = _multiclass_roc_tables(pred=pred, target=target, num_classes=num_classes,
+                                                            sample_weight=sample_weight)
 
-        class_roc_vals.append(roc(pred=pred_c, target=target,
-                                  sample_weight=sample_weight, pos_label=c))
+    counts = distinct.sum(0).tolist()
+    return tuple(zip(*(_split_classes(table, distinct, counts) for table in (fpr, tpr, thresholds))))
 
-    return tuple(class_roc_vals)
+
+def multiclass_auroc(
+        pred: torch.Tensor,
+        target: torch.Tensor,
+        sample_weight: Optional[Sequence] = None,
+        num_classes: Optional[int] = None,
+) -> torch.Tensor:
+    """
+    Computes the one-vs-rest Area Under the Receiver Operating Characteristic Curve (ROC AUC)
+    of every class at once.
+
+    Args:
+        pred: estimated probabilities
+        target: ground-truth labels
+        sample_weight: sample weights
+        num_classes: number of classes (default: None, computes automatically from data)
+
+    Return:
+        Tensor containing the ROCAUC score of each class
+
+    Example:
+
+        >>> pred = torch.tensor([[0.85, 0.05, 0.05, 0.05],
+        ...                      [0.05, 0.85, 0.05, 0.05],
+        ...                      [0.05, 0.05, 0.85, 0.05],
+        ...                      [0.05, 0.05, 0.05, 0.85]])
+        >>> target = torch.tensor([0, 1, 3, 2])
+        >>> multiclass_auroc(pred, target)
+        tensor([1.0000, 1.0000, 0.3333, 0.3333])
+    """
+    num_classes = get_num_classes(pred, target, num_classes)
+
+    fpr, tpr, _, distinct = _multiclass_roc_tables(pred=pred, target=target, num_classes=num_classes,
+                                                   sample_weight=sample_weight)
+
+    # trapezoidal rule along the curves of all classes, concatenated into one vector
+    fpr, tpr = fpr.t()[distinct.t()], tpr.t()[distinct.t()]
+    class_idx = torch.arange(num_classes, device=pred.device).repeat_interleave(distinct.sum(0))
+    area = (fpr[1:] - fpr[:-1]) * (tpr[1:] + tpr[:-1]) / 2
+
+    # drop the segments connecting the end of a curve with the start of the next one
+    same_class = class_idx[1:] == class_idx[:-1]
+    return torch.zeros(num_classes, dtype=area.dtype, device=area.device).index_add_(
+        0, class_idx[1:][same_class], area[same_class])
 
 
 def precision_recall_curve(
@@ -756,16 +872,27 @@ def multiclass_precision_recall_curve(
     """
     num_classes = get_num_classes(pred, target, num_classes)
 
-    class_pr_vals = []
-    for c in range(num_classes):
-        pred_c = pred[:, c]
+    fps, tps, thresholds, distinct = _multiclass_clf_curve(pred=pred, target=target, num_classes=num_classes,
+                                                           sample_weight=sample_weight)
 
-        class_pr_vals.append(precision_recall_curve(
-            pred=pred_c,
-            target=target,
-            sample_weight=sample_weight, pos_label=c))
+    precision = tps / (tps + fps)
+    recall = tps / tps[-1]
+
+    # stop when full recall attained
+    full_recall = (distinct & (tps == tps[-1])).to(torch.long)
+    keep = distinct & ((torch.cumsum(full_recall, dim=0) - full_recall) == 0)
 
-    return tuple(class_pr_vals)
+    # reverse the outputs so recall is decreasing and finish the curves at (recall, precision) = (0, 1)
+    keep, precision, recall, thresholds = keep.flip(0), precision.flip(0), recall.flip(0), thresholds.flip(0)
+    keep_curve = torch.cat([keep, torch.ones_like(keep[:1])])
+    precision = torch.cat([precision, torch.ones_like(precision[:1])])
+    recall = torch.cat([recall, torch.zeros_like(recall[:1])])
+
+    counts = keep.sum(0).tolist()
+    curve_counts = [count + 1 for count in counts]
+    return tuple(zip(_split_classes(precision, keep_curve, curve_counts),
+                     _split_classes(recall, keep_curve, curve_counts),
+                     _split_classes(thresholds, keep, counts)))
 
 
 def auc(
@@ -904,6 +1031,164 @@ def average_precision(
     return -torch.sum((recall[1:] - recall[:-1]) * precision[:-1])
 
 
+def binned_clf_counts(
+        pred: torch.Tensor,
+        target: torch.Tensor,
+        num_bins: int = 100,
+        sample_weight: Optional[Sequence] = None,
+        pos_label: int = 1.,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Counts the false and true positives when thresholding the predictions at ``num_bins`` thresholds
+    evenly spaced in [0, 1]. The counts of several batches (or processes) can simply be summed up,
+    so binned curves need memory proportional to ``num_bins`` instead of to the number of samples.
+
+    Args:
+        pred: estimated probabilities, scores outside of [0, 1] are clipped
+        target: ground-truth labels
+        num_bins: number of thresholds
+        sample_weight: sample weights
+        pos_label: the label for the positive class
+
+    Return:
+        false positives and true positives for each threshold, in increasing order of thresholds
+
+    Example:
+
+        >>> pred = torch.tensor([0.1, 0.4, 0.35, 0.8])
+        >>> target = torch.tensor([0, 0, 1, 1])
+        >>> fps, tps = binned_clf_counts(pred, target, num_bins=5)
+        >>> fps
+        tensor([2., 1., 0., 0., 0.])
+        >>> tps
+        tensor([2., 2., 1., 1., 0.])
+    """
+    if sample_weight is not None and not isinstance(sample_weight, torch.Tensor):
+        sample_weight = torch.tensor(sample_weight, device=pred.device, dtype=torch.float)
+
+    # remove class dimension if necessary
+    if pred.ndim > target.ndim:
+        pred = pred[:, 0]
+    pred, target = pred.reshape(-1), target.reshape(-1)
+
+    # a prediction is positive for all thresholds up to its bin
+    bins = (pred.to(torch.float).clamp(0, 1) * (num_bins - 1)).floor().to(torch.long)
+
+    target = (target == pos_label).to(torch.float)
+    weight = sample_weight.reshape(-1).to(torch.float) if sample_weight is not None else torch.ones_like(target)
+
+    tps = torch.zeros(num_bins, device=pred.device).index_add_(0, bins, target * weight)
+    fps = torch.zeros(num_bins, device=pred.device).index_add_(0, bins, (1 - target) * weight)
+
+    # count each prediction for every threshold below its score
+    return fps.flip(0).cumsum(0).flip(0), tps.flip(0).cumsum(0).flip(0)
+
+
+def binned_auroc_from_counts(fps: torch.Tensor, tps: torch.Tensor) -> torch.Tensor:
+    """
+    Computes the area under the ROC curve from the counts of :func:`binned_clf_counts`.
+
+    Args:
+        fps: false positives for each threshold, in increasing order of thresholds
+        tps: true positives for each threshold, in increasing order of thresholds
+
+    Return:
+        Tensor containing the approximate ROCAUC score
+    """
+    # walk the thresholds in decreasing order, starting at (0, 0)
+    fpr = F.pad(fps.flip(0), (1, 0)) / fps[0]
+    tpr = F.pad(tps.flip(0), (1, 0)) / tps[0]
+    return torch.trapz(tpr, fpr)
+
+
+def binned_average_precision_from_counts(fps: torch.Tensor, tps: torch.Tensor) -> torch.Tensor:
+    """
+    Computes the average precision from the counts of :func:`binned_clf_counts`.
+
+    Args:
+        fps: false positives for each threshold, in increasing order of thresholds
+        tps: true positives for each threshold, in increasing order of thresholds
+
+    Return:
+        Tensor containing the approximate average precision score
+    """
+    precision = tps / (tps + fps)
+    precision[precision != precision] = 0
+    recall = tps / tps[0]
+
+    # step function integral over decreasing thresholds
+    recall_gain = recall - F.pad(recall[1:], (0, 1))
+    return torch.sum(recall_gain * precision)
+
+
+def binned_auroc(
+        pred: torch.Tensor,
+        target: torch.Tensor,
+        num_bins: int = 100,
+        sample_weight: Optional[Sequence] = None,
+        pos_label: int = 1.,
+) -> torch.Tensor:
+    """
+    Approximates the Area Under the Receiver Operating Characteristic Curve (ROC AUC) with ``num_bins``
+    thresholds evenly spaced in [0, 1]. The approximation improves with the number of bins, it only
+    merges predictions which fall into the same bin.
+
+    Args:
+        pred: estimated probabilities
+        target: ground-truth labels
+        num_bins: number of thresholds
+        sample_weight: sample weights
+        pos_label: the label for the positive class
+
+    Return:
+        Tensor containing the approximate ROCAUC score
+
+    Example:
+
+        >>> pred = torch.tensor([0.1, 0.4, 0.35, 0.8])
+        >>> target = torch.tensor([0, 0, 1, 1])
+        >>> binned_auroc(pred, target, num_bins=1000)
+        tensor(0.7500)
+    """
+    fps, tps = binned_clf_counts(pred=pred, target=target, num_bins=num_bins,
+                                 sample_weight=sample_weight, pos_label=pos_label)
+    return binned_auroc_from_counts(fps, tps)
+
+
+def binned_average_precision(
+        pred: torch.Tensor,
+        target: torch.Tensor,
+        num_bins: int = 100,
+        sample_weight: Optional[Sequence] = None,
+        pos_label: int = 1.,
+) -> torch.Tensor:
+    """
+    Approximates the average precision with ``num_bins`` thresholds evenly spaced in [0, 1].
+    The approximation improves with the number of bins, it only merges predictions which fall
+    into the same bin.
+
+    Args:
+        pred: estimated probabilities
+        target: ground-truth labels
+        num_bins: number of thresholds
+        sample_weight: sample weights
+        pos_label: the label for the positive class
+
+    Return:
+        Tensor containing the approximate average precision score
+
+    Example:
+
+        >>> pred = torch.tensor([0.1, 0.4, 0.35, 0.8])
+        >>> target = torch.tensor([0, 0, 1, 1])
+        >>> binned_average_precision(pred, target, num_bins=1000)
+        tensor(0.8333)
+    """
+    fps, tps = binned_clf_counts(pred=pred, target=target, num_bins=num_bins,
+                                 sample_weight=sample_weight, pos_label=pos_label)
+    return binned_average_precision_from_counts(fps, tps)
+
+
 def dice_score(
         pred: torch.Tensor,
         target: torch.Tensor,
@@ -944,19 +1229,26 @@ def dice_score(
     """
     num_classes = pred.shape[1]
     bg = (1 - int(bool(bg)))
-    scores = torch.zeros(num_classes - bg, device=pred.device, dtype=torch.float32)
-    for i in range(bg, num_classes):
-        if not (target == i).any():
-            # no foreground class
-            scores[i - bg] += no_fg_score
-            continue
-
-        tp, fp, tn, fn, sup = stat_scores(pred=pred, target=target, class_index=i)
-        denom = (2 * tp + fp + fn).to(torch.float)
-        # nan result
-        score_cls = (2 * tp).to(torch.float) / denom if torch.is_nonzero(denom) else nan_score
-
-        scores[i - bg] += score_cls
+
+    if pred.ndim == target.ndim + 1:
+        pred = to_categorical(pred)
+    pred = pred.reshape(-1).long().clamp_max(num_classes)
+    target = target.reshape(-1).long().clamp_max(num_classes)
+    # count all classes in one pass, the extra bin collects out of range targets
+    tps = torch.zeros(num_classes + 1, device=pred.device, dtype=torch.long)
+    pred_counts = torch.zeros_like(tps)
+    sups = torch.zeros_like(tps)
+    tps.scatter_add_(0, target, (pred == target).long())
+    pred_counts.scatter_add_(0, pred, torch.ones_like(pred))
+    sups.scatter_add_(0, target, torch.ones_like(target))
+
+    tps, pred_counts, sups = tps[bg:num_classes], pred_counts[bg:num_classes], sups[bg:num_classes]
+    # 2 * tp + fp + fn
+    denom = (pred_counts + sups).to(torch.float)
+    scores = (2 * tps).to(torch.float) / denom
+    scores = torch.where(denom > 0, scores, torch.full_like(scores, nan_score))
+    # no foreground class
+    scores = torch.where(sups > 0, scores, torch.full_like(scores, no_fg_score))
     return reduce(scores, reduction=reduction)
 
 
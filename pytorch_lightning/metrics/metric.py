@@ -13,7 +13,9 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Union
+import math
 import numbers
 
 import torch
@@ -21,7 +23,7 @@ from torch import nn
 import numpy as np
 
 from pytorch_lightning.metrics.converters import (
-    sync_ddp_if_available, gather_all_tensors_if_available,
+    sync_ddp_collection_if_available, gather_all_tensors_if_available,
     convert_to_tensor, convert_to_numpy)
 from pytorch_lightning.utilities.apply_func import apply_to_collection
 from pytorch_lightning.utilities.device_dtype_mixin import DeviceDtypeModuleMixin
@@ -189,8 +191,7 @@ class TensorMetric(Metric):
 
     @staticmethod
     def ddp_sync(self, data: Any, output: Any):
-        return apply_to_collection(output, torch.Tensor, sync_ddp_if_available,
-                                   self.reduce_group, self.reduce_op)
+        return sync_ddp_collection_if_available(output, self.reduce_group, self.reduce_op)
 
 
 class TensorCollectionMetric(Metric):
@@ -242,8 +243,7 @@ class TensorCollectionMetric(Metric):
 
     @staticmethod
     def ddp_sync(self, data: Any, output: Any):
-        return apply_to_collection(output, torch.Tensor, sync_ddp_if_available,
-                                   self.reduce_group, self.reduce_op)
+        return sync_ddp_collection_if_available(output, self.reduce_group, self.reduce_op)
 
 
 class NumpyMetric(Metric):
@@ -285,5 +285,385 @@ class NumpyMetric(Metric):
 
     @staticmethod
     def ddp_sync(self, data: Any, output: Any):
-        return apply_to_collection(output, torch.Tensor, sync_ddp_if_available,
-                                   self.reduce_group, self.reduce_op)
+        return sync_ddp_collection_if_available(output, self.reduce_group, self.reduce_op)
+
+
+class StatefulMetric(Metric):
+    """
+    Base class for metrics accumulating sufficient statistics over several batches.
+
+    Subclasses register their state tensors with :meth:`add_state` and implement
+
+        * update: accumulate the statistics of a batch into the states (no DDP communication)
+        * compute_from_states: compute the metric value from the current states
+
+    The states are only synced across processes in :meth:`compute`, which reduces all
+    states of one reduction op with a single ``all_reduce`` (typically once per epoch).
+    Calling the metric updates its states and returns the (unsynced) value of the batch.
+
+    Example:
+
+        >>> class Mean(StatefulMetric):
+        ...     def __init__(self):
+        ...         super().__init__(name='mean')
+        ...         self.add_state('total', torch.tensor(0.))
+        ...         self.add_state('count', torch.tensor(0))
+        ...     def update(self, values):
+        ...         self._update_state('total', values.sum())
+        ...         self._update_state('count', torch.tensor(values.numel()))
+        ...     def compute_from_states(self):
+        ...         return self.total / self.count
+        >>> metric = Mean()
+        >>> metric(torch.tensor([1., 2.]))
+        tensor(1.5000)
+        >>> metric(torch.tensor([6.]))
+        tensor(6.)
+        >>> metric.compute()
+        tensor(3.)
+        >>> metric.reset()
+        >>> metric.count
+        tensor(0)
+
+    """
+
+    #: reductions supported for states, applied when merging batches and across processes
+    STATE_REDUCE_OPS = ('sum', 'max', 'min')
+
+    def __init__(self, name: str, reduce_group: Optional[Any] = None):
+        """
+        Args:
+            name: the metric's name
+            reduce_group: the process group to sync the states in (only needed for DDP training).
+                Defaults to all processes (world)
+        """
+        # the states replace the forward hooks of `Metric`, so `Metric.__init__` which registers them is skipped
+        super(Metric, self).__init__()
+        self.name = name
+        self.reduce_group = reduce_group
+        self._dtype = torch.get_default_dtype()
+        self._device = torch.device('cpu')
+        self._state_defaults = {}
+        self._state_reduce_ops = {}
+
+    def add_state(self, name: str, default: torch.Tensor, reduce_op: str = 'sum'):
+        """
+        Registers a state tensor, which is available as attribute ``name``.
+
+        States are no buffers and therefore not part of the ``state_dict``. A state whose default is empty
+        grows with the data (e.g. when the number of classes is inferred) and is padded when merged,
+        with zeros for 'sum' and with the largest or smallest value of its dtype for 'min' or 'max'.
+
+        Args:
+            name: the name of the state attribute
+            default: the value of the state after :meth:`reset`
+            reduce_op: how to combine the state of several batches and processes. One of 'sum', 'max', 'min'
+        """
+        if reduce_op not in self.STATE_REDUCE_OPS:
+            raise ValueError(f'`reduce_op` must be one of {self.STATE_REDUCE_OPS}, got {reduce_op}')
+        self._state_defaults[name] = default.detach().clone()
+        self._state_reduce_ops[name] = reduce_op
+        setattr(self, name, default.detach().clone())
+
+    @abstractmethod
+    def update(self, *args, **kwargs):
+        """
+        Accumulates the statistics of a batch into the states. Must not communicate across processes.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def compute_from_states(self) -> Any:
+        """
+        Computes the metric value from the states. Called on the synced states by :meth:`compute`
+        and on the states of a single batch by :meth:`forward`.
+
+        Returns:
+            metric value
+        """
+        raise NotImplementedError
+
+    def forward(self, *args, **kwargs) -> Any:
+        """
+        Updates the states with a batch and returns the metric value of this batch only.
+        """
+        args, kwargs = self._convert_inputs((args, kwargs))
+        accumulated = self._get_states()
+
+        self.reset()
+        self.update(*args, **kwargs)
+        batch_value = self.compute_from_states()
+
+        batch_states = self._get_states()
+        self._set_states(accumulated)
+        for name, value in batch_states.items():
+            self._update_state(name, value)
+
+        return self._convert_output(batch_value)
+
+    def compute(self) -> Any:
+        """
+        Syncs the states across processes and computes the metric over all batches since the last :meth:`reset`.
+        The local states are left untouched.
+        """
+        local_states = self._get_states()
+        self._set_states(self.sync_states())
+        try:
+            value = self.compute_from_states()
+        finally:
+            self._set_states(local_states)
+        return self._convert_output(value)
+
+    def reset(self):
+        """
+        Resets all states to their defaults.
+        """
+        for name, default in self._state_defaults.items():
+            setattr(self, name, default.to(getattr(self, name).device, copy=True))
+
+    def sync_states(self) -> Dict[str, torch.Tensor]:
+        """
+        Reduces the states across processes. All states of the same reduction op are flattened into one
+        buffer, so that a single ``all_reduce`` per reduction op is needed.
+
+        Returns:
+            the reduced states
+        """
+        return sync_metric_states([self], group=self.reduce_group)[0]
+
+    def _update_state(self, name: str, value: torch.Tensor):
+        """Merges ``value`` into the state ``name`` with the state's reduction."""
+        state = getattr(self, name)
+        value = value.to(device=state.device, dtype=state.dtype)
+        reduce_op = self._state_reduce_ops[name]
+        if state.shape != value.shape:
+            shape = [max(s, v) for s, v in zip(state.shape, value.shape)]
+            state, value = _pad_to_shape(state, shape, reduce_op), _pad_to_shape(value, shape, reduce_op)
+
+        if reduce_op == 'sum':
+            state = state + value
+        elif reduce_op == 'max':
+            state = torch.max(state, value)
+        else:
+            state = torch.min(state, value)
+        setattr(self, name, state)
+
+    def _get_states(self) -> Dict[str, torch.Tensor]:
+        return {name: getattr(self, name) for name in self._state_defaults}
+
+    def _set_states(self, states: Dict[str, torch.Tensor]):
+        for name, value in states.items():
+            setattr(self, name, value)
+
+    def _convert_inputs(self, data: Any) -> Any:
+        return apply_to_collection(data, (np.ndarray, numbers.Number), convert_to_tensor, None, self.device)
+
+    def _convert_output(self, output: Any) -> Any:
+        return apply_to_collection(output, (torch.Tensor, np.ndarray, numbers.Number), convert_to_tensor,
+                                   self.dtype, self.device)
+
+    def _apply(self, fn):
+        super()._apply(fn)
+        # states only follow the device of the metric, casting them (e.g. with `half()`) would lose the precision
+        # of the accumulated values
+        for name, state in self._get_states().items():
+            device = fn(torch.empty(0, device=state.device)).device
+            setattr(self, name, state.to(device))
+        return self
+
+
+def sync_metric_states(metrics: Sequence[StatefulMetric], group: Optional[Any] = None) -> List[Dict[str, torch.Tensor]]:
+    """
+    Reduces the states of several metrics across processes with one ``all_reduce`` per reduction op
+    (and one more to agree on the shapes of states growing with the data, if there are any).
+
+    Args:
+        metrics: the metrics to sync
+        group: the process group to reduce the states in. Defaults to all processes (world)
+
+    Returns:
+        the reduced states of each metric
+    """
+    states = [metric._get_states() for metric in metrics]
+    if not (torch.distributed.is_available() and torch.distributed.is_initialized()):
+        return states
+
+    if group is None:
+        group = torch.distributed.group.WORLD
+
+    entries = [(metric, metric_states, name) for metric, metric_states in zip(metrics, states) for name in metric_states]
+    if not entries:
+        return states
+    device = entries[0][1][entries[0][2]].device
+
+    # states growing with the data may have different shapes on each process
+    dynamic = [(metric, metric_states, name) for metric, metric_states, name in entries
+               if metric._state_defaults[name].numel() == 0]
+    if dynamic:
+        shapes = torch.tensor([s for _, metric_states, name in dynamic for s in metric_states[name].shape],
+                              device=device)
+        torch.distributed.all_reduce(shapes, op=torch.distributed.ReduceOp.MAX, group=group)
+        shapes = iter(shapes.tolist())
+        for metric, metric_states, name in dynamic:
+            shape = [next(shapes) for _ in range(metric_states[name].dim())]
+            metric_states[name] = _pad_to_shape(metric_states[name], shape, metric._state_reduce_ops[name])
+
+    torch_reduce_ops = {
+        'sum': torch.distributed.ReduceOp.SUM,
+        'max': torch.distributed.ReduceOp.MAX,
+        'min': torch.distributed.ReduceOp.MIN,
+    }
+    for reduce_op, torch_reduce_op in torch_reduce_ops.items():
+        bucket = [(metric_states, name) for metric, metric_states, name in entries
+                  if metric._state_reduce_ops[name] == reduce_op]
+        if not bucket:
+            continue
+        # float64 represents counts exactly up to 2 ** 53
+        buffer = torch.cat([metric_states[name].reshape(-1).to(device, torch.float64) for metric_states, name in bucket])
+        torch.distributed.all_reduce(buffer, op=torch_reduce_op, group=group)
+        synced = buffer.split([metric_states[name].numel() for metric_states, name in bucket])
+        for (metric_states, name), value in zip(bucket, synced):
+            state = metric_states[name]
+            metric_states[name] = _from_float64(value.view(state.shape), state.dtype).to(state.device)
+
+    return states
+
+
+class MetricCollection(nn.ModuleDict):
+    """
+    Computes several metrics on the same inputs and syncs them across processes together.
+
+    The outputs of all :class:`TensorMetric`, :class:`TensorCollectionMetric` and :class:`NumpyMetric`
+    members sharing a process group and reduction are reduced with one collective per dtype
+    (instead of one per metric) and the states of all :class:`StatefulMetric` members are synced
+    with one collective per reduction in :meth:`compute`. Other metrics are called as usual.
+
+    Example:
+
+        >>> from pytorch_lightning.metrics import Accuracy, Precision
+        >>> metrics = MetricCollection([Accuracy(), Precision(num_classes=4)])
+        >>> pred = torch.tensor([0, 1, 2, 3])
+        >>> target = torch.tensor([0, 1, 2, 2])
+        >>> metrics(pred, target)
+        {'accuracy': tensor(0.7500), 'precision': tensor(0.7500)}
+        >>> metrics.compute()
+        {'accuracy': tensor(0.7500), 'precision': tensor(0.7500)}
+
+    """
+
+    def __init__(self, metrics: Union[Sequence[nn.Module], Dict[str, nn.Module]]):
+        """
+        Args:
+            metrics: the metrics, either as a sequence (keyed by the metric names) or as a dict
+        """
+        if not isinstance(metrics, dict):
+            metrics = OrderedDict((metric.name, metric) for metric in metrics)
+        super().__init__(metrics)
+
+    def forward(self, *args, **kwargs) -> Dict[str, Any]:
+        """
+        Calls all metrics with the same inputs.
+
+        Return:
+            the output of each metric by key
+        """
+        results = {}
+        # [(reduce_group, reduce_op, [(key, metric, data, output)])]
+        pending = []
+
+        for key, metric in self.items():
+            if not isinstance(metric, Metric) or type(metric).ddp_sync not in _SUM_REDUCE_SYNC_HOOKS:
+                results[key] = metric(*args, **kwargs)
+                continue
+
+            # run the hooks of the metric up to the ddp sync, see `Metric`
+            data = metric.input_convert(metric, args)
+            output = metric.output_convert(metric, data, metric.forward(*data, **kwargs))
+            _find_bucket(pending, metric.reduce_group, metric.reduce_op).append((key, metric, data, output))
+
+        for group, reduce_op, entries in pending:
+            outputs = sync_ddp_collection_if_available([output for *_, output in entries], group, reduce_op)
+            for (key, metric, data, _), output in zip(entries, outputs):
+                output = metric.aggregate(metric, data, output)
+                results[key] = metric.compute(metric, data, output)
+
+        return {key: results[key] for key in self.keys()}
+
+    def compute(self) -> Dict[str, Any]:
+        """
+        Syncs the states of all stateful metrics and computes them.
+
+        Return:
+            the value of each stateful metric by key
+        """
+        # [(reduce_group, None, [(key, metric)])]
+        by_group = []
+        for key, metric in self.items():
+            if isinstance(metric, StatefulMetric):
+                _find_bucket(by_group, metric.reduce_group).append((key, metric))
+
+        results = {}
+        for group, _, entries in by_group:
+            synced_states = sync_metric_states([metric for _, metric in entries], group=group)
+            for (key, metric), states in zip(entries, synced_states):
+                local_states = metric._get_states()
+                metric._set_states(states)
+                try:
+                    results[key] = metric._convert_output(metric.compute_from_states())
+                finally:
+                    metric._set_states(local_states)
+
+        return {key: results[key] for key in self.keys() if key in results}
+
+    def reset(self):
+        """
+        Resets the states of all stateful metrics.
+        """
+        for metric in self.values():
+            if isinstance(metric, StatefulMetric):
+                metric.reset()
+
+
+#: ddp sync hooks which reduce all output tensors with ``sync_ddp_if_available``
+_SUM_REDUCE_SYNC_HOOKS = (TensorMetric.ddp_sync, TensorCollectionMetric.ddp_sync, NumpyMetric.ddp_sync)
+
+
+def _find_bucket(buckets: list, group: Any, reduce_op: Any = None) -> list:
+    """Returns the entries of the bucket for ``group`` and ``reduce_op``, process groups and ops need not be hashable."""
+    for bucket_group, bucket_reduce_op, entries in buckets:
+        if bucket_group is group and bucket_reduce_op == reduce_op:
+            return entries
+    buckets.append((group, reduce_op, []))
+    return buckets[-1][2]
+
+
+def _pad_value(dtype: torch.dtype, reduce_op: str = 'sum') -> Any:
+    """The identity of ``reduce_op`` for ``dtype``, so padded entries don't change the reduced values."""
+    if reduce_op == 'sum':
+        return 0
+    if dtype == torch.bool:
+        return reduce_op == 'min'
+    if dtype.is_floating_point:
+        return math.inf if reduce_op == 'min' else -math.inf
+    info = torch.iinfo(dtype)
+    return info.max if reduce_op == 'min' else info.min
+
+
+def _pad_to_shape(tensor: torch.Tensor, shape: Sequence[int], reduce_op: str = 'sum') -> torch.Tensor:
+    """Pads ``tensor`` at the end of each dimension to ``shape`` with the identity of ``reduce_op``."""
+    if list(tensor.shape) == list(shape):
+        return tensor
+    padded = torch.full(shape, _pad_value(tensor.dtype, reduce_op), dtype=tensor.dtype, device=tensor.device)
+    padded[tuple(slice(0, s) for s in tensor.shape)] = tensor
+    return padded
+
+
+def _from_float64(tensor: torch.Tensor, dtype: torch.dtype) -> torch.Tensor:
+    """Converts a reduced float64 buffer back to ``dtype``, saturating the integer padding of min and max states,
+    which float64 does not represent exactly."""
+    if dtype == torch.bool or dtype.is_floating_point:
+        return tensor.to(dtype)
+    info = torch.iinfo(dtype)
+    converted = tensor.clamp(info.min, info.max).to(dtype)
+    converted[tensor >= info.max] = info.max
+    converted[tensor <= info.min] = info.min
+    return converted
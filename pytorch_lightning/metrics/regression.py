@@ -12,22 +12,72 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Sequence
+from typing import Any, Sequence
 
 import torch
+from torch.nn import functional as F
 
 from pytorch_lightning.metrics.functional.regression import (
-    mae,
-    mse,
     psnr,
     rmse,
     rmsle,
     ssim
 )
-from pytorch_lightning.metrics.metric import Metric
+from pytorch_lightning.metrics.metric import Metric, StatefulMetric
+from pytorch_lightning.utilities import rank_zero_warn
 
 
-class MSE(Metric):
+def _check_reduction(reduction: str):
+    if reduction == 'none':
+        rank_zero_warn("`reduction='none'` of the metric modules is deprecated since v0.9.1 and will be removed in"
+                       " v0.11.0. The metric returns the elementwise values of a batch, but `compute` the mean over"
+                       " all batches. Use the functional interface for elementwise values.", DeprecationWarning)
+    elif reduction not in ('elementwise_mean', 'sum'):
+        raise ValueError(f'reduction type {reduction} is not supported by the metric module,'
+                         ' use the functional interface for elementwise values')
+
+
+class _ErrorSumMetric(StatefulMetric):
+    """
+    Base class for regression metrics computed from the sum of an elementwise error
+    and the number of elements accumulated over all batches.
+    """
+
+    def __init__(self, name: str, reduction: str = 'elementwise_mean', reduce_group: Any = None):
+        super().__init__(name=name, reduce_group=reduce_group)
+        _check_reduction(reduction)
+        self.reduction = reduction
+        self.add_state('sum_error', torch.tensor(0., dtype=torch.float64))
+        self.add_state('total', torch.tensor(0))
+
+    def error(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+        raise NotImplementedError
+
+    def update(self, pred: torch.Tensor, target: torch.Tensor):
+        """
+        Accumulates the errors of a batch
+
+        Args:
+            pred: predicted labels
+            target: ground truth labels
+        """
+        self._update_state('sum_error', self.error(pred, target).sum())
+        self._update_state('total', torch.tensor(target.numel()))
+
+    def forward(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+        value = super().forward(pred, target)
+        if self.reduction == 'none':
+            # deprecated, the elementwise errors of the batch
+            return self._convert_output(self.error(*self._convert_inputs((pred, target))))
+        return value
+
+    def compute_from_states(self) -> torch.Tensor:
+        if self.reduction == 'sum':
+            return self.sum_error
+        return self.sum_error / self.total
+
+
+class MSE(_ErrorSumMetric):
     """
     Computes the mean squared loss.
 
@@ -38,36 +88,30 @@ class MSE(Metric):
         >>> metric = MSE()
         >>> metric(pred, target)
         tensor(0.2500)
+        >>> metric(torch.tensor([1., 1.]), torch.tensor([1., 3.]))
+        tensor(2.)
+        >>> metric.compute()
+        tensor(0.8333)
 
     """
 
     def __init__(
             self,
             reduction: str = 'elementwise_mean',
+            reduce_group: Any = None,
     ):
         """
         Args:
             reduction: a method to reduce metric score over labels (default: takes the mean)
                 Available reduction methods:
                 - elementwise_mean: takes the mean
-                - none: pass array
                 - sum: add elements
+            reduce_group: the process group to reduce metric results from DDP
         """
-        super().__init__(name='mse')
-        self.reduction = reduction
+        super().__init__(name='mse', reduction=reduction, reduce_group=reduce_group)
 
-    def forward(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
-        """
-        Actual metric computation
-
-        Args:
-            pred: predicted labels
-            target: ground truth labels
-
-        Return:
-            A Tensor with the mse loss.
-        """
-        return mse(pred, target, self.reduction)
+    def error(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+        return F.mse_loss(pred, target, reduction='none')
 
 
 class RMSE(Metric):
@@ -113,7 +157,7 @@ class RMSE(Metric):
         return rmse(pred, target, self.reduction)
 
 
-class MAE(Metric):
+class MAE(_ErrorSumMetric):
     """
     Computes the mean absolute loss or L1-loss.
 
@@ -130,30 +174,20 @@ class MAE(Metric):
     def __init__(
             self,
             reduction: str = 'elementwise_mean',
+            reduce_group: Any = None,
     ):
         """
         Args:
             reduction: a method to reduce metric score over labels (default: takes the mean)
                 Available reduction methods:
                 - elementwise_mean: takes the mean
-                - none: pass array
                 - sum: add elements
+            reduce_group: the process group to reduce metric results from DDP
         """
-        super().__init__(name='mae')
-        self.reduction = reduction
-
-    def forward(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
-        """
-        Actual metric computation
+        super().__init__(name='mae', reduction=reduction, reduce_group=reduce_group)
 
-        Args:
-            pred: predicted labels
-            target: ground truth labels
-
-        Return:
-            A Tensor with the mae loss.
-        """
-        return mae(pred, target, self.reduction)
+    def error(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+        return F.l1_loss(pred, target, reduction='none')
 
 
 class RMSLE(Metric):
@@ -199,7 +233,7 @@ class RMSLE(Metric):
         return rmsle(pred, target, self.reduction)
 
 
-class PSNR(Metric):
+class PSNR(StatefulMetric):
     """
     Computes the peak signal-to-noise ratio
 
@@ -217,7 +251,8 @@ class PSNR(Metric):
             self,
             data_range: float = None,
             base: int = 10,
-            reduction: str = 'elementwise_mean'
+            reduction: str = 'elementwise_mean',
+            reduce_group: Any = None,
     ):
         """
         Args:
@@ -226,26 +261,65 @@ class PSNR(Metric):
             reduction: a method to reduce metric score over labels (default: takes the mean)
                 Available reduction methods:
                 - elementwise_mean: takes the mean
-                - none: pass array
                 - sum: add elements
+            reduce_group: the process group to reduce metric results from DDP
         """
-        super().__init__(name='psnr')
+        super().__init__(name='psnr', reduce_group=reduce_group)
+        _check_reduction(reduction)
         self.data_range = data_range
         self.base = float(base)
         self.reduction = reduction
 
-    def forward(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+        self.add_state('sum_squared_error', torch.tensor(0., dtype=torch.float64))
+        self.add_state('total', torch.tensor(0))
+        if data_range is None:
+            for state in ('min_target', 'min_pred'):
+                self.add_state(state, torch.tensor(float('inf')), reduce_op='min')
+            for state in ('max_target', 'max_pred'):
+                self.add_state(state, torch.tensor(float('-inf')), reduce_op='max')
+
+    def update(self, pred: torch.Tensor, target: torch.Tensor):
         """
-        Actual metric computation
+        Accumulates the squared errors and data range of a batch
 
         Args:
             pred: predicted labels
             target: ground truth labels
+        """
+        self._update_state('sum_squared_error', F.mse_loss(pred, target, reduction='sum'))
+        self._update_state('total', torch.tensor(target.numel()))
+        if self.data_range is None:
+            self._update_state('min_target', target.min())
+            self._update_state('max_target', target.max())
+            self._update_state('min_pred', pred.min())
+            self._update_state('max_pred', pred.max())
+
+    def forward(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+        value = super().forward(pred, target)
+        if self.reduction == 'none':
+            # deprecated, the elementwise values of the batch
+            pred, target = self._convert_inputs((pred, target))
+            return self._convert_output(psnr(pred, target, self.data_range, self.base, 'none'))
+        return value
+
+    def compute_from_states(self) -> torch.Tensor:
+        """
+        Actual metric computation
 
         Return:
             A Tensor with psnr score.
         """
-        return psnr(pred, target, self.data_range, self.base, self.reduction)
+        if self.data_range is None:
+            data_range = max(self.max_target - self.min_target, self.max_pred - self.min_pred)
+        else:
+            data_range = torch.tensor(float(self.data_range))
+
+        mse_score = self.sum_squared_error
+        if self.reduction != 'sum':
+            mse_score = mse_score / self.total
+
+        psnr_base_e = 2 * torch.log(data_range) - torch.log(mse_score)
+        return psnr_base_e * (10 / torch.log(torch.tensor(self.base)))
 
 
 class SSIM(Metric):
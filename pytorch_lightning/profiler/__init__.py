@@ -30,23 +30,72 @@ your `Trainer` object.
     trainer = Trainer(..., profiler=True)
 
 The profiler's results will be printed at the completion of a training `fit()`.
+The profiler keeps streaming statistics of each action, so its memory does not grow with the length of training.
 
 .. code-block:: python
 
     Profiler Report
 
-    Action                  |  Mean duration (s)    |  Total time (s)
-    -----------------------------------------------------------------
-    on_epoch_start          |  5.993e-06            |  5.993e-06
-    get_train_batch         |  0.0087412            |  16.398
-    on_batch_start          |  5.0865e-06           |  0.0095372
-    model_forward           |  0.0017818            |  3.3408
-    model_backward          |  0.0018283            |  3.4282
-    on_after_backward       |  4.2862e-06           |  0.0080366
-    optimizer_step          |  0.0011072            |  2.0759
-    on_batch_end            |  4.5202e-06           |  0.0084753
-    on_epoch_end            |  3.919e-06            |  3.919e-06
-    on_train_end            |  5.449e-06            |  5.449e-06
+    Action                  |  Mean duration (s)    |  Std (s)       |  p50 (s)       |  p90 (s)       |  p99 (s)       |  Num calls    |  Total time (s)
+    ----------------------------------------------------------------------------------------------------------------------------------------------------------
+    on_epoch_start          |  5.993e-06            |  0.0           |  5.993e-06     |  5.993e-06     |  5.993e-06     |  1            |  5.993e-06
+    get_train_batch         |  0.0087412            |  0.0013117     |  0.0085046     |  0.0096849     |  0.016104      |  1876         |  16.398
+    on_batch_start          |  5.0865e-06           |  1.4353e-06    |  4.8578e-06    |  6.4166e-06    |  1.0198e-05    |  1875         |  0.0095372
+    model_forward           |  0.0017818            |  0.00029138    |  0.0017286     |  0.0019844     |  0.0029372     |  1875         |  3.3408
+    model_backward          |  0.0018283            |  0.00021845    |  0.0018015     |  0.0020062     |  0.0025621     |  1875         |  3.4282
+    on_after_backward       |  4.2862e-06           |  1.0152e-06    |  4.0809e-06    |  5.2037e-06    |  8.4063e-06    |  1875         |  0.0080366
+    optimizer_step          |  0.0011072            |  0.00015408    |  0.0010848     |  0.0012384     |  0.0016632     |  1875         |  2.0759
+    on_batch_end            |  4.5202e-06           |  1.1294e-06    |  4.3196e-06    |  5.5178e-06    |  9.2652e-06    |  1875         |  0.0084753
+    on_epoch_end            |  3.919e-06            |  0.0           |  3.919e-06     |  3.919e-06     |  3.919e-06     |  1            |  3.919e-06
+    on_train_end            |  5.449e-06            |  0.0           |  5.449e-06     |  5.449e-06     |  5.449e-06     |  1            |  5.449e-06
+
+To follow the durations during training, the `SimpleProfiler` can log the mean, 90th percentile and maximal
+duration of each action since the previous logged step along with the training metrics.
+
+.. code-block:: python
+
+    trainer = Trainer(..., profiler=SimpleProfiler(log_interval_metrics=True))
+
+
+Profiling device time
+---------------------
+
+On GPU, the kernels launched by an action run asynchronously, so the `SimpleProfiler` mostly measures how long
+it takes to launch them, and the device time shows up in whichever later action waits for the device.
+The `CUDAEventProfiler` additionally records a pair of CUDA events around each action and reports the device time
+between them next to the host time. The events are resolved once the device has passed them, so the profiler
+does not synchronize on every step. Without a GPU, it behaves like the `SimpleProfiler`.
+
+.. code-block:: python
+
+    from pytorch_lightning.profiler import CUDAEventProfiler
+
+    trainer = Trainer(..., profiler=CUDAEventProfiler())
+
+
+Timeline traces
+---------------
+
+To see when actions happen rather than how long they take on average, e.g. to spot dataloader stalls,
+hook overhead or checkpointing pauses, use the `TraceProfiler`. It records the start and duration of each action,
+with the thread and the rank it ran on, and writes a Chrome trace at the end of training, which can be opened
+in ``chrome://tracing`` or https://ui.perfetto.dev. Hooks called within ``run_training_batch`` are shown nested
+under it. Only the most recent ``max_events`` events are kept.
+
+.. code-block:: python
+
+    from pytorch_lightning.profiler import TraceProfiler
+
+    trainer = Trainer(..., profiler=TraceProfiler('trace.json'))
+
+With several processes, each rank other than 0 writes its trace to a file with a ``_rank{rank}`` suffix, e.g.
+``trace_rank1.json``. The traces can be merged into one timeline with a process per rank:
+
+.. code-block:: python
+
+    from pytorch_lightning.profiler import merge_chrome_traces
+
+    merge_chrome_traces(['trace.json', 'trace_rank1.json'], 'trace_merged.json')
 
 
 Advanced Profiling
@@ -112,11 +161,22 @@ to track and the profiler will record performance for code executed within this
 
 """
 
-from pytorch_lightning.profiler.profilers import SimpleProfiler, AdvancedProfiler, PassThroughProfiler, BaseProfiler
+from pytorch_lightning.profiler.profilers import (
+    SimpleProfiler,
+    CUDAEventProfiler,
+    TraceProfiler,
+    merge_chrome_traces,
+    AdvancedProfiler,
+    PassThroughProfiler,
+    BaseProfiler,
+)
 
 __all__ = [
     'BaseProfiler',
     'SimpleProfiler',
+    'CUDAEventProfiler',
+    'TraceProfiler',
+    'merge_chrome_traces',
     'AdvancedProfiler',
     'PassThroughProfiler',
 ]
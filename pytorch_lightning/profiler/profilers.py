@@ -14,16 +14,105 @@
 
 import cProfile
 import io
+import json
+import math
 import os
 import pstats
+import threading
 import time
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import defaultdict, deque
 from contextlib import contextmanager
+from typing import Dict, List, Optional
 
-import numpy as np
+import torch
 
 from pytorch_lightning import _logger as log
+from pytorch_lightning.utilities.distributed import rank_zero_only, rank_zero_warn
+
+
+class DurationStats:
+    """
+    Streaming statistics of the durations of an action in constant memory.
+
+    Mean and variance are updated with Welford's algorithm. Quantiles are estimated from a histogram
+    with logarithmically growing buckets, accurate up to a relative error of ``relative_accuracy``.
+
+    Example:
+
+        >>> stats = DurationStats()
+        >>> for duration in [0.1, 0.2, 0.3, 0.4]:
+        ...     stats.add(duration)
+        >>> stats.count, round(stats.total, 5), round(stats.mean, 5), stats.max
+        (4, 1.0, 0.25, 0.4)
+        >>> round(stats.quantile(0.5), 2)
+        0.2
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        """
+        Args:
+            relative_accuracy: the relative error of the quantile estimates
+            max_buckets: the maximal number of histogram buckets, the lowest buckets are merged beyond it
+        """
+        self.count = 0
+        self.total = 0.
+        self.mean = 0.
+        self.min = math.inf
+        self.max = -math.inf
+        self._m2 = 0.
+
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._max_buckets = max_buckets
+        self._buckets = {}
+        self._zero_count = 0
+
+    def add(self, value: float) -> None:
+        """Records a duration."""
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+        if value <= 0:
+            self._zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[key] = self._buckets.get(key, 0) + 1
+        if len(self._buckets) > self._max_buckets:
+            # merge the two lowest buckets, keeping the accuracy of the high quantiles
+            lowest, second = sorted(self._buckets)[:2]
+            self._buckets[second] += self._buckets.pop(lowest)
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def quantile(self, q: float) -> float:
+        """Estimates the ``q``-quantile of the recorded durations, ``q`` in [0, 1]."""
+        if not self.count:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return 0.
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if seen > rank:
+                # the center of the bucket in relative terms
+                estimate = 2 * self._gamma ** key / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
 
 
 class BaseProfiler(ABC):
@@ -91,6 +180,10 @@ class BaseProfiler(ABC):
     def summary(self) -> str:
         """Create profiler summary in text format."""
 
+    def interval_metrics(self) -> Dict[str, float]:
+        """Metrics of the actions recorded since the last call, logged with the training metrics."""
+        return {}
+
 
 class PassThroughProfiler(BaseProfiler):
     """
@@ -114,17 +207,26 @@ class PassThroughProfiler(BaseProfiler):
 class SimpleProfiler(BaseProfiler):
     """
     This profiler simply records the duration of actions (in seconds) and reports
-    the mean duration of each action and the total time spent over the entire training run.
+    statistics of the durations of each action and the total time spent over the entire training run.
+    The statistics are streamed, so the memory does not grow with the number of recorded actions.
     """
 
-    def __init__(self, output_filename: str = None):
+    #: the number of latest durations per action kept for the deprecated :attr:`recorded_durations`
+    MAX_RECORDED_DURATIONS = 10000
+
+    def __init__(self, output_filename: str = None, log_interval_metrics: bool = False):
         """
         Params:
             output_filename (str): optionally save profile results to file instead of printing
                 to std out when training is finished.
+            log_interval_metrics (bool): log the mean, 90th percentile and maximal duration of the
+                actions since the last logged training step to the logger.
         """
         self.current_actions = {}
-        self.recorded_durations = defaultdict(list)
+        self.recorded_stats = defaultdict(DurationStats)
+        self._recorded_durations = defaultdict(lambda: deque(maxlen=self.MAX_RECORDED_DURATIONS))
+        self.log_interval_metrics = log_interval_metrics
+        self.interval_stats = defaultdict(DurationStats)
 
         self.output_fname = output_filename
         self.output_file = open(self.output_fname, 'w') if self.output_fname else None
@@ -147,23 +249,50 @@ class SimpleProfiler(BaseProfiler):
             )
         start_time = self.current_actions.pop(action_name)
         duration = end_time - start_time
-        self.recorded_durations[action_name].append(duration)
+        self.recorded_stats[action_name].add(duration)
+        self._recorded_durations[action_name].append(duration)
+        if self.log_interval_metrics:
+            self.interval_stats[action_name].add(duration)
+
+    @property
+    def recorded_durations(self) -> Dict[str, List[float]]:
+        """The durations of each action, limited to the latest ``MAX_RECORDED_DURATIONS`` calls.
+
+        .. deprecated:: 0.9.1
+            Use :attr:`recorded_stats` instead.
+        """
+        rank_zero_warn('`SimpleProfiler.recorded_durations` is deprecated since v0.9.1 and will be removed in v0.11.0.'
+                       ' It only holds the latest durations of each action, use `recorded_stats` instead.',
+                       DeprecationWarning)
+        return {action: list(durations) for action, durations in self._recorded_durations.items()}
 
     def summary(self) -> str:
         output_string = "\n\nProfiler Report\n"
 
-        def log_row(action, mean, total):
-            return f"{os.linesep}{action:<20s}\t|  {mean:<15}\t|  {total:<15}"
+        def log_row(action, mean, std, p50, p90, p99, count, total):
+            return (f"{os.linesep}{action:<20s}\t|  {mean:<15}\t|  {std:<11}\t|  {p50:<11}\t|  {p90:<11}"
+                    f"\t|  {p99:<11}\t|  {count:<9}\t|  {total:<15}")
 
-        output_string += log_row("Action", "Mean duration (s)", "Total time (s)")
-        output_string += f"{os.linesep}{'-' * 65}"
-        for action, durations in self.recorded_durations.items():
+        output_string += log_row("Action", "Mean duration (s)", "Std (s)", "p50 (s)", "p90 (s)", "p99 (s)",
+                                 "Num calls", "Total time (s)")
+        output_string += f"{os.linesep}{'-' * 170}"
+        for action, stats in self.recorded_stats.items():
             output_string += log_row(
-                action, f"{np.mean(durations):.5}", f"{np.sum(durations):.5}",
+                action, f"{stats.mean:.5}", f"{stats.std:.5}", f"{stats.quantile(0.5):.5}",
+                f"{stats.quantile(0.9):.5}", f"{stats.quantile(0.99):.5}", f"{stats.count}", f"{stats.total:.5}",
             )
         output_string += os.linesep
         return output_string
 
+    def interval_metrics(self) -> Dict[str, float]:
+        metrics = {}
+        for action, stats in self.interval_stats.items():
+            metrics[f'profiler/{action}/mean'] = stats.mean
+            metrics[f'profiler/{action}/p90'] = stats.quantile(0.9)
+            metrics[f'profiler/{action}/max'] = stats.max
+        self.interval_stats.clear()
+        return metrics
+
     def describe(self):
         """Logs a profile report after the conclusion of the training run."""
         super().describe()
@@ -176,6 +305,214 @@ class SimpleProfiler(BaseProfiler):
             self.output_file.close()
 
 
+class CUDAEventProfiler(SimpleProfiler):
+    """
+    This profiler records the host duration of actions like the :class:`SimpleProfiler` and, on GPU,
+    the device time between a pair of CUDA events recorded when each action starts and stops.
+    Since GPU kernels run asynchronously, the host duration of e.g. ``model_forward`` mostly measures
+    kernel launches, whereas the device time measures the kernels themselves.
+
+    The events are resolved lazily once the device has passed them, so the profiler does not
+    synchronize with the device on every action. Without a GPU, it behaves like the :class:`SimpleProfiler`.
+    """
+
+    def __init__(
+            self,
+            output_filename: str = None,
+            log_interval_metrics: bool = False,
+            max_pending_events: int = 1000,
+    ):
+        """
+        Params:
+            output_filename (str): optionally save profile results to file instead of printing
+                to std out when training is finished.
+            log_interval_metrics (bool): log the mean, 90th percentile and maximal duration of the
+                actions since the last logged training step to the logger.
+            max_pending_events (int): the number of unresolved event pairs per action, beyond which the
+                oldest pair is waited for to bound the memory.
+        """
+        super().__init__(output_filename=output_filename, log_interval_metrics=log_interval_metrics)
+        self.use_cuda = torch.cuda.is_available()
+        self.max_pending_events = max_pending_events
+        self.current_events = {}
+        self.pending_events = defaultdict(deque)
+        self.recorded_device_stats = defaultdict(DurationStats)
+        self.interval_device_stats = defaultdict(DurationStats)
+
+    def start(self, action_name: str) -> None:
+        super().start(action_name)
+        if self.use_cuda:
+            start_event = torch.cuda.Event(enable_timing=True)
+            start_event.record()
+            self.current_events[action_name] = start_event
+
+    def stop(self, action_name: str) -> None:
+        super().stop(action_name)
+        if not self.use_cuda:
+            return
+        end_event = torch.cuda.Event(enable_timing=True)
+        end_event.record()
+        pending = self.pending_events[action_name]
+        pending.append((self.current_events.pop(action_name), end_event))
+        self._resolve_events(action_name, wait=len(pending) > self.max_pending_events)
+
+    def _resolve_events(self, action_name: str, wait: bool = False) -> None:
+        """Records the device times of the pending events the device has passed, in order."""
+        pending = self.pending_events[action_name]
+        while pending:
+            start_event, end_event = pending[0]
+            if wait:
+                end_event.synchronize()
+                wait = False
+            elif not end_event.query():
+                break
+            pending.popleft()
+            # milliseconds to seconds
+            duration = start_event.elapsed_time(end_event) / 1000
+            self.recorded_device_stats[action_name].add(duration)
+            if self.log_interval_metrics:
+                self.interval_device_stats[action_name].add(duration)
+
+    def _resolve_all_events(self) -> None:
+        for action_name, pending in self.pending_events.items():
+            if pending:
+                pending[-1][1].synchronize()
+                self._resolve_events(action_name)
+
+    def summary(self) -> str:
+        if not self.use_cuda:
+            return super().summary()
+
+        self._resolve_all_events()
+        output_string = "\n\nProfiler Report\n"
+
+        def log_row(action, host_mean, device_mean, device_p90, count, host_total, device_total):
+            return (f"{os.linesep}{action:<20s}\t|  {host_mean:<15}\t|  {device_mean:<15}\t|  {device_p90:<15}"
+                    f"\t|  {count:<9}\t|  {host_total:<15}\t|  {device_total:<15}")
+
+        output_string += log_row("Action", "Mean host (s)", "Mean device (s)", "p90 device (s)", "Num calls",
+                                 "Total host (s)", "Total device (s)")
+        output_string += f"{os.linesep}{'-' * 150}"
+        for action, stats in self.recorded_stats.items():
+            device_stats = self.recorded_device_stats[action]
+            output_string += log_row(
+                action, f"{stats.mean:.5}", f"{device_stats.mean:.5}", f"{device_stats.quantile(0.9):.5}",
+                f"{stats.count}", f"{stats.total:.5}", f"{device_stats.total:.5}",
+            )
+        output_string += os.linesep
+        return output_string
+
+    def interval_metrics(self) -> Dict[str, float]:
+        metrics = super().interval_metrics()
+        for action, stats in self.interval_device_stats.items():
+            metrics[f'profiler/{action}/device_mean'] = stats.mean
+            metrics[f'profiler/{action}/device_max'] = stats.max
+        self.interval_device_stats.clear()
+        return metrics
+
+
+class TraceProfiler(BaseProfiler):
+    """
+    This profiler records when each action starts and how long it takes, together with the thread and
+    the rank it ran on, and exports them in the Chrome trace event format, which can be opened in
+    ``chrome://tracing`` or https://ui.perfetto.dev.
+    Actions running within other actions, like hooks called within ``run_training_batch``, are shown nested
+    on the timeline. The events are kept in a ring buffer, so only the most recent ``max_events`` are exported.
+    """
+
+    def __init__(self, output_filename: str = 'trace.json', max_events: int = 1000000):
+        """
+        Params:
+            output_filename (str): the file the trace is written to when training is finished. Processes
+                other than rank 0 write to the same file name with a ``_rank{rank}`` suffix.
+            max_events (int): the number of most recent events kept in the trace.
+        """
+        self.output_fname = output_filename
+        self.current_actions = {}
+        self.events = deque(maxlen=max_events)
+        # maps the monotonic clock to the wall clock, so the traces of different processes line up
+        self._clock_offset = time.time() - time.perf_counter()
+        super().__init__(output_streams=[log.info])
+
+    def start(self, action_name: str) -> None:
+        key = (threading.get_ident(), action_name)
+        if key in self.current_actions:
+            raise ValueError(
+                f"Attempted to start {action_name} which has already started."
+            )
+        self.current_actions[key] = time.perf_counter()
+
+    def stop(self, action_name: str) -> None:
+        end_time = time.perf_counter()
+        thread_id = threading.get_ident()
+        start_time = self.current_actions.pop((thread_id, action_name), None)
+        if start_time is None:
+            raise ValueError(
+                f"Attempting to stop recording an action ({action_name}) which was never started."
+            )
+        self.events.append((action_name, thread_id, start_time, end_time - start_time))
+
+    @property
+    def rank_filename(self) -> str:
+        """The file the trace of this process is written to."""
+        rank = rank_zero_only.rank
+        if rank == 0:
+            return self.output_fname
+        root, ext = os.path.splitext(self.output_fname)
+        return f'{root}_rank{rank}{ext}'
+
+    def trace_events(self) -> List[dict]:
+        """The recorded events in the Chrome trace event format, with timestamps in microseconds."""
+        rank = rank_zero_only.rank
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': rank, 'args': {'name': f'rank {rank}'}}]
+        for action_name, thread_id, start_time, duration in self.events:
+            events.append({
+                'name': action_name,
+                'ph': 'X',
+                'ts': (start_time + self._clock_offset) * 1e6,
+                'dur': duration * 1e6,
+                'pid': rank,
+                'tid': thread_id,
+            })
+        return events
+
+    def export(self, path: Optional[str] = None) -> str:
+        """Writes the trace of this process to ``path``, by default :attr:`rank_filename`, and returns the path."""
+        path = path or self.rank_filename
+        with open(path, 'w') as fp:
+            json.dump({'traceEvents': self.trace_events(), 'displayTimeUnit': 'ms'}, fp)
+        return path
+
+    def summary(self) -> str:
+        return f"{os.linesep}Chrome trace with {len(self.events)} events written to {self.rank_filename}{os.linesep}"
+
+    def describe(self):
+        """Exports the trace after the conclusion of the training run."""
+        self.export()
+        super().describe()
+
+
+def merge_chrome_traces(paths: List[str], output_path: str) -> str:
+    """
+    Merges the Chrome traces written by the :class:`TraceProfiler` of several processes, e.g. the DDP ranks,
+    into a single trace, in which each rank is shown as a separate process.
+
+    Args:
+        paths: the trace files to merge.
+        output_path: the file the merged trace is written to.
+
+    Return:
+        The path of the merged trace.
+    """
+    events = []
+    for path in paths:
+        with open(path) as fp:
+            events.extend(json.load(fp)['traceEvents'])
+    with open(output_path, 'w') as fp:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, fp)
+    return output_path
+
+
 class AdvancedProfiler(BaseProfiler):
     """
     This profiler uses Python's cProfiler to record more detailed information about
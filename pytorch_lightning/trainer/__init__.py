@@ -208,6 +208,17 @@ Example::
     # default used by the Trainer
     trainer = Trainer(amp_level='O2')
 
+async_checkpoint
+^^^^^^^^^^^^^^^^
+Write checkpoints in a background thread. The state dicts are copied to host memory
+when the checkpoint is requested and the (potentially large) file is written while
+training continues. Pending writes are flushed at the end of training.
+
+.. testcode::
+
+    # default used by the Trainer
+    trainer = Trainer(async_checkpoint=False)
+
 auto_scale_batch_size
 ^^^^^^^^^^^^^^^^^^^^^
 Automatically tries to find the largest batch size that fits into memory,
@@ -501,6 +512,19 @@ Example::
 See Also:
     - `Multi-GPU training guide <multi_gpu.rst>`_
 
+gradient_clip_norm_type
+^^^^^^^^^^^^^^^^^^^^^^^
+The p-norm of all gradients viewed as a single vector which is clipped to ``gradient_clip_val``.
+May be set to 'inf' infinity-norm.
+
+.. testcode::
+
+    # default used by the Trainer
+    trainer = Trainer(gradient_clip_norm_type=2)
+
+    # clip the largest absolute gradient value
+    trainer = Trainer(gradient_clip_val=1.0, gradient_clip_norm_type='inf')
+
 gradient_clip_val
 ^^^^^^^^^^^^^^^^^
 Gradient clipping value
@@ -922,6 +946,23 @@ Enable synchronization between batchnorm layers across all GPUs.
 
     trainer = Trainer(sync_batchnorm=True)
 
+terminate_on_nan
+^^^^^^^^^^^^^^^^
+Raise a ``ValueError`` if the loss or any of the parameters become NaN or +/-inf.
+The checks of all tensors are combined on the device, an int ``N`` only reads them back to the
+host every ``N`` training batches.
+
+.. testcode::
+
+    # default used by the Trainer
+    trainer = Trainer(terminate_on_nan=False)
+
+    # check after every training batch
+    trainer = Trainer(terminate_on_nan=True)
+
+    # check the last 10 training batches at once
+    trainer = Trainer(terminate_on_nan=10)
+
 val_percent_check
 ^^^^^^^^^^^^^^^^^
 
@@ -951,6 +992,20 @@ track_grad_norm
     # track the 2-norm
     trainer = Trainer(track_grad_norm=2)
 
+track_grad_norm_depth
+^^^^^^^^^^^^^^^^^^^^^
+
+Combines the tracked gradient norms per module, given by the first components of the parameter names.
+Keeps the number of logged values small for models with many parameters.
+
+.. testcode::
+
+    # default used by the Trainer, one norm per parameter
+    trainer = Trainer(track_grad_norm_depth=None)
+
+    # one 2-norm per child module of the LightningModule
+    trainer = Trainer(track_grad_norm=2, track_grad_norm_depth=1)
+
 limit_train_batches
 ^^^^^^^^^^^^^^^^^^^
 
@@ -14,10 +14,22 @@
 
 from abc import ABC
 from copy import deepcopy
-from typing import Callable, List
+from inspect import isfunction
+from typing import Callable, Dict, List, Optional
 
 from pytorch_lightning.callbacks import Callback
 
+# all hooks a callback can implement
+CALLBACK_HOOKS = tuple(name for name, attr in vars(Callback).items() if isfunction(attr) and not name.startswith('_'))
+
+
+def _overrides_hook(callback: Callback, hook_name: str) -> bool:
+    if hook_name in getattr(callback, '__dict__', ()):
+        return True
+    hook = getattr(type(callback), hook_name, None)
+    # keep the callback if in doubt, e.g. for mocks
+    return getattr(hook, '__code__', None) is not getattr(Callback, hook_name).__code__
+
 
 class TrainerCallbackHookMixin(ABC):
 
@@ -25,15 +37,28 @@ class TrainerCallbackHookMixin(ABC):
     # the proper values/initialisation should be done in child class
     callbacks: List[Callback] = []
     get_model: Callable
+    _callback_hook_table: Optional[Dict[str, List[Callback]]] = None
+
+    def build_callback_hook_table(self):
+        """Lists the callbacks which override each hook, so the hooks skip the other callbacks."""
+        self._callback_hook_table = {
+            hook_name: [callback for callback in self.callbacks if _overrides_hook(callback, hook_name)]
+            for hook_name in CALLBACK_HOOKS
+        }
+
+    def _callbacks_with_hook(self, hook_name: str) -> List[Callback]:
+        if self._callback_hook_table is None:
+            return self.callbacks
+        return self._callback_hook_table[hook_name]
 
     def setup(self, stage: str):
         """Called in the beginning of fit and test"""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('setup'):
             callback.setup(self, self.get_model(), stage)
 
     def teardown(self, stage: str):
         """Called at the end of fit and test"""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('teardown'):
             callback.teardown(self, self.get_model(), stage)
 
     def on_init_start(self):
@@ -48,153 +73,153 @@ class TrainerCallbackHookMixin(ABC):
 
     def on_fit_start(self, model):
         """Called when the trainer initialization begins, model has not yet been set."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_fit_start'):
             callback.on_fit_start(self, model)
 
     def on_fit_end(self):
         """Called when the trainer initialization begins, model has not yet been set."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_fit_end'):
             callback.on_fit_end(self, self.get_model())
 
     def on_sanity_check_start(self):
         """Called when the validation sanity check starts."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_sanity_check_start'):
             callback.on_sanity_check_start(self, self.get_model())
 
     def on_sanity_check_end(self):
         """Called when the validation sanity check ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_sanity_check_end'):
             callback.on_sanity_check_end(self, self.get_model())
 
     def on_train_epoch_start(self):
         """Called when the epoch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_train_epoch_start'):
             callback.on_train_epoch_start(self, self.get_model())
 
     def on_train_epoch_end(self):
         """Called when the epoch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_train_epoch_end'):
             callback.on_train_epoch_end(self, self.get_model())
 
     def on_validation_epoch_start(self):
         """Called when the epoch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_validation_epoch_start'):
             callback.on_validation_epoch_start(self, self.get_model())
 
     def on_validation_epoch_end(self):
         """Called when the epoch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_validation_epoch_end'):
             callback.on_validation_epoch_end(self, self.get_model())
 
     def on_test_epoch_start(self):
         """Called when the epoch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_test_epoch_start'):
             callback.on_test_epoch_start(self, self.get_model())
 
     def on_test_epoch_end(self):
         """Called when the epoch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_test_epoch_end'):
             callback.on_test_epoch_end(self, self.get_model())
 
     def on_epoch_start(self):
         """Called when the epoch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_epoch_start'):
             callback.on_epoch_start(self, self.get_model())
 
     def on_epoch_end(self):
         """Called when the epoch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_epoch_end'):
             callback.on_epoch_end(self, self.get_model())
 
     def on_train_start(self):
         """Called when the train begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_train_start'):
             callback.on_train_start(self, self.get_model())
 
     def on_train_end(self):
         """Called when the train ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_train_end'):
             callback.on_train_end(self, self.get_model())
 
     def on_pretrain_routine_start(self, model):
         """Called when the train begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_pretrain_routine_start'):
             callback.on_pretrain_routine_start(self, model)
 
     def on_pretrain_routine_end(self, model):
         """Called when the train ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_pretrain_routine_end'):
             callback.on_pretrain_routine_end(self, model)
 
     def on_batch_start(self):
         """Called when the training batch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_batch_start'):
             callback.on_batch_start(self, self.get_model())
 
     def on_batch_end(self):
         """Called when the training batch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_batch_end'):
             callback.on_batch_end(self, self.get_model())
 
     def on_train_batch_start(self, batch, batch_idx, dataloader_idx):
         """Called when the training batch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_train_batch_start'):
             callback.on_train_batch_start(self, self.get_model(), batch, batch_idx, dataloader_idx)
 
     def on_train_batch_end(self, batch, batch_idx, dataloader_idx):
         """Called when the training batch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_train_batch_end'):
             callback.on_train_batch_end(self, self.get_model(), batch, batch_idx, dataloader_idx)
 
     def on_validation_batch_start(self, batch, batch_idx, dataloader_idx):
         """Called when the validation batch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_validation_batch_start'):
             callback.on_validation_batch_start(self, self.get_model(), batch, batch_idx, dataloader_idx)
 
     def on_validation_batch_end(self, batch, batch_idx, dataloader_idx):
         """Called when the validation batch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_validation_batch_end'):
             callback.on_validation_batch_end(self, self.get_model(), batch, batch_idx, dataloader_idx)
 
     def on_test_batch_start(self, batch, batch_idx, dataloader_idx):
         """Called when the test batch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_test_batch_start'):
             callback.on_test_batch_start(self, self.get_model(), batch, batch_idx, dataloader_idx)
 
     def on_test_batch_end(self, batch, batch_idx, dataloader_idx):
         """Called when the test batch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_test_batch_end'):
             callback.on_test_batch_end(self, self.get_model(), batch, batch_idx, dataloader_idx)
 
     def on_validation_start(self):
         """Called when the validation loop begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_validation_start'):
             callback.on_validation_start(self, self.get_model())
 
     def on_validation_end(self):
         """Called when the validation loop ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_validation_end'):
             callback.on_validation_end(self, self.get_model())
 
     def on_test_start(self):
         """Called when the test begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_test_start'):
             callback.on_test_start(self, self.get_model())
 
     def on_test_end(self):
         """Called when the test ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_test_end'):
             callback.on_test_end(self, self.get_model())
 
     def on_keyboard_interrupt(self):
         """Called when the training is interrupted by KeyboardInterrupt."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_keyboard_interrupt'):
             callback.on_keyboard_interrupt(self, self.get_model())
 
     def on_save_checkpoint(self):
         """Called when saving a model checkpoint."""
         callback_states = {}
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_save_checkpoint'):
             callback_class = type(callback)
             state = callback.on_save_checkpoint(self, self.get_model())
             if state:
@@ -204,7 +229,7 @@ class TrainerCallbackHookMixin(ABC):
     def on_load_checkpoint(self, checkpoint):
         """Called when loading a model checkpoint."""
         callback_states = checkpoint.get('callbacks')
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook('on_load_checkpoint'):
             state = callback_states.get(type(callback))
             if state:
                 state = deepcopy(state)
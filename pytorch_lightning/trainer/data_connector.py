@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
+
 from pytorch_lightning.core.datamodule import LightningDataModule
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
-from typing import List, Union
+from typing import List, Optional, Union
 from torch.utils.data import DataLoader
 from pytorch_lightning.utilities.model_utils import is_overridden
 
@@ -23,14 +25,36 @@ class DataConnector(object):
 
     def __init__(self, trainer):
         self.trainer = trainer
+        # seconds spent waiting for train batches, read by the DataLoaderMonitor
+        self.train_data_wait_time = 0.0
+        self.train_data_iterator = None
 
     def get_profiled_train_dataloader(self, train_dataloader):
         profiled_dl = self.trainer.profiler.profile_iterable(
-            enumerate(self._with_is_last(train_dataloader)),
+            enumerate(self._with_is_last(self._with_wait_time(train_dataloader))),
             "get_train_batch"
         )
         return profiled_dl
 
+    def _with_wait_time(self, iterable):
+        """Pass through values from the given iterable, adding up the time spent waiting for them."""
+        it = self.train_data_iterator = iter(iterable)
+        while True:
+            start_time = time.perf_counter()
+            try:
+                val = next(it)
+            except StopIteration:
+                return
+            finally:
+                self.train_data_wait_time += time.perf_counter() - start_time
+            yield val
+
+    @property
+    def train_ready_batches(self) -> Optional[int]:
+        """The number of train batches the dataloader workers loaded and which wait to be consumed,
+        ``None`` if the batches are not loaded by worker processes."""
+        return _ready_worker_batches(self.train_data_iterator)
+
     def _with_is_last(self, iterable):
         """Pass through values from the given iterable with an added boolean indicating if this is the last item.
         See `https://stackoverflow.com/a/1630350 <https://stackoverflow.com/a/1630350>`_"""
@@ -116,6 +140,19 @@ class DataConnector(object):
             self.trainer.datamodule = datamodule
 
 
+def _ready_worker_batches(iterator) -> Optional[int]:
+    """The number of batches loaded by the workers of a ``DataLoader`` iterator and not consumed yet, i.e. the
+    batches in its data queue and those which arrived out of order. This relies on private attributes of the
+    multiprocessing iterator of ``torch.utils.data``, anything unexpected is treated as unknown."""
+    try:
+        queued = iterator._data_queue.qsize()
+        out_of_order = sum(1 for info in list(iterator._task_info.values()) if len(info) == 2)
+    except (AttributeError, NotImplementedError, TypeError):
+        # no worker processes, or `qsize` is not implemented on this platform
+        return None
+    return queued + out_of_order
+
+
 class _PatchDataLoader(object):
     r"""
     Callable object for patching dataloaders passed into trainer.fit().
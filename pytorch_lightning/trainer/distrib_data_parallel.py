@@ -407,6 +407,7 @@ class TrainerDDPMixin(ABC):
         if self.is_global_zero:
             path = os.path.join(self.default_root_dir, '__temp_weight_distributed_end.ckpt')
             self.save_checkpoint(path)
+            self.checkpoint_writer.flush()
             return path
 
     def load_spawn_weights(self, original_model):
@@ -1,5 +1,9 @@
-from pytorch_lightning.trainer.supporters import PredictionCollection
-from pytorch_lightning.core.step_result import Result, EvalResult
+import torch.distributed as torch_distrib
+from torch.utils.data.distributed import DistributedSampler
+
+from pytorch_lightning.trainer.supporters import PredictionCollection, merge_columnar_predictions
+from pytorch_lightning.core.step_result import EpochResultBuffer, Result, EvalResult
+from pytorch_lightning.utilities import rank_zero_warn
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.model_utils import is_overridden
 
@@ -70,9 +74,21 @@ class EvaluationLoop(object):
 
     def is_using_eval_results(self):
         outputs = self.outputs
+        if len(outputs) > 0 and isinstance(outputs[0], EpochResultBuffer):
+            return issubclass(outputs[0].result_cls, EvalResult)
         using_eval_result = len(outputs) > 0 and len(outputs[0]) > 0 and isinstance(outputs[0][0], EvalResult)
         return using_eval_result
 
+    def track_epoch_end_output(self, dl_outputs, output):
+        """Adds the output of a step to the outputs of the dataloader and returns them. Results are written
+        into a buffer, which gathers or reduces them at the end of the epoch. Without an epoch end method,
+        the results are reduced as they arrive."""
+        if isinstance(output, EvalResult) and not dl_outputs:
+            epoch_end_name = 'test_epoch_end' if self.testing else 'validation_epoch_end'
+            dl_outputs = EpochResultBuffer(streaming=not is_overridden(epoch_end_name, model=self.trainer.get_model()))
+        dl_outputs.append(output)
+        return dl_outputs
+
     def setup(self, model, max_batches, dataloaders):
         # copy properties for forward overrides
         self.trainer.model_connector.copy_trainer_model_properties(model)
@@ -188,7 +204,7 @@ class EvaluationLoop(object):
     def __gather_epoch_end_eval_results(self, outputs):
         eval_results = []
         for epoch_output in outputs:
-            result = epoch_output[0].__class__.gather(epoch_output)
+            result = epoch_output.gather()
             if 'checkpoint_on' in result:
                 result.checkpoint_on = result.checkpoint_on.mean()
             if 'early_stop_on' in result:
@@ -205,8 +221,7 @@ class EvaluationLoop(object):
         # outputs has a list of results per dataloader
         eval_results = []
         for dl_output in outputs:
-            result = dl_output[0]
-            result = result.__class__.reduce_on_epoch_end(dl_output)
+            result = dl_output.reduce_on_epoch_end()
             if 'checkpoint_on' in result:
                 result.checkpoint_on = result.checkpoint_on.mean()
             if 'early_stop_on' in result:
@@ -237,6 +252,31 @@ class EvaluationLoop(object):
         # track debug metrics
         self.trainer.dev_debugger.track_eval_loss_history(self.testing, batch_idx, dataloader_idx, output)
 
+    def predictions_to_disk(self, dataloaders):
+        streamed_paths = list(self.predictions.writers)
+        self.predictions.to_disk()
+        if not streamed_paths or self.trainer.world_size == 1:
+            return
+
+        # the rows of each rank can only be put back into dataset order if we know how the sampler distributed them
+        samplers = [getattr(dataloader, 'sampler', None) for dataloader in dataloaders]
+        sampler = samplers[0]
+        if len(samplers) != 1 or not isinstance(sampler, DistributedSampler) or getattr(sampler, 'shuffle', False):
+            rank_zero_warn(
+                'The streamed predictions of the ranks are only merged for a single dataloader with a'
+                ' `DistributedSampler` without shuffling. Call `merge_columnar_predictions` with an'
+                ' `index_column` to merge them.'
+            )
+            return
+
+        # all shards have to be written before rank 0 merges them
+        if torch_distrib.is_available() and torch_distrib.is_initialized():
+            torch_distrib.barrier()
+        self.trainer.barrier('predictions_to_disk')
+        if self.trainer.global_rank == 0:
+            for path in streamed_paths:
+                merge_columnar_predictions(path, sampler.num_replicas, num_samples=len(sampler.dataset))
+
     def on_evaluation_epoch_end(self, *args, **kwargs):
         # call the callback hook
         if self.testing:
@@ -258,7 +298,7 @@ class EvaluationLoop(object):
                 for k, v in step_log_metrics.items():
                     metrics_by_epoch[f'{k}/epoch_{self.trainer.current_epoch}'] = v
 
-                self.trainer.logger_connector.log_metrics(metrics_by_epoch, {}, step=batch_idx)
+                self.trainer.logger_connector.log_metrics(metrics_by_epoch, {}, step=batch_idx, defer=True)
 
             if len(step_pbar_metrics) > 0:
-                self.trainer.logger_connector.add_progress_bar_metrics(step_pbar_metrics)
+                self.trainer.logger_connector.add_progress_bar_metrics(step_pbar_metrics, defer=True)
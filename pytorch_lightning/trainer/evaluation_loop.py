@@ -240,7 +240,7 @@ class TrainerEvaluationLoopMixin(ABC):
 
                 # track epoch level metrics
                 if output is not None:
-                    dl_outputs.append(output)
+                    dl_outputs = self.evaluation_loop.track_epoch_end_output(dl_outputs, output)
 
             self.evaluation_loop.outputs.append(dl_outputs)
 
@@ -249,7 +249,7 @@ class TrainerEvaluationLoopMixin(ABC):
 
         # bookkeeping
         eval_loop_results = self.evaluation_loop.log_epoch_metrics(eval_results, test_mode)
-        self.evaluation_loop.predictions.to_disk()
+        self.evaluation_loop.predictions_to_disk(dataloaders)
 
         # hook
         self.evaluation_loop.on_evaluation_epoch_end()
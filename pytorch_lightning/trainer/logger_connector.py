@@ -15,7 +15,8 @@ import torch
 from pytorch_lightning.core import memory
 from pytorch_lightning.utilities import flatten_dict
 from pytorch_lightning.utilities.model_utils import is_overridden
-from pytorch_lightning.core.step_result import EvalResult, Result
+from pytorch_lightning.core.step_result import EpochResultBuffer, EvalResult, Result
+from pytorch_lightning.trainer.supporters import DeferredScalars
 from pprint import pprint
 
 
@@ -26,8 +27,10 @@ class LoggerConnector:
         self.callback_metrics = {}
         self.logged_metrics = {}
         self.progress_bar_metrics = {}
+        self._deferred_log_metrics = None
+        self._deferred_pbar_metrics = None
 
-    def log_metrics(self, metrics, grad_norm_dic, step=None):
+    def log_metrics(self, metrics, grad_norm_dic, step=None, defer=False):
         """Logs the metric dict passed in.
         If `step` parameter is None and `step` key is presented is metrics,
         uses metrics["step"] as a step
@@ -36,6 +39,8 @@ class LoggerConnector:
             metrics (dict): Metric values
             grad_norm_dic (dict): Gradient norms
             step (int): Step for which metrics should be logged. Default value corresponds to `self.global_step`
+            defer (bool): Hand the metrics to the loggers with the next call (or :meth:`flush_deferred_metrics`)
+                when they live on the GPU, so logging doesn't wait for the device
         """
         # add gpu memory
         if self.trainer.on_gpu and self.trainer.log_gpu_memory:
@@ -45,36 +50,65 @@ class LoggerConnector:
         # add norms
         metrics.update(grad_norm_dic)
 
-        # turn all tensors to scalars
-        scalar_metrics = self.trainer.metrics_to_scalars(metrics)
+        # the metrics deferred by the previous call go first
+        self._flush_deferred_log_metrics()
 
+        # turn all tensors to scalars, copying them from the device without blocking
+        scalar_metrics = DeferredScalars(metrics)
+        if defer and scalar_metrics.is_async and 'step' not in metrics:
+            self._deferred_log_metrics = (scalar_metrics, step, self.trainer.current_epoch, self.trainer.global_step)
+        else:
+            self._log_scalar_metrics(scalar_metrics.resolve(), step, self.trainer.current_epoch,
+                                     self.trainer.global_step)
+
+    def _log_scalar_metrics(self, scalar_metrics, step, current_epoch, global_step):
         if "step" in scalar_metrics and step is None:
             step = scalar_metrics.pop("step")
 
         elif step is None:
             # added metrics by Lightning for convenience
-            scalar_metrics['epoch'] = self.trainer.current_epoch
-            step = step if step is not None else self.trainer.global_step
+            scalar_metrics['epoch'] = current_epoch
+            step = step if step is not None else global_step
 
         # log actual metrics
         if self.trainer.is_global_zero and self.trainer.logger is not None:
+            # written to disk according to the logger's flush policy
             self.trainer.logger.agg_and_log_metrics(scalar_metrics, step=step)
-            self.trainer.logger.save()
 
             # track the logged metrics
             self.logged_metrics = scalar_metrics
             self.trainer.dev_debugger.track_logged_metrics_history(scalar_metrics)
 
-    def add_progress_bar_metrics(self, metrics):
-        for k, v in metrics.items():
-            if isinstance(v, torch.Tensor):
-                v = v.item()
+    def add_progress_bar_metrics(self, metrics, defer=False):
+        self._flush_deferred_pbar_metrics()
 
-            self.progress_bar_metrics[k] = v
+        scalar_metrics = DeferredScalars(metrics)
+        if defer and scalar_metrics.is_async:
+            self._deferred_pbar_metrics = scalar_metrics
+        else:
+            self.progress_bar_metrics.update(scalar_metrics.resolve())
 
         self.trainer.dev_debugger.track_pbar_metrics_history(metrics)
 
+    def flush_deferred_metrics(self):
+        """Hands metrics which are still being copied from the device to the loggers and progress bar."""
+        self._flush_deferred_log_metrics()
+        self._flush_deferred_pbar_metrics()
+
+    def _flush_deferred_log_metrics(self):
+        if self._deferred_log_metrics is not None:
+            scalar_metrics, step, current_epoch, global_step = self._deferred_log_metrics
+            self._deferred_log_metrics = None
+            self._log_scalar_metrics(scalar_metrics.resolve(), step, current_epoch, global_step)
+
+    def _flush_deferred_pbar_metrics(self):
+        if self._deferred_pbar_metrics is not None:
+            scalar_metrics, self._deferred_pbar_metrics = self._deferred_pbar_metrics, None
+            self.progress_bar_metrics.update(scalar_metrics.resolve())
+
     def on_evaluation_epoch_end(self, eval_results, using_eval_result, test_mode):
+        self.flush_deferred_metrics()
+
         # TODO: merge both functions?
         self._log_on_evaluation_epoch_end_metrics(eval_results, using_eval_result)
         return self.__log_evaluation_epoch_metrics_2(eval_results, test_mode)
@@ -141,6 +175,8 @@ class LoggerConnector:
                 if len(dataloader_result_metrics) > 0:
                     eval_loop_results.append(dataloader_result_metrics)
 
+            self.save_loggers()
+
         # log results of test
         if test_mode and self.trainer.is_global_zero and self.trainer.verbose_test:
             print('-' * 80)
@@ -152,6 +188,7 @@ class LoggerConnector:
         return eval_loop_results
 
     def on_train_epoch_end(self, epoch_output, checkpoint_accumulator, early_stopping_accumulator, num_optimizers):
+        self.flush_deferred_metrics()
         self.log_train_epoch_end_metrics(epoch_output, checkpoint_accumulator,
                                          early_stopping_accumulator, num_optimizers)
 
@@ -186,8 +223,11 @@ class LoggerConnector:
         opt_idx_outputs = epoch_output[0]
 
         try:
-            sample_obj = opt_idx_outputs[0][0] if isinstance(opt_idx_outputs[0], list) else opt_idx_outputs[0]
-            is_result_obj = len(epoch_output) > 0 and isinstance(sample_obj, Result)
+            if isinstance(opt_idx_outputs, EpochResultBuffer):
+                is_result_obj = True
+            else:
+                sample_obj = opt_idx_outputs[0][0] if isinstance(opt_idx_outputs[0], list) else opt_idx_outputs[0]
+                is_result_obj = len(epoch_output) > 0 and isinstance(sample_obj, Result)
         except IndexError as e:
             is_result_obj = False
 
@@ -237,19 +277,23 @@ class LoggerConnector:
         if len(epoch_progress_bar_metrics) > 0:
             self.add_progress_bar_metrics(epoch_progress_bar_metrics)
 
+        self.save_loggers()
+
+    def save_loggers(self):
+        """Writes everything logged so far to disk, regardless of the logger's flush policy."""
+        if self.trainer.is_global_zero and self.trainer.logger is not None:
+            self.trainer.logger.flush(force=True)
+
     def __auto_reduce_results_on_epoch_end(self, epoch_output):
         epoch_log_metrics = {}
         epoch_progress_bar_metrics = {}
         for opt_outputs in epoch_output:
-            # reduce across time first
-            time_reduced_outputs = []
-            for train_step_idx in range(len(opt_outputs)):
-                tbptt_outs = opt_outputs[train_step_idx]
-                tbptt_outs = tbptt_outs[0].__class__.reduce_across_time(tbptt_outs)
-                time_reduced_outputs.append(tbptt_outs)
+            # the training loop reduced the results across time and collected them in a buffer
+            if not isinstance(opt_outputs, EpochResultBuffer) or not len(opt_outputs):
+                continue
 
             # reduce across training steps
-            opt_outputs = time_reduced_outputs[0].__class__.reduce_on_epoch_end(time_reduced_outputs)
+            opt_outputs = opt_outputs.reduce_on_epoch_end()
             opt_outputs.minimize = opt_outputs.minimize.mean()
             epoch_log_metrics.update(opt_outputs.epoch_log_metrics)
             epoch_progress_bar_metrics.update(opt_outputs.epoch_pbar_metrics)
@@ -287,5 +331,9 @@ class LoggerConnector:
             # logs user requested information to logger
             metrics = batch_output.batch_log_metrics
             grad_norm_dic = batch_output.grad_norm_dic
+            # durations of the profiled actions since the last logged step
+            profiler_metrics = self.trainer.profiler.interval_metrics()
+            if profiler_metrics:
+                metrics = {**metrics, **profiler_metrics}
             if len(metrics) > 0 or len(grad_norm_dic) > 0:
-                self.log_metrics(metrics, grad_norm_dic)
+                self.log_metrics(metrics, grad_norm_dic, defer=True)
@@ -25,7 +25,7 @@ class LRSchedulerConnector:
 
         Args:
             interval: either 'epoch' or 'step'.
-            monitor_metrics: dict of possible values to monitor
+            monitor_metrics: mapping of possible values to monitor, only read when a scheduler steps
         """
         if not self.trainer.lr_schedulers:
             return
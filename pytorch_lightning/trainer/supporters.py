@@ -12,9 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import os
+import pickle
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
+import numpy as np
 import torch
 from torch import Tensor
 
@@ -108,23 +112,103 @@ class Accumulator(object):
         return self.total / self.num_values
 
 
+class DeferredScalars(object):
+    """Converts the tensors of a (nested) metrics dict to Python scalars without blocking the device.
+
+    All scalar CUDA tensors are stacked per device and dtype and copied into pinned host memory
+    with a single non-blocking transfer each. :meth:`resolve` waits for these copies only, which
+    usually finished long ago if it is called one step later. Other values are converted on
+    :meth:`resolve` like :meth:`~pytorch_lightning.trainer.logging.TrainerLoggingMixin.metrics_to_scalars`.
+
+    Examples:
+        >>> scalars = DeferredScalars({'a': torch.tensor(1.5), 'b': {'c': torch.tensor(2)}, 'd': 'text'})
+        >>> scalars.is_async
+        False
+        >>> scalars.resolve()
+        {'a': 1.5, 'b': {'c': 2}, 'd': 'text'}
+    """
+
+    def __init__(self, metrics: dict):
+        self._slots = {}
+        self._host_values = {}
+        self._event = None
+        self._metrics = self._collect(metrics)
+
+        if self._slots:
+            for key, tensors in self._slots.items():
+                stacked = torch.stack(tensors)
+                host = torch.empty(stacked.shape, dtype=stacked.dtype, pin_memory=True)
+                host.copy_(stacked, non_blocking=True)
+                self._host_values[key] = host
+            self._event = torch.cuda.Event()
+            self._event.record()
+
+    @property
+    def is_async(self) -> bool:
+        """Whether values are still being copied from the device."""
+        return self._event is not None
+
+    def resolve(self) -> dict:
+        """Wait for the transfers of this instance and return the metrics with Python scalars."""
+        if self._event is not None:
+            self._event.synchronize()
+            self._host_values = {key: host.tolist() for key, host in self._host_values.items()}
+            self._event = None
+        return self._convert(self._metrics)
+
+    def _collect(self, metrics: dict) -> dict:
+        collected = {}
+        for k, v in metrics.items():
+            if isinstance(v, dict):
+                v = self._collect(v)
+            elif isinstance(v, Tensor) and v.is_cuda and v.numel() == 1:
+                slots = self._slots.setdefault((v.device, v.dtype), [])
+                slots.append(v.detach().reshape(()))
+                v = _DeferredSlot((v.device, v.dtype), len(slots) - 1)
+            collected[k] = v
+        return collected
+
+    def _convert(self, metrics: dict) -> dict:
+        converted = {}
+        for k, v in metrics.items():
+            if isinstance(v, _DeferredSlot):
+                v = self._host_values[v.key][v.index]
+            elif isinstance(v, Tensor):
+                v = v.item()
+            elif isinstance(v, dict):
+                v = self._convert(v)
+            converted[k] = v
+        return converted
+
+
+class _DeferredSlot(object):
+    __slots__ = ('key', 'index')
+
+    def __init__(self, key, index: int):
+        self.key = key
+        self.index = index
+
+
 class PredictionCollection(object):
 
     def __init__(self, global_rank: int, world_size: int):
         self.global_rank = global_rank
         self.world_size = world_size
         self.predictions = {}
+        self.writers = {}
         self.num_predictions = 0
 
     def _add_prediction(self, name, values, filename):
+        if is_streamed_prediction_path(filename):
+            if filename not in self.writers:
+                self.writers[filename] = ColumnarPredictionWriter(filename, self.global_rank)
+            self.writers[filename].append(name, values)
+            return
+
+        # keep the chunks of each column and concatenate them once when writing to disk
         if filename not in self.predictions:
-            self.predictions[filename] = {name: values}
-        elif name not in self.predictions[filename]:
-            self.predictions[filename][name] = values
-        elif isinstance(values, Tensor):
-            self.predictions[filename][name] = torch.cat((self.predictions[filename][name], values))
-        elif isinstance(values, list):
-            self.predictions[filename][name].extend(values)
+            self.predictions[filename] = {}
+        self.predictions[filename].setdefault(name, []).append(values)
 
     def add(self, predictions):
 
@@ -138,6 +222,10 @@ class PredictionCollection(object):
     def to_disk(self):
         """Write predictions to file(s).
         """
+        for writer in self.writers.values():
+            writer.close()
+        self.writers = {}
+
         for filename, predictions in self.predictions.items():
 
             # Absolute path to defined prediction file. rank added to name if in multi-gpu environment
@@ -147,8 +235,8 @@ class PredictionCollection(object):
             )
             outfile.parent.mkdir(exist_ok=True, parents=True)
 
-            # Convert any tensor values to list
-            predictions = {k: v if not isinstance(v, Tensor) else v.tolist() for k, v in predictions.items()}
+            # Concatenate the chunks of each feature and convert any tensor values to list
+            predictions = {k: self._concat_chunks(chunks) for k, chunks in predictions.items()}
 
             # Check if all features for this file add up to same length
             feature_lens = {k: len(v) for k, v in predictions.items()}
@@ -163,3 +251,259 @@ class PredictionCollection(object):
 
             # Write predictions for current file to disk
             torch.save(outputs, outfile)
+
+    @staticmethod
+    def _concat_chunks(chunks: list) -> list:
+        if all(isinstance(chunk, Tensor) for chunk in chunks):
+            return torch.cat(chunks).tolist()
+        values = []
+        for chunk in chunks:
+            values.extend(chunk.tolist() if isinstance(chunk, Tensor) else chunk)
+        return values
+
+
+def is_streamed_prediction_path(filename: str) -> bool:
+    """Whether the predictions written to ``filename`` are streamed to a directory instead of a single file."""
+    return filename.endswith(('/', os.sep))
+
+
+class ColumnarPredictionWriter(object):
+    """Streams the prediction columns of one rank to a directory as the batches arrive, so the predictions
+    never have to fit into memory.
+
+    Each tensor column is appended to a raw binary file ``{name}_rank_{rank}.bin``, which can be memory-mapped
+    with the dtype and row shape stored in the manifest. Columns of other values are appended to
+    ``{name}_rank_{rank}.pkl`` as one pickled list per batch. When closed, the writer checks that all columns
+    have the same number of rows and writes the manifest ``manifest_rank_{rank}.json``. The shards of several
+    ranks can be merged with :func:`merge_columnar_predictions`.
+
+    Example:
+        >>> import tempfile
+        >>> dirpath = tempfile.mkdtemp()
+        >>> writer = ColumnarPredictionWriter(dirpath, global_rank=0)
+        >>> for batch in range(3):
+        ...     writer.append('preds', torch.arange(2) + 2 * batch)
+        ...     writer.append('ids', [f'id{2 * batch}', f'id{2 * batch + 1}'])
+        >>> writer.close()['num_rows']
+        6
+        >>> predictions = read_columnar_predictions(dirpath)
+        >>> predictions['preds']
+        memmap([0, 1, 2, 3, 4, 5])
+        >>> predictions['ids'][-1]
+        'id5'
+    """
+
+    def __init__(self, dirpath: str, global_rank: int = 0, shard_name: Optional[str] = None):
+        self.dirpath = Path(dirpath).absolute()
+        self.dirpath.mkdir(exist_ok=True, parents=True)
+        self.global_rank = global_rank
+        self.shard_name = shard_name or f'rank_{global_rank}'
+        self.columns = {}
+        self.files = {}
+
+    def append(self, name: str, values: Union[Tensor, np.ndarray, list]) -> None:
+        """Append the values of a batch to the column ``name``."""
+        column = self.columns.get(name)
+        if isinstance(values, (Tensor, np.ndarray)):
+            array = np.atleast_1d(values.detach().cpu().numpy() if isinstance(values, Tensor) else values)
+            if column is None:
+                column = self._open_column(name, 'raw', dtype=array.dtype.str, shape=list(array.shape[1:]))
+            elif column['format'] != 'raw' or column['dtype'] != array.dtype.str \
+                    or column['shape'] != list(array.shape[1:]):
+                raise ValueError(
+                    f'Expected a tensor of dtype {column.get("dtype")} and row shape {column.get("shape")}'
+                    f' for the prediction column {name}.'
+                )
+            self.files[name].write(np.ascontiguousarray(array).tobytes())
+        else:
+            values = list(values)
+            if column is None:
+                column = self._open_column(name, 'pickle')
+            elif column['format'] != 'pickle':
+                raise ValueError(f'Expected a tensor for the prediction column {name}.')
+            pickle.dump(values, self.files[name])
+        column['num_rows'] += len(values)
+
+    def _open_column(self, name: str, fmt: str, **meta) -> dict:
+        suffix = '.bin' if fmt == 'raw' else '.pkl'
+        filename = f'{name}_{self.shard_name}{suffix}'
+        self.files[name] = open(self.dirpath / filename, 'wb')
+        column = self.columns[name] = dict(format=fmt, file=filename, num_rows=0, **meta)
+        return column
+
+    def close(self) -> dict:
+        """Close the column files, write the manifest of this rank and return it."""
+        for f in self.files.values():
+            f.close()
+        self.files = {}
+
+        num_rows = {column['num_rows'] for column in self.columns.values()}
+        if len(num_rows) > 1:
+            raise ValueError('Mismatching feature column lengths found in stored EvalResult predictions.')
+
+        manifest = {'rank': self.global_rank, 'num_rows': num_rows.pop() if num_rows else 0, 'columns': self.columns}
+        with open(self.dirpath / f'manifest_{self.shard_name}.json', 'w') as f:
+            json.dump(manifest, f, indent=2)
+        return manifest
+
+
+def _read_manifest(dirpath: Path, shard_name: str) -> dict:
+    with open(dirpath / f'manifest_{shard_name}.json') as f:
+        return json.load(f)
+
+
+def read_columnar_predictions(dirpath: str, global_rank: int = 0, shard_name: Optional[str] = None) -> dict:
+    """Read the prediction columns streamed to ``dirpath`` by the :class:`ColumnarPredictionWriter` of a rank,
+    or of the shard ``shard_name`` like ``'merged'``.
+    Tensor columns are returned as read-only memory-mapped arrays, other columns as lists."""
+    dirpath = Path(dirpath)
+    manifest = _read_manifest(dirpath, shard_name or f'rank_{global_rank}')
+
+    predictions = {}
+    for name, column in manifest['columns'].items():
+        path = dirpath / column['file']
+        if column['format'] == 'raw':
+            predictions[name] = _memmap_column(path, column)
+        else:
+            predictions[name] = [row for rows in _iter_pickled_chunks(path) for row in rows]
+    return predictions
+
+
+def _memmap_column(path: Path, column: dict) -> np.ndarray:
+    shape = (column['num_rows'], *column['shape'])
+    if not column['num_rows']:
+        # numpy cannot memory-map empty files
+        return np.empty(shape, dtype=column['dtype'])
+    return np.memmap(path, dtype=column['dtype'], mode='r', shape=shape)
+
+
+def _iter_pickled_chunks(path: Path):
+    with open(path, 'rb') as f:
+        while f.peek(1):
+            yield pickle.load(f)
+
+
+class _PredictionShard(object):
+    """Reads the rows of a rank's prediction shard in order, given the dataset index of each row either by the
+    ``index_column`` or, without it, by the order in which a :class:`~torch.utils.data.DistributedSampler`
+    without shuffling distributes the indices to the ranks."""
+
+    def __init__(self, dirpath: Path, rank: int, world_size: int, index_column: Optional[str] = None):
+        self.manifest = _read_manifest(dirpath, f'rank_{rank}')
+        self.rank = rank
+        self.world_size = world_size
+        self.num_rows = self.manifest['num_rows']
+        self.position = 0
+        self.last_read_index = -1
+        self.raw_columns = {}
+        self.pickled_columns = {}
+        for name, column in self.manifest['columns'].items():
+            if column['format'] == 'raw':
+                self.raw_columns[name] = _memmap_column(dirpath / column['file'], column)
+            else:
+                self.pickled_columns[name] = (_iter_pickled_chunks(dirpath / column['file']), [])
+
+        if index_column is not None and self.raw_columns.get(index_column, np.empty((0, 0))).ndim != 1:
+            raise ValueError(f'Expected a flat tensor column {index_column} with the sample indices in every shard.')
+        self.indices = self.raw_columns.get(index_column)
+
+    def last_index(self) -> int:
+        if self.indices is not None:
+            return int(self.indices[-1]) if self.num_rows else -1
+        return (self.num_rows - 1) * self.world_size + self.rank
+
+    def read_until(self, end_index: int):
+        """Reads the rows of the following indices below ``end_index``, returning their indices and columns."""
+        if self.indices is not None:
+            end = int(np.searchsorted(self.indices[self.position:], end_index)) + self.position
+            indices = np.asarray(self.indices[self.position:end])
+            if np.any(indices[1:] < indices[:-1]) or len(indices) and indices[0] < self.last_read_index:
+                raise ValueError(f'The sample indices of rank {self.rank} are not sorted, the shards cannot be merged.')
+            self.last_read_index = end_index
+        else:
+            end = min(max(0, -(-(end_index - self.rank) // self.world_size)), self.num_rows)
+            indices = np.arange(self.position, end) * self.world_size + self.rank
+
+        columns = {name: np.asarray(values[self.position:end]) for name, values in self.raw_columns.items()}
+        for name, (chunks, buffer) in self.pickled_columns.items():
+            while len(buffer) < end - self.position:
+                buffer.extend(next(chunks))
+            columns[name] = buffer[:end - self.position]
+            del buffer[:end - self.position]
+        self.position = end
+        return indices, columns
+
+
+def merge_columnar_predictions(
+        dirpath: str,
+        world_size: int,
+        num_samples: Optional[int] = None,
+        index_column: Optional[str] = None,
+        chunk_size: int = 65536,
+) -> dict:
+    """Merges the prediction shards streamed to ``dirpath`` by the ranks into the shard ``'merged'`` in dataset
+    order, which can be read with ``read_columnar_predictions(dirpath, shard_name='merged')``.
+
+    The rows are merged ``chunk_size`` dataset indices at a time, so the shards are never loaded into memory at once.
+    Rows of the same index, like the samples a :class:`~torch.utils.data.DistributedSampler` repeats to pad all
+    ranks to the same length, are only written once.
+
+    Args:
+        dirpath: the directory the predictions were streamed to.
+        world_size: the number of ranks that wrote a shard.
+        num_samples: the number of samples in the dataset, rows of larger indices are dropped.
+        index_column: a flat tensor column with the dataset index of each row, sorted within each shard.
+            By default, the indices are inferred from the order in which a ``DistributedSampler`` without
+            shuffling distributes the samples, which is what the trainer uses to test.
+        chunk_size: the number of dataset indices merged at a time.
+
+    Return:
+        The manifest of the merged shard.
+
+    Example:
+        >>> import tempfile
+        >>> dirpath = tempfile.mkdtemp()
+        >>> # a DistributedSampler pads 5 samples to 6 by repeating sample 0 on rank 1
+        >>> for rank, indices in enumerate([[0, 2, 4], [1, 3, 0]]):
+        ...     writer = ColumnarPredictionWriter(dirpath, global_rank=rank)
+        ...     writer.append('preds', torch.tensor(indices) * 10)
+        ...     _ = writer.close()
+        >>> merge_columnar_predictions(dirpath, world_size=2, num_samples=5)['num_rows']
+        5
+        >>> read_columnar_predictions(dirpath, shard_name='merged')['preds']
+        memmap([ 0, 10, 20, 30, 40])
+    """
+    dirpath = Path(dirpath)
+    shards = [_PredictionShard(dirpath, rank, world_size, index_column) for rank in range(world_size)]
+    formats = {}
+    for shard in shards:
+        formats.update({name: column['format'] for name, column in shard.manifest['columns'].items()})
+    if any(shard.num_rows and shard.manifest['columns'].keys() != formats.keys() for shard in shards):
+        raise ValueError('The prediction shards of the ranks have different columns and cannot be merged.')
+
+    end_index = max(shard.last_index() for shard in shards) + 1
+    if num_samples is not None:
+        end_index = min(end_index, num_samples)
+
+    writer = ColumnarPredictionWriter(dirpath, shard_name='merged')
+    for chunk_start in range(0, end_index, chunk_size):
+        chunk_end = min(chunk_start + chunk_size, end_index)
+        indices, columns = zip(*[shard.read_until(chunk_end) for shard in shards])
+        indices = np.concatenate(indices)
+
+        # sort the rows of all shards by index and keep the first row of each index
+        order = np.argsort(indices, kind='stable')
+        sorted_indices = indices[order]
+        is_first = np.ones(len(order), dtype=bool)
+        is_first[1:] = sorted_indices[1:] != sorted_indices[:-1]
+        order = order[is_first]
+
+        for name, fmt in formats.items():
+            shard_values = [shard_columns[name] for shard_columns in columns if name in shard_columns]
+            if fmt == 'raw':
+                values = np.concatenate(shard_values)[order]
+            else:
+                rows = [row for values in shard_values for row in values]
+                values = [rows[i] for i in order]
+            writer.append(name, values)
+    return writer.close()
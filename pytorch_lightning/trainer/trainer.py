@@ -49,6 +49,7 @@ from pytorch_lightning.trainer.training_tricks import TrainerTrainingTricksMixin
 from pytorch_lightning.utilities import parsing, rank_zero_info, rank_zero_only, rank_zero_warn, AMPType
 from pytorch_lightning.utilities.debugging import InternalDebugger
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
+from pytorch_lightning.utilities.checkpoint_writer import AsyncCheckpointWriter, CheckpointWriter
 from pytorch_lightning.utilities.cloud_io import get_filesystem
 from pytorch_lightning.trainer.evaluate_loop import EvaluationLoop
 from pytorch_lightning.trainer.data_connector import DataConnector
@@ -59,7 +60,7 @@ from pytorch_lightning.trainer.training_loop import TrainLoop
 from pytorch_lightning.trainer.model_connector import ModelConnector
 from pytorch_lightning import _logger as log
 from pytorch_lightning.tuner.tuning import Tuner
-from pytorch_lightning.utilities.model_utils import is_overridden
+from pytorch_lightning.utilities.model_utils import clear_overridden_cache, is_overridden
 
 # warnings to ignore in trainer
 warnings.filterwarnings(
@@ -200,7 +201,7 @@ class Trainer(
         reload_dataloaders_every_epoch: bool = False,
         auto_lr_find: Union[bool, str] = False,
         replace_sampler_ddp: bool = True,
-        terminate_on_nan: bool = False,
+        terminate_on_nan: Union[bool, int] = False,
         auto_scale_batch_size: Union[str, bool] = False,
         prepare_data_per_node: bool = True,
         amp_backend: str = 'native',
@@ -209,6 +210,9 @@ class Trainer(
         test_percent_check: float = None,  # backward compatible, todo: remove in v0.10.0
         train_percent_check: float = None,  # backward compatible, todo: remove in v0.10.0
         overfit_pct: float = None,  # backward compatible, todo: remove in v1.0.0
+        async_checkpoint: bool = False,
+        gradient_clip_norm_type: Union[int, float, str] = 2,
+        track_grad_norm_depth: Optional[int] = None,
     ):
         r"""
 
@@ -229,6 +233,8 @@ class Trainer(
 
             gradient_clip_val: 0 means don't clip.
 
+            gradient_clip_norm_type: The p-norm of the gradients which is clipped. May be set to 'inf' infinity-norm.
+
             process_position: orders the progress bar when running multiple models on same machine.
 
             num_nodes: number of GPU nodes for distributed training.
@@ -258,6 +264,9 @@ class Trainer(
 
             track_grad_norm: -1 no tracking. Otherwise tracks that p-norm. May be set to 'inf' infinity-norm.
 
+            track_grad_norm_depth: If set, the tracked gradient norms are combined per module given by
+                the first ``track_grad_norm_depth`` components of the parameter names.
+
             check_val_every_n_epoch: Check val every n train epochs.
 
             fast_dev_run: runs 1 batch of train, test and val to find any bugs (ie: a sort of unit test).
@@ -327,6 +336,10 @@ class Trainer(
             resume_from_checkpoint: To resume training from a specific checkpoint pass in the path here.
                 This can be a URL.
 
+            async_checkpoint: If set to True, checkpoints are copied to host memory and written to disk in a
+                background thread, so training doesn't wait for the file to be written. Pending writes are
+                flushed at the end of training.
+
             profiler:  To profile individual steps during training and assist in identifying bottlenecks.
 
             reload_dataloaders_every_epoch: Set to True to reload dataloaders every epoch.
@@ -347,6 +360,7 @@ class Trainer(
 
             terminate_on_nan: If set to True, will terminate training (by raising a `ValueError`) at the
                 end of each training batch, if any of the parameters or the loss are NaN or +/-inf.
+                If set to an int N, the checks of N training batches are read back from the device at once.
 
             auto_scale_batch_size: If set to True, will `initially` run a batch size
                 finder trying to find the largest batch size that fits into memory.
@@ -457,11 +471,21 @@ class Trainer(
         self.sync_batchnorm = sync_batchnorm
 
         self.gradient_clip_val = gradient_clip_val
+        if not isinstance(gradient_clip_norm_type, (int, float)) and gradient_clip_norm_type != 'inf':
+            raise MisconfigurationException(
+                "gradient_clip_norm_type can be an int, a float or 'inf' (infinity norm).")
+        if float(gradient_clip_norm_type) <= 0:
+            raise MisconfigurationException("gradient_clip_norm_type has to be positive.")
+        self.gradient_clip_norm_type = float(gradient_clip_norm_type)
         self.check_val_every_n_epoch = check_val_every_n_epoch
 
         if not isinstance(track_grad_norm, (int, float)) and track_grad_norm != 'inf':
             raise MisconfigurationException("track_grad_norm can be an int, a float or 'inf' (infinity norm).")
         self.track_grad_norm = float(track_grad_norm)
+        if track_grad_norm_depth is not None and (not isinstance(track_grad_norm_depth, int)
+                                                  or track_grad_norm_depth <= 0):
+            raise MisconfigurationException("track_grad_norm_depth has to be a positive int or None.")
+        self.track_grad_norm_depth = track_grad_norm_depth
 
         self.tpu_cores = device_parser.parse_tpu_cores(tpu_cores)
         self.on_tpu = self.tpu_cores is not None
@@ -493,7 +517,11 @@ class Trainer(
 
         self.truncated_bptt_steps = truncated_bptt_steps
         self.resume_from_checkpoint = resume_from_checkpoint
+        self.checkpoint_writer = AsyncCheckpointWriter() if async_checkpoint else CheckpointWriter()
+        if terminate_on_nan < 0:
+            raise MisconfigurationException("terminate_on_nan has to be a bool or a non-negative int.")
         self.terminate_on_nan = terminate_on_nan
+        self._nan_flags = []
         self.shown_warnings = set()
 
         self.fast_dev_run = fast_dev_run
@@ -783,6 +811,9 @@ class Trainer(
                 # if only two args (str, bool)
                 elif len(arg_types) == 2 and set(arg_types) == {str, bool}:
                     use_type = parsing.str_to_bool_or_str
+                # if only two args (int, bool)
+                elif len(arg_types) == 2 and set(arg_types) == {int, bool}:
+                    use_type = parsing.str_to_bool_or_int
                 else:
                     # filter out the bool as we need to use more general
                     use_type = [at for at in arg_types if at is not bool][0]
@@ -797,8 +828,8 @@ class Trainer(
             if len(arg_types) == 2 and int in set(arg_types) and float in set(arg_types):
                 use_type = Trainer._int_or_float_type
 
-            # hack for track_grad_norm
-            if arg == 'track_grad_norm':
+            # hack for track_grad_norm and gradient_clip_norm_type
+            if arg in ('track_grad_norm', 'gradient_clip_norm_type'):
                 use_type = float
 
             parser.add_argument(
@@ -1059,6 +1090,10 @@ class Trainer(
         return results or 1
 
     def setup_fit(self, model, train_dataloader, val_dataloaders, datamodule):
+        # pick up methods replaced on the classes since the last run
+        clear_overridden_cache()
+        self.build_callback_hook_table()
+
         # bind logger and other properties
         self.model_connector.copy_trainer_model_properties(model)
 
@@ -1066,6 +1101,9 @@ class Trainer(
         if hasattr(model, 'hparams'):
             parsing.clean_namespace(model.hparams)
 
+        # don't check the nan flags left from a previous run
+        self._nan_flags = []
+
         # links data to the trainer
         self.data_connector.attach_data(model, train_dataloader, val_dataloaders, datamodule)
 
@@ -1097,6 +1135,9 @@ class Trainer(
 
         # log hyper-parameters
         if self.logger is not None:
+            # during training, write logs to disk every `log_save_interval` steps
+            self.logger.update_flush_policy(every_n_steps=self.log_save_interval)
+
             # save exp to get started
             self.logger.log_hyperparams(ref_model.hparams)
             self.logger.log_graph(ref_model)
@@ -1209,6 +1250,12 @@ class Trainer(
                 # hook
                 self.train_loop.on_train_end()
 
+        except Exception:
+            # keep what was logged until the crash
+            self.logger_connector.flush_deferred_metrics()
+            self.logger_connector.save_loggers()
+            raise
+
     def run_test(self):
         # only load test dataloader for testing
         # self.reset_test_dataloader(ref_model)
@@ -1344,6 +1391,10 @@ class Trainer(
                 'You cannot pass test_dataloaders to trainer.test if you supply a datamodule'
             )
 
+        # pick up methods replaced on the classes since the last run
+        clear_overridden_cache()
+        self.build_callback_hook_table()
+
         # Attach datamodule to get setup/prepare_data added to model before the call to it below
         self.data_connector.attach_datamodule(model or self.get_model(), datamodule, 'test')
 
@@ -1445,28 +1496,34 @@ class Trainer(
         self._setup_amp_backend(amp_type)
 
     def call_hook(self, hook_name, *args, **kwargs):
+        # the default profiler records nothing, skip entering its context on every hook
+        if isinstance(self.profiler, PassThroughProfiler):
+            return self._call_hook(hook_name, *args, **kwargs)
+
         # always profile hooks
         with self.profiler.profile(hook_name):
-
-            # first call trainer hook
-            if hasattr(self, hook_name):
-                trainer_hook = getattr(self, hook_name)
-                trainer_hook(*args, **kwargs)
-
-            # next call hook in lightningModule
-            output = None
-            model_ref = self.get_model()
-            if is_overridden(hook_name, model_ref):
-                hook_fx = getattr(model_ref, hook_name)
-                output = hook_fx(*args, **kwargs)
-
-            # if the PL module doesn't have the hook then call the accelator
-            # used to auto-reduce things for the user with Results obj
-            elif hasattr(self.accelerator_backend, hook_name):
-                accelerator_hook = getattr(self.accelerator_backend, hook_name)
-                output = accelerator_hook(*args, **kwargs)
-
-            return output
+            return self._call_hook(hook_name, *args, **kwargs)
+
+    def _call_hook(self, hook_name, *args, **kwargs):
+        # first call trainer hook
+        if hasattr(self, hook_name):
+            trainer_hook = getattr(self, hook_name)
+            trainer_hook(*args, **kwargs)
+
+        # next call hook in lightningModule
+        output = None
+        model_ref = self.get_model()
+        if is_overridden(hook_name, model_ref):
+            hook_fx = getattr(model_ref, hook_name)
+            output = hook_fx(*args, **kwargs)
+
+        # if the PL module doesn't have the hook then call the accelator
+        # used to auto-reduce things for the user with Results obj
+        elif hasattr(self.accelerator_backend, hook_name):
+            accelerator_hook = getattr(self.accelerator_backend, hook_name)
+            output = accelerator_hook(*args, **kwargs)
+
+        return output
 
 
 def _determine_batch_limits(batches: Union[int, float], name: str) -> Union[int, float]:
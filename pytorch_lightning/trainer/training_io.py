@@ -114,6 +114,7 @@ from pytorch_lightning.core.lightning import LightningModule
 from pytorch_lightning.loggers import LightningLoggerBase
 from pytorch_lightning.overrides.data_parallel import LightningDataParallel, LightningDistributedDataParallel
 from pytorch_lightning.utilities import AMPType, rank_zero_warn
+from pytorch_lightning.utilities.checkpoint_writer import CheckpointWriter
 from pytorch_lightning.utilities.cloud_io import atomic_save, get_filesystem
 from pytorch_lightning.utilities.cloud_io import load as pl_load
 from pytorch_lightning.utilities.upgrade_checkpoint import KEYS_MAPPING as DEPRECATED_CHECKPOINT_KEYS
@@ -171,6 +172,7 @@ class TrainerIOMixin(ABC):
     scaler: ...
     use_tpu: bool
     amp_backend: AMPType
+    checkpoint_writer: CheckpointWriter
 
     def get_model(self):
         is_dp_module = isinstance(self.model, (LightningDistributedDataParallel, LightningDataParallel))
@@ -273,16 +275,20 @@ class TrainerIOMixin(ABC):
         checkpoint = self.dump_checkpoint(weights_only)
 
         if self.is_global_zero:
-            # do the actual save
-            try:
-                atomic_save(checkpoint, filepath)
-            except AttributeError as err:
-                if LightningModule.CHECKPOINT_HYPER_PARAMS_KEY in checkpoint:
-                    del checkpoint[LightningModule.CHECKPOINT_HYPER_PARAMS_KEY]
-                rank_zero_warn(
-                    'Warning, `module_arguments` dropped from checkpoint.' f' An attribute is not picklable {err}'
-                )
-                atomic_save(checkpoint, filepath)
+            # do the actual save, possibly in the background
+            self.checkpoint_writer.save(checkpoint, filepath, save_fn=self._atomic_save_checkpoint)
+
+    @staticmethod
+    def _atomic_save_checkpoint(checkpoint: dict, filepath: str):
+        try:
+            atomic_save(checkpoint, filepath)
+        except AttributeError as err:
+            if LightningModule.CHECKPOINT_HYPER_PARAMS_KEY in checkpoint:
+                del checkpoint[LightningModule.CHECKPOINT_HYPER_PARAMS_KEY]
+            rank_zero_warn(
+                'Warning, `module_arguments` dropped from checkpoint.' f' An attribute is not picklable {err}'
+            )
+            atomic_save(checkpoint, filepath)
 
     def restore(self, checkpoint_path: str, on_gpu: bool):
         """
@@ -293,6 +299,8 @@ class TrainerIOMixin(ABC):
         - schedulers
         - optimizer
         """
+        # the checkpoint might still be written in the background
+        self.checkpoint_writer.flush()
 
         # if on_gpu:
         #     checkpoint = torch.load(checkpoint_path)
@@ -480,21 +488,15 @@ class TrainerIOMixin(ABC):
 
         model.on_hpc_save(checkpoint)
 
-        # do the actual save
+        # do the actual save, the job is about to be requeued so don't leave anything in the background
         # TODO: fix for anything with multiprocess DP, DDP, DDP2
-        try:
-            atomic_save(checkpoint, filepath)
-        except AttributeError as err:
-            if LightningModule.CHECKPOINT_HYPER_PARAMS_KEY in checkpoint:
-                del checkpoint[LightningModule.CHECKPOINT_HYPER_PARAMS_KEY]
-            rank_zero_warn(
-                'warning, `module_arguments` dropped from checkpoint.' f' An attribute is not picklable {err}'
-            )
-            atomic_save(checkpoint, filepath)
+        self.checkpoint_writer.flush()
+        self._atomic_save_checkpoint(checkpoint, filepath)
 
         return filepath
 
     def hpc_load(self, folderpath, on_gpu):
+        self.checkpoint_writer.flush()
         filepath = '{}/hpc_ckpt_{}.ckpt'.format(folderpath, self.max_ckpt_in_folder(folderpath))
 
         # load on CPU first
@@ -22,9 +22,10 @@ from pytorch_lightning.callbacks import ModelCheckpoint
 from pytorch_lightning import _logger as log
 from pytorch_lightning.utilities.memory import recursive_detach
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
-from pytorch_lightning.core.step_result import EvalResult, Result
+from pytorch_lightning.core.step_result import EpochResultBuffer, EvalResult, Result
 from pytorch_lightning.utilities.parsing import AttributeDict
-from copy import copy, deepcopy
+from copy import copy
+from collections import ChainMap
 
 
 class TrainLoop:
@@ -59,6 +60,13 @@ class TrainLoop:
 
         self._teardown_already_run = True
 
+        # log the metrics of the last step, which may still be copied from the device
+        self.trainer.logger_connector.flush_deferred_metrics()
+
+        # check the batches since the last check for nan, unless the user stopped the training
+        if self.trainer.terminate_on_nan and not self.trainer.interrupted:
+            self.trainer.check_nan_flags()
+
         # Save latest checkpoint
         log.info('Saving latest checkpoint..')
         self.check_checkpoint_callback(should_check_val=False)
@@ -66,6 +74,9 @@ class TrainLoop:
         # hook
         self.trainer.call_hook('on_train_end')
 
+        # wait for checkpoints still being written in the background and stop the writer thread
+        self.trainer.checkpoint_writer.close()
+
         # kill loggers
         if self.trainer.logger is not None:
             self.trainer.logger.finalize("success")
@@ -148,6 +159,13 @@ class TrainLoop:
     def track_epoch_end_reduce_metrics(self, epoch_output, epoch_end_outputs):
         # track the outputs to reduce at the end of the epoch
         for opt_idx, opt_outputs in enumerate(epoch_end_outputs):
+            # results reduced automatically are reduced across time and steps right away
+            if isinstance(opt_outputs[-1], Result) and not is_overridden('training_epoch_end', self.trainer.get_model()):
+                if not isinstance(epoch_output[opt_idx], EpochResultBuffer):
+                    epoch_output[opt_idx] = EpochResultBuffer(streaming=True)
+                epoch_output[opt_idx].append(opt_outputs[0].__class__.reduce_across_time(opt_outputs))
+                continue
+
             # with 1 step (no tbptt) don't use a sequence at epoch end
             if isinstance(opt_outputs, list) and len(opt_outputs) == 1 and not isinstance(opt_outputs[0], Result):
                 opt_outputs = opt_outputs[0]
@@ -275,8 +293,11 @@ class TrainLoop:
         if batch_idx % self.trainer.row_log_interval == 0:
             if float(self.trainer.track_grad_norm) > 0:
                 model = self.trainer.get_model()
-                grad_norm_dic = model.grad_norm(
-                    self.trainer.track_grad_norm)
+                if self.trainer.track_grad_norm_depth is None:
+                    grad_norm_dic = model.grad_norm(self.trainer.track_grad_norm)
+                else:
+                    grad_norm_dic = model.grad_norm(
+                        self.trainer.track_grad_norm, group_depth=self.trainer.track_grad_norm_depth)
         return grad_norm_dic
 
     def log_training_step_metrics(self, opt_closure_result, batch_callback_metrics, batch_log_metrics):
@@ -298,7 +319,7 @@ class TrainLoop:
 
         # track progress bar metrics
         if len(step_pbar_metrics) > 0:
-            self.trainer.logger_connector.add_progress_bar_metrics(step_pbar_metrics)
+            self.trainer.logger_connector.add_progress_bar_metrics(step_pbar_metrics, defer=True)
 
     def process_hiddens(self, opt_closure_result):
         hiddens = opt_closure_result.hiddens
@@ -339,7 +360,8 @@ class TrainLoop:
             # ------------------------------------
             # TRAINING_STEP + TRAINING_STEP_END
             # ------------------------------------
-            batch_output = self.run_training_batch(batch, batch_idx, dataloader_idx)
+            with self.trainer.profiler.profile('run_training_batch'):
+                batch_output = self.run_training_batch(batch, batch_idx, dataloader_idx)
 
             # only track outputs when user implements training_epoch_end
             # otherwise we will build up unnecessary memory
@@ -360,7 +382,8 @@ class TrainLoop:
             # -----------------------------------------
             should_check_val = self.should_check_val_fx(batch_idx, is_last_batch)
             if should_check_val:
-                self.trainer.run_evaluation(test_mode=False)
+                with self.trainer.profiler.profile('run_evaluation'):
+                    self.trainer.run_evaluation(test_mode=False)
 
             # -----------------------------------------
             # SAVE LOGGERS (ie: Tensorboard, etc...)
@@ -373,9 +396,7 @@ class TrainLoop:
             self.trainer.logger_connector.save_train_loop_metrics_to_loggers(batch_idx, batch_output)
 
             # update LR schedulers
-            monitor_metrics = deepcopy(self.trainer.logger_connector.callback_metrics)
-            monitor_metrics.update(batch_output.batch_log_metrics)
-            self.update_train_loop_lr_schedulers(monitor_metrics=monitor_metrics)
+            self.update_train_loop_lr_schedulers(batch_log_metrics=batch_output.batch_log_metrics)
 
             # progress global step according to grads progress
             self.increment_accumulated_grad_global_step()
@@ -390,6 +411,10 @@ class TrainLoop:
             if self.trainer.should_stop:
                 break
 
+        # check the loss and weights of the last batches for nan
+        if self.trainer.terminate_on_nan:
+            self.trainer.check_nan_flags()
+
         # process epoch outputs
         self.trainer.logger_connector.on_train_epoch_end(
             epoch_output,
@@ -542,11 +567,14 @@ class TrainLoop:
 
         return result
 
-    def update_train_loop_lr_schedulers(self, monitor_metrics=None):
+    def update_train_loop_lr_schedulers(self, batch_log_metrics=None):
         num_accumulated_batches_reached = (self.trainer.batch_idx + 1) % self.trainer.accumulate_grad_batches == 0
         num_training_batches_reached = (self.trainer.batch_idx + 1) == self.trainer.num_training_batches
 
         if num_accumulated_batches_reached or num_training_batches_reached:
+            # schedulers only look up their monitor right away, so a view (batch metrics first) replaces a copy
+            monitor_metrics = ChainMap(batch_log_metrics or {}, self.trainer.logger_connector.callback_metrics)
+
             # update lr
             self.trainer.lr_scheduler_connector.update_learning_rates(interval='step', monitor_metrics=monitor_metrics)
 
@@ -595,11 +623,10 @@ class TrainLoop:
         return args
 
     def save_loggers_on_train_batch_end(self, batch_idx):
-        # when loggers should save to disk
-        should_save_log = (batch_idx + 1) % self.trainer.log_save_interval == 0 or self.trainer.should_stop
-        if should_save_log or self.trainer.fast_dev_run:
-            if self.trainer.is_global_zero and self.trainer.logger is not None:
-                self.trainer.logger.save()
+        # loggers save to disk every `log_save_interval` steps or as configured in their flush policy
+        if self.trainer.is_global_zero and self.trainer.logger is not None:
+            force = self.trainer.should_stop or self.trainer.fast_dev_run
+            self.trainer.logger.flush(force=force)
 
     def process_train_step_outputs(self, all_train_step_outputs, early_stopping_accumulator, checkpoint_accumulator):
         """
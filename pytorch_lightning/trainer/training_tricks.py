@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
+from typing import List, Union
 
 import torch
 from torch import Tensor
@@ -30,6 +31,17 @@ EPSILON = 1e-6
 EPSILON_FP16 = 1e-5
 
 
+def _all_finite(tensors: List[Tensor]) -> Tensor:
+    """Checks that all tensors are finite, without synchronizing with the device."""
+    if not tensors:
+        return torch.tensor(True)
+    devices = {}
+    for tensor in tensors:
+        devices.setdefault(tensor.device, []).append(torch.isfinite(tensor).all())
+    device = tensors[0].device
+    return torch.stack([torch.stack(flags).all().to(device) for flags in devices.values()]).all()
+
+
 class TrainerTrainingTricksMixin(ABC):
 
     # this is just a summary on variables used in this abstract class,
@@ -37,6 +49,8 @@ class TrainerTrainingTricksMixin(ABC):
     default_root_dir: str
     progress_bar_callback: ...
     on_gpu: bool
+    terminate_on_nan: Union[bool, int]
+    _nan_flags: List[Tensor]
 
     @abstractmethod
     def get_model(self) -> LightningModule:
@@ -58,24 +72,52 @@ class TrainerTrainingTricksMixin(ABC):
         model = self.get_model()
         for param in model.parameters():
             if (param.grad is not None) and torch.isnan(param.grad.float()).any():
-                log.info(param, param.grad)
+                log.info('%s, %s', param, param.grad)
 
     def detect_nan_tensors(self, loss: Tensor) -> None:
         model = self.get_model()
 
+        # reduce the checks of the loss and all network weights to flags on the device
+        self._nan_flags.append(torch.stack([
+            torch.isfinite(loss.detach()).all(),
+            _all_finite([param.detach() for param in model.parameters()]).to(loss.device),
+        ]))
+
+        # the flags are only copied to the host every `terminate_on_nan` batches
+        if len(self._nan_flags) >= int(self.terminate_on_nan):
+            self.check_nan_flags()
+
+    def check_nan_flags(self) -> None:
+        """Checks the flags of the batches which were not checked by :meth:`detect_nan_tensors` yet."""
+        if not self._nan_flags:
+            return
+        model = self.get_model()
+        flags = torch.stack(self._nan_flags).tolist()
+        self._nan_flags = []
+        # report the first batch which failed
+        failed = [(loss_finite, params_finite) for loss_finite, params_finite in flags
+                  if not (loss_finite and params_finite)]
+        if not failed:
+            return
+
         # check if loss is nan
-        if not torch.isfinite(loss).all():
+        loss_finite, _ = failed[0]
+        if not loss_finite:
             raise ValueError(
                 'The loss returned in `training_step` is nan or inf.'
             )
-        # check if a network weight is nan
+        # find the network weight which is nan
+        self.print_nan_gradients()
         for name, param in model.named_parameters():
             if not torch.isfinite(param).all():
-                self.print_nan_gradients()
                 raise ValueError(
                     f'Detected nan and/or inf values in `{name}`.'
                     ' Check your forward pass for numerically unstable operations.'
                 )
+        raise ValueError(
+            'Detected nan and/or inf values in the network weights.'
+            ' Check your forward pass for numerically unstable operations.'
+        )
 
     def configure_accumulated_gradients(self, accumulate_grad_batches):
         if isinstance(accumulate_grad_batches, dict):
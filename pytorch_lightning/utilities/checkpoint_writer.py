@@ -0,0 +1,190 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Checkpoint writers
+==================
+
+Writers decouple building a checkpoint from persisting it. The synchronous writer
+saves in the calling thread (the default behaviour of the Trainer), the asynchronous
+writer snapshots all tensors to host memory and serializes them on a background thread.
+
+"""
+
+import atexit
+import queue
+import threading
+from typing import Any, Callable, Optional
+
+import torch
+
+from pytorch_lightning.utilities.apply_func import apply_to_collection
+from pytorch_lightning.utilities.cloud_io import atomic_save
+
+
+class CheckpointWriter(object):
+    """
+    Saves checkpoints synchronously in the calling thread.
+
+    All file operations that depend on a written checkpoint (e.g. deleting an older
+    top-k file) should go through :meth:`submit` so that they are ordered after the
+    writes that were requested before them.
+    """
+
+    def save(self, checkpoint: dict, filepath: str, save_fn: Callable = atomic_save):
+        """Persist ``checkpoint`` to ``filepath`` using ``save_fn(checkpoint, filepath)``."""
+        save_fn(checkpoint, filepath)
+
+    def submit(self, fn: Callable, *args, **kwargs):
+        """Run ``fn`` after every previously requested save has completed."""
+        fn(*args, **kwargs)
+
+    def is_pending(self, filepath: str) -> bool:
+        """Whether a save to ``filepath`` was requested but has not been written yet."""
+        return False
+
+    def flush(self):
+        """Block until all requested operations are done."""
+
+    def close(self):
+        self.flush()
+
+
+class AsyncCheckpointWriter(CheckpointWriter):
+    """
+    Saves checkpoints on a background thread.
+
+    On :meth:`save` every tensor of the checkpoint is copied to host memory (pinned memory
+    with a non-blocking copy for CUDA tensors), after which training can continue while
+    the copy is serialized and written to disk. Operations run in submission order.
+
+    Args:
+        max_pending: maximum number of queued operations. When the queue is full, :meth:`save`
+            blocks until the writer catches up, which bounds the host memory held by snapshots.
+
+    Example::
+
+        >>> import os, tempfile
+        >>> writer = AsyncCheckpointWriter()
+        >>> path = os.path.join(tempfile.mkdtemp(), 'example.ckpt')
+        >>> writer.save({'weight': torch.ones(2)}, path)
+        >>> writer.flush()
+        >>> torch.load(path)
+        {'weight': tensor([1., 1.])}
+        >>> writer.close()
+    """
+
+    def __init__(self, max_pending: int = 2):
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._error = None
+        self._thread = None
+
+    def save(self, checkpoint: dict, filepath: str, save_fn: Callable = atomic_save):
+        snapshot, ready_event = self._snapshot(checkpoint)
+        self._put(self._save_snapshot, (save_fn, snapshot, filepath, ready_event), {}, filepath)
+
+    def submit(self, fn: Callable, *args, **kwargs):
+        self._put(fn, args, kwargs)
+
+    def is_pending(self, filepath: str) -> bool:
+        with self._lock:
+            return filepath in self._pending
+
+    def flush(self):
+        if self._thread is not None:
+            self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """Write all requested checkpoints and stop the background thread, which is restarted by the next save."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        atexit.unregister(self.close)
+        self._raise_error()
+
+    def _put(self, fn: Callable, args: tuple, kwargs: dict, filepath: Optional[str] = None):
+        # surface errors of earlier writes before queueing more work
+        self._raise_error()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, name='checkpoint-writer', daemon=True)
+            self._thread.start()
+            # write the checkpoints still queued when the interpreter exits without closing the writer
+            atexit.register(self.close)
+        if filepath is not None:
+            with self._lock:
+                self._pending[filepath] = self._pending.get(filepath, 0) + 1
+        self._queue.put((fn, args, kwargs, filepath))
+
+    def _raise_error(self):
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    @staticmethod
+    def _save_snapshot(save_fn: Callable, snapshot: dict, filepath: str, ready_event: Optional['torch.cuda.Event']):
+        if ready_event is not None:
+            # wait only for the device to host copies of this snapshot
+            ready_event.synchronize()
+        save_fn(snapshot, filepath)
+
+    def _worker(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                fn, args, kwargs, filepath = item
+                try:
+                    # keep the order of operations: nothing else runs after a failure until it is reported
+                    if self._error is None:
+                        fn(*args, **kwargs)
+                finally:
+                    if filepath is not None:
+                        self._release(filepath)
+            except BaseException as err:  # noqa: B902
+                self._error = err
+            finally:
+                self._queue.task_done()
+
+    def _release(self, filepath: str):
+        with self._lock:
+            self._pending[filepath] -= 1
+            if self._pending[filepath] == 0:
+                del self._pending[filepath]
+
+    @staticmethod
+    def _snapshot(checkpoint: Any):
+        """Copy all tensors of ``checkpoint`` to host memory so training can keep mutating them."""
+        copies_to_host = []
+
+        def to_host(tensor: torch.Tensor) -> torch.Tensor:
+            tensor = tensor.detach()
+            if tensor.is_cuda:
+                host = torch.empty(tensor.size(), dtype=tensor.dtype, pin_memory=True)
+                host.copy_(tensor, non_blocking=True)
+                copies_to_host.append(tensor)
+                return host
+            return tensor.cpu().clone()
+
+        snapshot = apply_to_collection(checkpoint, torch.Tensor, to_host)
+
+        ready_event = None
+        if copies_to_host:
+            ready_event = torch.cuda.Event()
+            ready_event.record()
+        return snapshot, ready_event
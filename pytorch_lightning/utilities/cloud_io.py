@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import io
+import os
+import uuid
 from distutils.version import LooseVersion
 from typing import Union
 from pathlib import Path
@@ -23,6 +24,9 @@ import fsspec
 
 pathlike = Union[Path, str]
 
+# filesystems where objects only become visible once fully uploaded and a rename is a full copy
+OBJECT_STORE_PROTOCOLS = ("s3", "s3a", "gs", "gcs", "az", "abfs", "adl")
+
 
 def load(path_or_url: str, map_location=None):
     if urlparse(path_or_url).scheme == "" or Path(path_or_url).drive:  # no scheme or with a drive letter
@@ -43,6 +47,14 @@ def get_filesystem(path: pathlike):
 def atomic_save(checkpoint, filepath: str):
     """Saves a checkpoint atomically, avoiding the creation of incomplete checkpoints.
 
+    The checkpoint is streamed into a temporary file next to ``filepath`` which is renamed into place
+    once it is complete, so no full in-memory copy of the serialized checkpoint is made and a partially
+    written file is never visible under ``filepath``. Object stores without a cheap rename only expose
+    an object once its upload has been committed, so the checkpoint is streamed to ``filepath`` directly
+    and only committed once it is complete.
+    On other remote filesystems the rename is not atomic, but the previous checkpoint is only removed
+    once the new one has been moved into place.
+
     Args:
         checkpoint: The object to save.
             Built to be used with the ``dump_checkpoint`` method, but can deal with anything which ``torch.save``
@@ -50,13 +62,65 @@ def atomic_save(checkpoint, filepath: str):
         filepath: The path to which the checkpoint will be saved.
             This points to the file that the checkpoint will be stored in.
     """
-    bytesbuffer = io.BytesIO()
+    filepath = str(filepath)
+    fs = get_filesystem(filepath)
+    if _protocol(fs) in OBJECT_STORE_PROTOCOLS:
+        # closing the file also uploads a partial checkpoint, so the object is only created by `commit`
+        f = fs.open(filepath, "wb", autocommit=False)
+        try:
+            with f:
+                _torch_save(checkpoint, f)
+        except BaseException:
+            f.discard()
+            raise
+        f.commit()
+        return
+
+    dirpath, filename = os.path.split(filepath)
+    # hidden name which doesn't contain the checkpoint name, so a crashed write is never picked up as a checkpoint
+    tmp_path = os.path.join(dirpath, f".tmp-{uuid.uuid4().hex}.part")
+    try:
+        with fs.open(tmp_path, "wb") as f:
+            _torch_save(checkpoint, f)
+        if _protocol(fs) in ("file", "local"):
+            # `os.replace` is atomic and overwrites an existing checkpoint, it needs paths without a protocol
+            os.replace(fs._strip_protocol(tmp_path), fs._strip_protocol(filepath))
+        else:
+            _replace(fs, tmp_path, filepath)
+    except BaseException:
+        if fs.exists(tmp_path):
+            fs.rm(tmp_path)
+        raise
+
+
+def _replace(fs, src: str, dst: str):
+    """Moves ``src`` to ``dst`` on filesystems without an atomic rename, keeping an existing ``dst`` as a
+    backup until the move has succeeded, so there is a complete checkpoint at any time."""
+    if not fs.exists(dst):
+        fs.mv(src, dst)
+        return
+    dirpath = os.path.dirname(dst)
+    backup_path = os.path.join(dirpath, f".tmp-{uuid.uuid4().hex}.bak")
+    fs.mv(dst, backup_path)
+    try:
+        fs.mv(src, dst)
+    except BaseException:
+        if not fs.exists(dst):
+            fs.mv(backup_path, dst)
+        raise
+    fs.rm(backup_path)
+
+
+def _protocol(fs) -> str:
+    protocol = fs.protocol
+    return protocol[0] if isinstance(protocol, (tuple, list)) else protocol
+
+
+def _torch_save(checkpoint, f):
     # Can't use the new zipfile serialization for 1.6.0 because there's a bug in
     # torch.hub.load_state_dict_from_url() that prevents it from loading the new files.
     # More details can be found here: https://github.com/pytorch/pytorch/issues/42239
     if LooseVersion(torch.__version__).version[:3] == [1, 6, 0]:
-        torch.save(checkpoint, bytesbuffer, _use_new_zipfile_serialization=False)
+        torch.save(checkpoint, f, _use_new_zipfile_serialization=False)
     else:
-        torch.save(checkpoint, bytesbuffer)
-    with fsspec.open(filepath, "wb") as f:
-        f.write(bytesbuffer.getvalue())
+        torch.save(checkpoint, f)
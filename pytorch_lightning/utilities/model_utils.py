@@ -1,12 +1,36 @@
+from typing import Dict, Tuple
+
 from pytorch_lightning.core.lightning import LightningModule
 from pytorch_lightning.core.datamodule import LightningDataModule
 
+# whether a class overrides a method, keyed by the class and method name
+_OVERRIDDEN_CACHE: Dict[Tuple[type, str], bool] = {}
+
 
 def is_overridden(method_name: str, model: LightningModule) -> bool:
+    # methods assigned to the instance, like patched dataloaders, are not cached
+    if method_name in getattr(model, '__dict__', ()):
+        return _is_overridden(method_name, model, _super_object(type(model)))
+
+    key = (type(model), method_name)
+    overridden = _OVERRIDDEN_CACHE.get(key)
+    if overridden is None:
+        overridden = _OVERRIDDEN_CACHE[key] = _is_overridden(method_name, type(model), _super_object(type(model)))
+    return overridden
+
+
+def clear_overridden_cache() -> None:
+    """Forgets which methods the classes override, needed if methods of a class are replaced."""
+    _OVERRIDDEN_CACHE.clear()
+
+
+def _super_object(model_cls: type) -> type:
     # if you pass DataModule instead of None or a LightningModule, we use LightningDataModule as super
     # TODO - refector this function to accept model_name, instance, parent so it makes more sense
-    super_object = LightningModule if not isinstance(model, LightningDataModule) else LightningDataModule
+    return LightningDataModule if issubclass(model_cls, LightningDataModule) else LightningModule
+
 
+def _is_overridden(method_name: str, model, super_object: type) -> bool:
     # assert model, 'no model passes'
 
     if not hasattr(model, method_name):
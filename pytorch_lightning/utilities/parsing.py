@@ -37,6 +37,20 @@ def str_to_bool_or_str(val: str) -> Union[str, bool]:
         return val
 
 
+def str_to_bool_or_int(val: str) -> Union[bool, int]:
+    """Convert a string representation of truth to bool, or an integer to int.
+
+    >>> str_to_bool_or_int('TRUE')
+    True
+    >>> str_to_bool_or_int('10')
+    10
+    """
+    val = str_to_bool_or_str(val)
+    if isinstance(val, bool):
+        return val
+    return int(val)
+
+
 def str_to_bool(val: str) -> bool:
     """Convert a string representation of truth to bool.
 
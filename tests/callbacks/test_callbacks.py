@@ -264,3 +264,39 @@ def test_trainer_callback_system(tmpdir):
     assert not test_callback.on_validation_end_called
     assert not test_callback.on_validation_batch_end_called
     assert not test_callback.on_validation_batch_start_called
+
+
+def test_callback_hook_table(tmpdir):
+    """Test that the hooks only dispatch to the callbacks which override them."""
+
+    class BatchCounter(Callback):
+        def __init__(self):
+            self.count = 0
+
+        def on_train_batch_end(self, trainer, pl_module, batch, batch_idx, dataloader_idx):
+            self.count += 1
+
+    class EpochCounter(Callback):
+        def __init__(self):
+            self.count = 0
+
+        def on_epoch_end(self, trainer, pl_module):
+            self.count += 1
+
+    batch_counter, epoch_counter = BatchCounter(), EpochCounter()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        callbacks=[batch_counter, epoch_counter],
+        max_epochs=2,
+        limit_train_batches=3,
+        limit_val_batches=1,
+        progress_bar_refresh_rate=0,
+        checkpoint_callback=False,
+    )
+    trainer.fit(EvalModelTemplate())
+
+    assert trainer._callbacks_with_hook('on_train_batch_end') == [batch_counter]
+    assert trainer._callbacks_with_hook('on_epoch_end') == [epoch_counter]
+    assert trainer._callbacks_with_hook('on_batch_start') == []
+    assert batch_counter.count == 6
+    assert epoch_counter.count == 2
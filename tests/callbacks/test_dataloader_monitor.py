@@ -0,0 +1,94 @@
+import time
+from unittest import mock
+
+import pytest
+import torch
+from torch.utils.data import DataLoader
+
+from pytorch_lightning import Trainer
+from pytorch_lightning.callbacks import DataLoaderMonitor
+from pytorch_lightning.callbacks.dataloader_monitor import _batch_size
+from pytorch_lightning.loggers import TensorBoardLogger
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
+from tests.base import EvalModelTemplate
+from tests.base.datasets import PATH_DATASETS, TrialMNIST
+
+
+class SlowDataset(TrialMNIST):
+    delay = 0.01
+
+    def __getitem__(self, index):
+        time.sleep(self.delay)
+        return super().__getitem__(index)
+
+
+class VerySlowDataset(SlowDataset):
+    delay = 0.05
+
+
+class SlowTrainingModel(EvalModelTemplate):
+
+    def training_step(self, batch, batch_idx):
+        time.sleep(0.2)
+        return super().training_step(batch, batch_idx)
+
+
+def _fit_with_monitor(tmpdir, num_workers, monitor, dataset_cls=SlowDataset, model=None, max_steps=4):
+    model = model or EvalModelTemplate()
+    model.train_dataloader = lambda: DataLoader(
+        dataset_cls(root=PATH_DATASETS, train=True, download=True), batch_size=4, num_workers=num_workers,
+    )
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_steps=max_steps,
+        limit_val_batches=0,
+        row_log_interval=2,
+        callbacks=[monitor],
+    )
+    with mock.patch.object(TensorBoardLogger, 'log_metrics') as log_metrics:
+        trainer.fit(model)
+    logged = [args[0] if args else kwargs['metrics'] for args, kwargs in log_metrics.call_args_list]
+    return [metrics for metrics in logged if 'data/wait_fraction' in metrics]
+
+
+def test_dataloader_monitor_warns_when_data_bound(tmpdir):
+    """Ensure the throughput is logged every `row_log_interval` batches and a slow dataloader is reported."""
+    with pytest.warns(RuntimeWarning, match='waiting for the train dataloader'):
+        logged = _fit_with_monitor(tmpdir, num_workers=0, monitor=DataLoaderMonitor(warn_wait_fraction=0.3))
+
+    assert len(logged) == 2
+    for stats in logged:
+        assert stats['data/wait_fraction'] > 0.3
+        assert stats['data/wait_time (s)'] >= 4 * 0.01
+        assert stats['data/samples_per_sec'] == pytest.approx(4 * stats['data/batches_per_sec'])
+        assert 'data/ready_batches' not in stats
+
+
+def test_dataloader_monitor_ready_batches(tmpdir):
+    """Ensure the batches loaded ahead by the workers tell a slow dataloader from slow training."""
+    # the workers need 0.2s per batch, the training steps are fast
+    data_bound = _fit_with_monitor(tmpdir, num_workers=2, monitor=DataLoaderMonitor(warn_wait_fraction=None),
+                                   dataset_cls=VerySlowDataset, max_steps=6)
+    # the workers need 0.04s per batch, the training steps take 0.2s
+    compute_bound = _fit_with_monitor(tmpdir, num_workers=2, monitor=DataLoaderMonitor(warn_wait_fraction=None),
+                                      model=SlowTrainingModel(), max_steps=6)
+
+    assert len(data_bound) == len(compute_bound) == 3
+    # the first interval includes the start of the workers, later the two workers deliver their batches in pairs
+    assert all(stats['data/ready_batches'] <= 1 for stats in data_bound[1:])
+    assert all(stats['data/ready_batches'] >= 2 for stats in compute_bound[1:])
+
+
+def test_dataloader_monitor_no_logger(tmpdir):
+    trainer = Trainer(default_root_dir=tmpdir, max_steps=1, logger=False, callbacks=[DataLoaderMonitor()])
+    with pytest.raises(MisconfigurationException, match='Trainer that has no logger'):
+        trainer.fit(EvalModelTemplate())
+
+    with pytest.raises(MisconfigurationException, match='between 0 and 1'):
+        DataLoaderMonitor(warn_wait_fraction=2)
+
+
+def test_batch_size():
+    assert _batch_size(torch.zeros(3, 2)) == 3
+    assert _batch_size({'x': [None, torch.zeros(5)], 'y': 1}) == 5
+    assert _batch_size(['text']) == 0
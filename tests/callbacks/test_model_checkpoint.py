@@ -1,5 +1,6 @@
 import os
 import re
+import threading
 import pickle
 import platform
 from pathlib import Path
@@ -190,3 +191,34 @@ def test_ckpt_metric_names_results(tmpdir):
     assert len(ckpts) == 1
     val = re.sub('[^0-9.]', '', ckpts[0])
     assert len(val) > 3
+
+
+@pytest.mark.parametrize("save_top_k", [1, 2])
+def test_model_checkpoint_async_checkpoint(tmpdir, save_top_k):
+    """ Test that checkpoints written in the background keep the top-k files and are complete after fit. """
+    seed_everything(100)
+    model = EvalModelTemplate()
+    model_checkpoint = ModelCheckpoint(filepath=tmpdir, save_top_k=save_top_k, save_last=True)
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        early_stop_callback=False,
+        checkpoint_callback=model_checkpoint,
+        async_checkpoint=True,
+        max_epochs=4,
+        limit_train_batches=0.1,
+        limit_val_batches=0.1,
+    )
+    trainer.fit(model)
+
+    ckpts = sorted(os.listdir(tmpdir))
+    assert ModelCheckpoint.CHECKPOINT_NAME_LAST in ckpts
+    assert set(model_checkpoint.best_k_models) == {os.path.join(tmpdir, c) for c in ckpts if 'epoch' in c}
+    assert len(model_checkpoint.best_k_models) == save_top_k
+
+    ckpt_last = torch.load(str(tmpdir / ModelCheckpoint.CHECKPOINT_NAME_LAST))
+    assert ckpt_last['epoch'] == 4
+    for key, value in model.state_dict().items():
+        assert torch.equal(ckpt_last['state_dict'][key], value)
+
+    # the writer thread is stopped at the end of the training
+    assert not any(t.name == 'checkpoint-writer' for t in threading.enumerate())
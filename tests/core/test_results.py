@@ -1,16 +1,29 @@
+import gc
 import sys
+from copy import copy
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 import torch
 import torch.distributed as dist
 import torch.multiprocessing as mp
+from torch.utils.data import DataLoader, DistributedSampler, TensorDataset
+
 from pytorch_lightning import Trainer, seed_everything
-from pytorch_lightning.core.step_result import Result, TrainResult, EvalResult
+from pytorch_lightning.core.step_result import EpochResultBuffer, LogOptions, Result, TrainResult, EvalResult
+from pytorch_lightning.trainer.evaluate_loop import EvaluationLoop
+from pytorch_lightning.trainer.supporters import (
+    ColumnarPredictionWriter,
+    PredictionCollection,
+    merge_columnar_predictions,
+    read_columnar_predictions,
+)
 import tests.base.develop_utils as tutils
 
 from tests.base import EvalModelTemplate
 from tests.base.datamodules import TrialMNISTDataModule
+from tests.base.datasets import PATH_DATASETS
 
 
 def _setup_ddp(rank, worldsize):
@@ -176,6 +189,176 @@ def test_result_obj_predictions_ddp_spawn(tmpdir):
     assert size == len(dm.mnist_test)
 
 
+@pytest.mark.parametrize("test_option", [2, 3])
+def test_result_obj_streamed_predictions(tmpdir, test_option):
+    """ Test that predictions written to a directory are streamed to column files with a manifest. """
+    tutils.reset_seed()
+
+    dm = TrialMNISTDataModule(PATH_DATASETS)
+    prediction_dir = Path(tmpdir) / 'predictions'
+
+    model = EvalModelTemplate()
+    model.test_option = test_option
+    model.prediction_file = f'{prediction_dir}/'
+    model.test_step = model.test_step_result_preds
+    model.test_step_end = None
+    model.test_epoch_end = None
+    model.test_end = None
+
+    trainer = Trainer(default_root_dir=tmpdir, weights_summary=None)
+    trainer.test(model, datamodule=dm)
+
+    assert (prediction_dir / 'manifest_rank_0.json').exists()
+    predictions = read_columnar_predictions(prediction_dir)
+    num_rows = len(dm.mnist_test)
+    assert predictions['idxs'].tolist() == list(range(num_rows))
+    if test_option == 2:
+        assert predictions['x'].shape == (num_rows, 28 * 28)
+    else:
+        assert len(predictions['vals']) == num_rows
+        assert set(predictions['vals']) == {'cat', 'dog'}
+
+
+def test_columnar_prediction_writer_mismatching_lengths(tmpdir):
+    writer = ColumnarPredictionWriter(tmpdir, global_rank=1)
+    writer.append('a', torch.zeros(3))
+    writer.append('b', [0, 1])
+    with pytest.raises(ValueError, match='row shape'):
+        writer.append('a', torch.zeros(3, 2))
+    with pytest.raises(ValueError, match='Mismatching feature column lengths'):
+        writer.close()
+
+
+def test_merge_columnar_predictions(tmpdir):
+    """ Test that the shards of a DistributedSampler are merged into dataset order without the padding. """
+    num_samples, world_size = 10, 3
+    # the sampler pads the 10 samples to 12, repeating samples 0 and 1 on the ranks 1 and 2
+    indices = list(range(num_samples)) + [0, 1]
+    for rank in range(world_size):
+        writer = ColumnarPredictionWriter(tmpdir, global_rank=rank)
+        rank_indices = torch.tensor(indices[rank::world_size])
+        for chunk in rank_indices.split(3):
+            writer.append('x', chunk.float().unsqueeze(1).repeat(1, 2))
+            writer.append('names', [f'sample{i}' for i in chunk.tolist()])
+        writer.close()
+
+    manifest = merge_columnar_predictions(tmpdir, world_size, num_samples=num_samples, chunk_size=4)
+    assert manifest['num_rows'] == num_samples
+
+    predictions = read_columnar_predictions(tmpdir, shard_name='merged')
+    assert predictions['x'].tolist() == [[float(i)] * 2 for i in range(num_samples)]
+    assert predictions['names'] == [f'sample{i}' for i in range(num_samples)]
+
+
+def test_merge_columnar_predictions_index_column(tmpdir):
+    """ Test that the shards are merged by the recorded sample indices, writing repeated samples once. """
+    for rank, indices in enumerate([[0, 3, 4, 7], [1, 2, 5, 6], [0, 7, 8]]):
+        writer = ColumnarPredictionWriter(tmpdir, global_rank=rank)
+        writer.append('idxs', torch.tensor(indices))
+        writer.append('preds', torch.tensor(indices) * 2)
+        writer.close()
+
+    merge_columnar_predictions(tmpdir, world_size=3, index_column='idxs', chunk_size=3)
+    predictions = read_columnar_predictions(tmpdir, shard_name='merged')
+    assert predictions['idxs'].tolist() == list(range(9))
+    assert predictions['preds'].tolist() == [2 * i for i in range(9)]
+
+    writer = ColumnarPredictionWriter(tmpdir, global_rank=2)
+    writer.append('idxs', torch.tensor([8, 0]))
+    writer.append('preds', torch.tensor([16, 0]))
+    writer.close()
+    with pytest.raises(ValueError, match='not sorted'):
+        merge_columnar_predictions(tmpdir, world_size=3, index_column='idxs', chunk_size=3)
+
+
+def test_evaluation_loop_merges_streamed_predictions(tmpdir):
+    """ Test that rank 0 merges the streamed predictions of the ranks after testing. """
+    dataset = TensorDataset(torch.arange(5))
+    dataloader = DataLoader(dataset, sampler=DistributedSampler(dataset, num_replicas=2, rank=0, shuffle=False))
+    prediction_dir = f'{tmpdir}/predictions/'
+
+    # rank 1 got the samples 1, 3 and the padding sample 0
+    writer = ColumnarPredictionWriter(prediction_dir, global_rank=1)
+    writer.append('preds', torch.tensor([1, 3, 0]))
+    writer.close()
+
+    trainer = Mock(world_size=2, global_rank=0)
+    evaluation_loop = EvaluationLoop(trainer)
+    evaluation_loop.predictions = PredictionCollection(global_rank=0, world_size=2)
+    evaluation_loop.predictions.add({prediction_dir: {'preds': torch.tensor([0, 2, 4])}})
+    evaluation_loop.predictions_to_disk([dataloader])
+
+    predictions = read_columnar_predictions(prediction_dir, shard_name='merged')
+    assert predictions['preds'].tolist() == [0, 1, 2, 3, 4]
+
+
+def _step_results(num_steps):
+    outputs = []
+    for step in range(num_steps):
+        result = EvalResult(checkpoint_on=torch.tensor(float(step)))
+        result.log('mean', torch.tensor(float(step)))
+        result.log('max', torch.tensor(step), reduce_fx=torch.max)
+        # the last batch is smaller
+        result.log('rows', torch.ones(3 if step < num_steps - 1 else 1, 2) * step, on_epoch=False)
+        result.log('mixed', torch.zeros(step % 2 + 1) if step else torch.tensor(0.), on_epoch=False)
+        result.track_batch_size(3 if step < num_steps - 1 else 1)
+        outputs.append(result)
+    return outputs
+
+
+def test_epoch_result_buffer_matches_result():
+    """ Test that the buffers gather and reduce like a list of results, growing past their capacity. """
+    num_steps = 40
+    buffer = EpochResultBuffer()
+    for result in _step_results(num_steps):
+        buffer.append(result)
+    assert len(buffer) == num_steps
+    assert len(buffer.values['mean'].storage) == 64
+
+    for method in ('gather', 'reduce_on_epoch_end'):
+        expected = getattr(EvalResult, method)(_step_results(num_steps))
+        result = getattr(buffer, method)()
+        assert isinstance(result, EvalResult)
+        assert result.keys() == expected.keys()
+        for k, v in expected.items():
+            if k == 'mixed':
+                # tensors of different dimensions are kept in a list
+                assert all(torch.equal(a, b) for a, b in zip(result[k], v))
+            elif k != 'meta':
+                assert torch.allclose(result[k], v), k
+
+
+def test_epoch_result_buffer_streaming():
+    """ Test that streaming buffers reduce per step like the reduction of all results at epoch end. """
+    num_steps = 40
+    buffer = EpochResultBuffer(streaming=True)
+    for result in _step_results(num_steps):
+        result.log('median', result['mean'], reduce_fx=torch.median)
+        buffer.append(result)
+
+    # only values reduced with a custom function are kept
+    assert list(buffer.values) == ['median']
+    assert buffer.dropped == {'rows', 'mixed'}
+    with pytest.raises(RuntimeError, match='not kept'):
+        buffer.gather()
+
+    result = buffer.reduce_on_epoch_end()
+    expected = EvalResult.reduce_on_epoch_end(_step_results(num_steps))
+    for k in ('mean', 'max'):
+        assert torch.allclose(result[k], expected[k]), k
+    assert torch.allclose(result.checkpoint_on, expected.checkpoint_on.mean())
+    assert result['median'] == torch.median(torch.arange(num_steps).float())
+
+
+def test_epoch_result_buffer_promotes_dtype():
+    buffer = EpochResultBuffer()
+    for value in (torch.tensor(1), torch.tensor(0.5)):
+        result = EvalResult()
+        result.log('x', value, reduce_fx=torch.sum)
+        buffer.append(result)
+    assert buffer.reduce_on_epoch_end()['x'] == 1.5
+
+
 def test_result_gather_stack():
     """ Test that tensors get concatenated when they all have the same shape. """
     outputs = [
@@ -238,6 +421,39 @@ def test_result_gather_mixed_types():
     assert result["foo"] == expected
 
 
+def test_result_log_options_shared():
+    """ Test that the options of the logged values are shared between keys and results. """
+    result = Result()
+    result.log('a', 1., on_epoch=True)
+    result.log('b', 2., on_epoch=True)
+    other = Result()
+    other.log('a', 3., on_epoch=True)
+    other.log('c', torch.tensor(4.), tbptt_pad_token=torch.tensor(0))
+
+    options = result['meta']['a']
+    assert isinstance(options, LogOptions)
+    assert options is result['meta']['b'] is other['meta']['a']
+    assert options['on_epoch'] and options.get('on_epoch') and not options['on_step']
+    assert dict(options.items())['reduce_fx'] is torch.mean
+    assert other['meta']['c']['tbptt_pad_token'] == 0
+    with pytest.raises(AttributeError):
+        options.on_step = True
+
+    assert Result.gather([result, copy(result)])['meta']['a'] is options
+
+
+def test_result_log_options_released():
+    """ Test that the options with a reduce function built per step are not kept after the step. """
+    num_interned = len(LogOptions._interned)
+    for _ in range(100):
+        result = EvalResult()
+        result.log('a', torch.tensor(1.), reduce_fx=lambda t: t.max())
+        assert len(LogOptions._interned) <= num_interned + 1
+    del result
+    gc.collect()
+    assert len(LogOptions._interned) <= num_interned
+
+
 def test_result_retrieve_last_logged_item():
     result = Result()
     result.log('a', 5., on_step=True, on_epoch=True)
@@ -199,3 +199,49 @@ def test_with_accumulate_grad_batches():
     assert logger.history == {0: {'loss': 0.5623850983416314}}
     logger.close()
     assert logger.history == {0: {'loss': 0.5623850983416314}, 1: {'loss': 0.4778883735637184}}
+
+
+def test_logger_flush_policy():
+    """Test that flush only saves when due according to the flush policy."""
+    logger = CustomLogger()
+    logger.save = MagicMock()
+
+    # without a policy, every flush saves
+    logger.flush()
+    assert logger.save.call_count == 1
+
+    logger.update_flush_policy(every_n_steps=3)
+    for _ in range(5):
+        logger.flush()
+    assert logger.save.call_count == 2
+
+    # forced flush saves and restarts the count
+    logger.flush(force=True)
+    assert logger.save.call_count == 3
+    logger.flush()
+    logger.flush()
+    assert logger.save.call_count == 3
+
+    logger.update_flush_policy(every_n_seconds=1e-9)
+    logger.flush()
+    assert logger.save.call_count == 4
+
+
+def test_logger_flush_policy_trainer(tmpdir):
+    """Test that the Trainer doesn't save the logger after every logging call."""
+    logger = CustomLogger()
+    logger.save = MagicMock()
+
+    trainer = Trainer(
+        max_epochs=1,
+        limit_train_batches=10,
+        limit_val_batches=2,
+        row_log_interval=1,
+        log_save_interval=4,
+        logger=logger,
+        default_root_dir=tmpdir,
+    )
+    trainer.fit(EvalModelTemplate())
+
+    # setup, after train batches 4 and 8, validation and train epoch end
+    assert logger.save.call_count == 5
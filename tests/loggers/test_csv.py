@@ -95,3 +95,22 @@ def test_file_logger_log_hyperparams(tmpdir):
     path_yaml = os.path.join(logger.log_dir, ExperimentWriter.NAME_HPARAMS_FILE)
     params = load_hparams_from_yaml(path_yaml)
     assert all([n in params for n in hparams])
+
+
+def test_file_logger_appends_metrics(tmpdir):
+    """Verify that saving only appends new rows and extends the header for new metrics"""
+    logger = CSVLogger(tmpdir)
+    logger.log_metrics({"a": 1}, 0)
+    logger.log_metrics({"a": 2}, 1)
+    logger.save()
+    assert logger.experiment.metrics == []
+
+    logger.log_metrics({"a": 3, "b": 4}, 2)
+    logger.save()
+    logger.log_metrics({"b": 5}, 3)
+    logger.finalize("success")
+
+    path_csv = os.path.join(logger.log_dir, ExperimentWriter.NAME_METRICS_FILE)
+    with open(path_csv, 'r') as fp:
+        lines = [line.strip() for line in fp.readlines()]
+    assert lines == ['a,step,b', '1,0,', '2,1,', '3,2,4', ',3,5']
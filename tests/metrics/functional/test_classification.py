@@ -9,6 +9,7 @@ from sklearn.metrics import (
     f1_score as sk_f1_score,
     fbeta_score as sk_fbeta_score,
     confusion_matrix as sk_confusion_matrix,
+    roc_auc_score as sk_roc_auc,
 )
 
 from pytorch_lightning import seed_everything
@@ -31,7 +32,13 @@ from pytorch_lightning.metrics.functional.classification import (
     precision_recall_curve,
     roc,
     auc,
+    binned_auroc,
+    binned_average_precision,
+    binned_clf_counts,
     iou,
+    multiclass_auroc,
+    multiclass_precision_recall_curve,
+    multiclass_roc,
 )
 
 
@@ -274,6 +281,63 @@ def test_roc_curve(pred, target, expected_tpr, expected_fpr):
     assert torch.allclose(tpr, torch.tensor(expected_tpr).to(tpr))
 
 
+@pytest.mark.parametrize('sample_weight', [None, 'random'])
+@pytest.mark.parametrize('ties', [False, True])
+def test_multiclass_curves_match_binary(sample_weight, ties):
+    """The vectorized multiclass curves match the binary curves of each class."""
+    seed_everything(0)
+    num_classes = 5
+    pred = torch.rand(100, num_classes)
+    if ties:
+        pred = torch.round(pred * 4) / 4
+    target = torch.randint(num_classes, (100,))
+    if sample_weight == 'random':
+        sample_weight = torch.rand(100)
+
+    rocs = multiclass_roc(pred, target, sample_weight=sample_weight)
+    prs = multiclass_precision_recall_curve(pred, target, sample_weight=sample_weight)
+    aurocs = multiclass_auroc(pred, target, sample_weight=sample_weight)
+    assert len(rocs) == len(prs) == aurocs.numel() == num_classes
+
+    for c in range(num_classes):
+        for result, expected in zip(rocs[c], roc(pred[:, c], target, sample_weight=sample_weight, pos_label=c)):
+            assert torch.allclose(result, expected)
+        for result, expected in zip(prs[c], precision_recall_curve(pred[:, c], target, sample_weight, pos_label=c)):
+            assert torch.allclose(result, expected)
+        sk_score = sk_roc_auc((target == c).numpy(), pred[:, c].numpy(),
+                              sample_weight=None if sample_weight is None else sample_weight.numpy())
+        assert torch.allclose(aurocs[c], torch.tensor(sk_score, dtype=aurocs.dtype))
+
+
+def test_binned_clf_counts_accumulate():
+    seed_everything(0)
+    pred, target = torch.rand(300), torch.randint(2, (300,))
+    sample_weight = torch.rand(300)
+
+    fps, tps = binned_clf_counts(pred, target, num_bins=50, sample_weight=sample_weight)
+    batch_counts = [binned_clf_counts(p, t, num_bins=50, sample_weight=w)
+                    for p, t, w in zip(pred.chunk(3), target.chunk(3), sample_weight.chunk(3))]
+    assert torch.allclose(fps, sum(c[0] for c in batch_counts))
+    assert torch.allclose(tps, sum(c[1] for c in batch_counts))
+    # the lowest threshold predicts every sample positive
+    assert torch.allclose(tps[0], sample_weight[target == 1].sum())
+    assert torch.allclose(fps[0], sample_weight[target == 0].sum())
+
+
+@pytest.mark.parametrize(['binned_fn', 'exact_fn'], [
+    pytest.param(binned_auroc, auroc, id='auroc'),
+    pytest.param(binned_average_precision, average_precision, id='average_precision'),
+])
+def test_binned_curve_approximation(binned_fn, exact_fn):
+    seed_everything(0)
+    target = torch.randint(2, (1000,))
+    pred = torch.sigmoid(torch.randn(1000) + target.float())
+
+    exact = exact_fn(pred, target)
+    for num_bins, tol in [(100, 1e-2), (1000, 1e-3)]:
+        assert torch.allclose(binned_fn(pred, target, num_bins=num_bins), exact.float(), atol=tol)
+
+
 @pytest.mark.parametrize(['pred', 'target', 'expected'], [
     pytest.param([0, 1, 0, 1], [0, 1, 0, 1], 1.),
     pytest.param([1, 1, 0, 0], [0, 0, 1, 1], 0.),
@@ -324,6 +388,25 @@ def test_dice_score(pred, target, expected):
     assert score == expected
 
 
+@pytest.mark.parametrize('bg', [False, True])
+def test_dice_score_per_class(bg):
+    seed_everything(0)
+    # volumetric predictions where class 3 never occurs in the target
+    pred = torch.rand(2, 5, 4, 4, 4)
+    target = torch.randint(3, (2, 4, 4, 4))
+    target[0, 0, 0, 0] = 4
+
+    scores = dice_score(pred, target, bg=bg, nan_score=-1., no_fg_score=-2., reduction='none')
+    pred_labels = pred.argmax(dim=1)
+    for i, score in enumerate(scores, start=0 if bg else 1):
+        if not (target == i).any():
+            assert score == -2.
+            continue
+        tp = ((pred_labels == i) & (target == i)).sum()
+        denom = (pred_labels == i).sum() + (target == i).sum()
+        assert torch.allclose(score, 2 * tp.float() / denom.float())
+
+
 @pytest.mark.parametrize(['half_ones', 'reduction', 'remove_bg', 'expected'], [
     pytest.param(False, 'none', False, torch.Tensor([1, 1, 1])),
     pytest.param(False, 'elementwise_mean', False, torch.Tensor([1])),
@@ -13,6 +13,8 @@ from pytorch_lightning.metrics.classification import (
     Recall,
     AveragePrecision,
     AUROC,
+    BinnedAUROC,
+    BinnedAveragePrecision,
     FBeta,
     F1,
     ROC,
@@ -104,6 +106,24 @@ def test_auroc(pos_label):
     assert isinstance(area, torch.Tensor)
 
 
+@pytest.mark.parametrize(['metric_class', 'name'], [
+    pytest.param(BinnedAUROC, 'binned_auroc'),
+    pytest.param(BinnedAveragePrecision, 'binned_AP'),
+])
+def test_binned_curve_metrics(metric_class, name):
+    metric = metric_class(num_bins=20)
+    assert metric.name == name
+
+    pred, target = torch.rand(10), torch.randint(2, (10,))
+    for p, t in zip(pred.chunk(2), target.chunk(2)):
+        score = metric(pred=p, target=t)
+        assert isinstance(score, torch.Tensor)
+
+    full = metric_class(num_bins=20)
+    full.update(pred, target)
+    assert torch.allclose(metric.compute(), full.compute())
+
+
 @pytest.mark.parametrize(['beta', 'num_classes'], [
     pytest.param(0., 1),
     pytest.param(0.5, 1),
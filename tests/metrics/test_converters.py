@@ -1,4 +1,5 @@
 import sys
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -15,6 +16,8 @@ from pytorch_lightning.metrics.converters import (
     _numpy_metric_conversion,
     _tensor_metric_conversion,
     sync_ddp_if_available,
+    sync_ddp_bucketed_if_available,
+    sync_ddp_collection_if_available,
     gather_all_tensors_if_available,
     tensor_metric,
     numpy_metric
@@ -135,6 +138,51 @@ def _ddp_test_fn(rank, worldsize, add_offset: bool, reduction_mean=False):
             'Sync-Reduce does not work properly with DDP and Tensors'
 
 
+def _ddp_test_bucketed_fn(rank, worldsize):
+    _setup_ddp(rank, worldsize)
+    tensors = [
+        torch.tensor(float(rank)),
+        torch.full((2, 3), float(rank)),
+        torch.tensor([rank, 1]),
+    ]
+
+    with mock.patch('torch.distributed.all_reduce', wraps=dist.all_reduce) as all_reduce, \
+            mock.patch('torch.distributed.barrier', wraps=dist.barrier) as barrier:
+        reduced = sync_ddp_bucketed_if_available(tensors, reduce_op='mean')
+
+    # one collective per dtype, after one barrier for all tensors
+    assert all_reduce.call_count == 2
+    assert barrier.call_count == 1
+    mean_rank = sum(range(worldsize)) / worldsize
+    assert reduced[0].shape == torch.Size([]) and reduced[0].item() == mean_rank
+    assert torch.equal(reduced[1], torch.full((2, 3), mean_rank))
+    assert torch.equal(reduced[2], torch.tensor([mean_rank, 1.]))
+
+    collection = {'a': torch.tensor([1.]), 'b': [torch.tensor([2.]), torch.tensor([3.])]}
+    with mock.patch('torch.distributed.all_reduce', wraps=dist.all_reduce) as all_reduce:
+        reduced = sync_ddp_collection_if_available(collection)
+    assert all_reduce.call_count == 1
+    assert reduced['a'].item() == worldsize
+    assert [t.item() for t in reduced['b']] == [2 * worldsize, 3 * worldsize]
+
+
+@pytest.mark.skipif(sys.platform == "win32" , reason="DDP not available on windows")
+def test_sync_reduce_bucketed_ddp():
+    """Make sure several tensors are reduced with one collective per dtype"""
+    tutils.reset_seed()
+    tutils.set_random_master_port()
+
+    worldsize = 2
+    mp.spawn(_ddp_test_bucketed_fn, args=(worldsize,), nprocs=worldsize)
+
+
+def test_sync_reduce_bucketed_simple():
+    """Make sure bucketed sync-reduce works without DDP"""
+    tensors = [torch.tensor(1.), torch.tensor([2, 3])]
+    reduced = sync_ddp_bucketed_if_available(tensors)
+    assert all(torch.equal(t, r) for t, r in zip(tensors, reduced))
+
+
 def _ddp_test_gather_all_tensors(rank, worldsize):
     _setup_ddp(rank, worldsize)
 
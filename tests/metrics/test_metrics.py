@@ -1,11 +1,28 @@
+import math
 import os
+import sys
+from unittest import mock
+
 import numpy as np
 import pytest
 import torch
+import torch.distributed as dist
+import torch.multiprocessing as mp
 
 import tests.base.develop_utils as tutils
 from tests.base import EvalModelTemplate
-from pytorch_lightning.metrics.metric import Metric, TensorMetric, NumpyMetric, TensorCollectionMetric
+from pytorch_lightning.metrics.classification import Accuracy, ConfusionMatrix, FBeta, Precision
+from pytorch_lightning.metrics.functional.classification import accuracy, confusion_matrix, fbeta_score
+from pytorch_lightning.metrics.functional.regression import mse, psnr
+from pytorch_lightning.metrics.metric import (
+    Metric,
+    MetricCollection,
+    NumpyMetric,
+    StatefulMetric,
+    TensorCollectionMetric,
+    TensorMetric,
+)
+from pytorch_lightning.metrics.regression import MSE, PSNR
 from pytorch_lightning import Trainer
 
 
@@ -186,3 +203,193 @@ def test_saving_pickable(tmpdir, metric: Metric):
 
     # Check metric value is the same
     assert results_before_save == results_after_load
+
+
+@pytest.mark.parametrize(['metric', 'functional', 'make_batch'], [
+    pytest.param(Accuracy(), accuracy, lambda: (torch.randint(4, (10,)), torch.randint(4, (10,))), id='accuracy'),
+    pytest.param(FBeta(0.5, reduction='none'), lambda p, t: fbeta_score(p, t, 0.5, reduction='none'),
+                 lambda: (torch.randint(4, (10,)), torch.randint(4, (10,))), id='fbeta'),
+    pytest.param(ConfusionMatrix(), confusion_matrix,
+                 lambda: (torch.randint(4, (10,)), torch.randint(4, (10,))), id='confusion_matrix'),
+    pytest.param(MSE(), mse, lambda: (torch.rand(10), torch.rand(10)), id='mse'),
+    pytest.param(PSNR(), psnr, lambda: (torch.rand(10), torch.rand(10)), id='psnr'),
+])
+def test_stateful_metric(metric, functional, make_batch):
+    """Test that stateful metrics return the batch value and accumulate the states of all batches."""
+    torch.manual_seed(0)
+    batches = [make_batch() for _ in range(3)]
+
+    for pred, target in batches:
+        assert torch.allclose(metric(pred, target), functional(pred, target))
+
+    pred, target = (torch.cat(tensors) for tensors in zip(*batches))
+    assert torch.allclose(metric.compute(), functional(pred, target))
+    # computing does not change the states
+    assert torch.allclose(metric.compute(), functional(pred, target))
+
+    # states move with the metric, but keep their dtype
+    state_dtypes = {name: state.dtype for name, state in metric._get_states().items()}
+    metric.double()
+    assert all(state.dtype == state_dtypes[name] for name, state in metric._get_states().items())
+    assert metric.compute().dtype == torch.float64
+    metric.float()
+
+    metric.reset()
+    pred, target = batches[0]
+    metric.update(pred, target)
+    assert torch.allclose(metric.compute(), functional(pred, target))
+
+    # stateful metrics are still metrics
+    assert isinstance(metric, Metric)
+
+
+class DummyMinMaxMetric(StatefulMetric):
+    """Tracks the elementwise min and max of sequences of varying length."""
+
+    def __init__(self, ndim: int = 1):
+        super().__init__('min_max')
+        shape = (0,) * ndim
+        self.add_state('min', torch.empty(shape), reduce_op='min')
+        self.add_state('max', torch.empty(shape), reduce_op='max')
+        self.add_state('int_min', torch.empty(shape, dtype=torch.long), reduce_op='min')
+        self.add_state('int_max', torch.empty(shape, dtype=torch.long), reduce_op='max')
+
+    def update(self, values):
+        self._update_state('min', values)
+        self._update_state('max', values)
+        self._update_state('int_min', values.long())
+        self._update_state('int_max', values.long())
+
+    def compute_from_states(self):
+        return self.min, self.max, self.int_min, self.int_max
+
+
+def test_stateful_metric_half_keeps_state_precision():
+    """Test that casting a metric does not round its states through the new dtype."""
+    metric = MSE()
+    metric(torch.tensor([0., 300.]), torch.tensor([0., 0.]))
+    metric.half()
+    assert metric.sum_error.dtype == torch.float64
+    # 300 ** 2 is larger than the largest float16 value
+    assert metric.sum_error.item() == 90000
+    assert metric.compute().dtype == torch.float16
+
+
+def test_stateful_metric_min_max_padding():
+    """Test that min and max states of different lengths are not padded with zeros."""
+    metric = DummyMinMaxMetric()
+    metric(torch.tensor([3., -4.]))
+    metric(torch.tensor([5., -2., 7.]))
+    metric(torch.tensor([-1.]))
+
+    min_state, max_state, int_min, int_max = metric.compute()
+    assert torch.equal(min_state, torch.tensor([-1., -4., 7.]))
+    assert torch.equal(max_state, torch.tensor([5., -2., 7.]))
+    assert torch.equal(int_min, torch.tensor([-1, -4, 7]))
+    assert torch.equal(int_max, torch.tensor([5, -2, 7]))
+
+
+def _ddp_test_stateful_metric_min_max(rank, worldsize):
+    _setup_ddp(rank, worldsize)
+    values = [torch.tensor([[3., -4.]]), torch.tensor([[5.], [-2.]])]
+
+    metric = DummyMinMaxMetric(ndim=2)
+    metric(values[rank])
+    min_state, max_state, int_min, int_max = metric.compute()
+
+    # the entry which is padding on all processes keeps the identity of the reduction
+    assert torch.equal(min_state, torch.tensor([[3., -4.], [-2., math.inf]]))
+    assert torch.equal(max_state, torch.tensor([[5., -4.], [-2., -math.inf]]))
+    assert torch.equal(int_min, torch.tensor([[3, -4], [-2, torch.iinfo(torch.long).max]]))
+    assert torch.equal(int_max, torch.tensor([[5, -4], [-2, torch.iinfo(torch.long).min]]))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="DDP not available on windows")
+def test_stateful_metric_min_max_padding_ddp():
+    """Make sure min and max states of different shapes are synced without the padding winning."""
+    tutils.reset_seed()
+    tutils.set_random_master_port()
+
+    worldsize = 2
+    mp.spawn(_ddp_test_stateful_metric_min_max, args=(worldsize,), nprocs=worldsize)
+
+
+def _ddp_test_stateful_metric(rank, worldsize):
+    _setup_ddp(rank, worldsize)
+    torch.manual_seed(0)
+    # each process sees a different number of classes
+    preds = [torch.randint(3, (20,)), torch.randint(5, (20,))]
+    targets = [torch.randint(3, (20,)), torch.randint(5, (20,))]
+
+    metric = Accuracy(reduction='none')
+    for pred, target in zip(preds[rank].chunk(4), targets[rank].chunk(4)):
+        metric(pred, target)
+
+    with mock.patch('torch.distributed.all_reduce', wraps=dist.all_reduce) as all_reduce:
+        result = metric.compute()
+
+    # one reduction of the state shapes and one of all states
+    assert all_reduce.call_count == 2
+    assert torch.allclose(result, accuracy(torch.cat(preds), torch.cat(targets), reduction='none'), equal_nan=True)
+
+
+def _setup_ddp(rank, worldsize):
+    os.environ['MASTER_ADDR'] = 'localhost'
+    dist.init_process_group("gloo", rank=rank, world_size=worldsize)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="DDP not available on windows")
+def test_stateful_metric_ddp():
+    """Make sure stateful metrics sync their states once when computing."""
+    tutils.reset_seed()
+    tutils.set_random_master_port()
+
+    worldsize = 2
+    mp.spawn(_ddp_test_stateful_metric, args=(worldsize,), nprocs=worldsize)
+
+
+def _ddp_test_metric_collection(rank, worldsize):
+    _setup_ddp(rank, worldsize)
+    pred, target = torch.tensor([0, 1, 2, 2]), torch.tensor([0, 1, 1, 2])
+    metrics = MetricCollection({
+        'dummy_a': DummyTensorMetric(),
+        'dummy_b': DummyTensorMetric(),
+        'accuracy': Accuracy(),
+        'precision': Precision(num_classes=3),
+    })
+
+    with mock.patch('torch.distributed.all_reduce', wraps=dist.all_reduce) as all_reduce:
+        results = metrics(pred, target)
+    # both tensor metrics are reduced at once, stateful metrics are not synced per batch
+    assert all_reduce.call_count == 1
+    assert list(results) == ['dummy_a', 'dummy_b', 'accuracy', 'precision']
+    assert results['dummy_a'].item() == results['dummy_b'].item() == worldsize
+
+    with mock.patch('torch.distributed.all_reduce', wraps=dist.all_reduce) as all_reduce:
+        results = metrics.compute()
+    # shapes of the inferred number of classes and one sum of all states
+    assert all_reduce.call_count == 2
+    assert list(results) == ['accuracy', 'precision']
+    assert torch.allclose(results['accuracy'], accuracy(pred, target))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="DDP not available on windows")
+def test_metric_collection_ddp():
+    """Make sure metric collections sync all their metrics together."""
+    tutils.reset_seed()
+    tutils.set_random_master_port()
+
+    worldsize = 2
+    mp.spawn(_ddp_test_metric_collection, args=(worldsize,), nprocs=worldsize)
+
+
+def test_metric_collection():
+    metrics = MetricCollection([Accuracy(), MSE()])
+    assert list(metrics.keys()) == ['accuracy', 'mse']
+
+    pred, target = torch.tensor([0., 1, 2, 2]), torch.tensor([0., 1, 1, 2])
+    results = metrics(pred, target)
+    assert torch.allclose(results['mse'], mse(pred, target))
+
+    metrics.reset()
+    assert metrics['mse'].total == 0
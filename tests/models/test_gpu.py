@@ -445,3 +445,38 @@ def test_non_blocking():
     with patch.object(batch, 'to', wraps=batch.to) as mocked:
         batch = trainer.accelerator_backend.batch_to_device(batch, torch.device('cuda:0'))
         mocked.assert_called_with(torch.device('cuda', 0))
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="test requires GPU machine")
+def test_deferred_scalars_gpu():
+    """Test that scalar CUDA tensors are copied to the host without changing values or structure."""
+    from pytorch_lightning.trainer.supporters import DeferredScalars
+
+    metrics = {
+        'a': torch.tensor(1.5, device='cuda'),
+        'b': {'c': torch.tensor(2, device='cuda'), 'd': torch.tensor(0.25)},
+        'e': 3,
+    }
+    scalars = DeferredScalars(metrics)
+    assert scalars.is_async
+    assert scalars.resolve() == {'a': 1.5, 'b': {'c': 2, 'd': 0.25}, 'e': 3}
+    assert not scalars.is_async
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="test requires GPU machine")
+def test_deferred_metrics_logged_gpu(tmpdir):
+    """Test that metrics logged from the training loop reach the logger and progress bar."""
+    model = EvalModelTemplate()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=10,
+        limit_val_batches=2,
+        row_log_interval=1,
+        gpus=1,
+    )
+    trainer.fit(model)
+
+    assert 'epoch' in trainer.logger_connector.logged_metrics
+    assert all(not isinstance(v, torch.Tensor) for v in trainer.logger_connector.logged_metrics.values())
+    assert all(not isinstance(v, torch.Tensor) for v in trainer.logger_connector.progress_bar_metrics.values())
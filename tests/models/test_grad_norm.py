@@ -2,8 +2,10 @@ import os
 
 import numpy as np
 import pytest
+import torch
 
 from pytorch_lightning import Trainer
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests.base import EvalModelTemplate
 from tests.base.develop_utils import reset_seed
 
@@ -73,3 +75,52 @@ def test_grad_tracking(tmpdir, norm_type, rtol=5e-3):
         log, mod = [log[k] for k in common], [mod[k] for k in common]
 
         assert np.allclose(log, mod, rtol=rtol)
+
+
+@pytest.mark.parametrize("norm_type", [1., 2, 'inf'])
+def test_grad_norm_group_depth(norm_type):
+    reset_seed()
+    model = EvalModelTemplate()
+    model.loss(torch.zeros(2, dtype=torch.long), model(torch.rand(2, 28 * 28))).backward()
+
+    norm_type = float(norm_type)
+    per_param = model.grad_norm(norm_type)
+    grouped = model.grad_norm(norm_type, group_depth=1)
+
+    prefix = f'grad_{norm_type}_norm_'
+    groups = {}
+    for name, p in model.named_parameters():
+        if p.grad is not None:
+            groups.setdefault(name.split('.')[0], []).append(p.grad.cpu().numpy().ravel())
+    assert grouped.keys() == {prefix + group for group in groups} | {prefix + 'total'}
+    for group, grads in groups.items():
+        expected = np.linalg.norm(np.concatenate(grads), norm_type)
+        assert np.allclose(grouped[prefix + group], expected, rtol=5e-3, atol=1e-3)
+    assert np.allclose(grouped[prefix + 'total'], per_param[prefix + 'total'], rtol=5e-3)
+
+
+def test_grad_tracking_group_depth(tmpdir):
+    os.environ['PL_DEV_DEBUG'] = '1'
+    reset_seed()
+
+    model = ModelWithManualGradTracker(2)
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_steps=2,
+        track_grad_norm=2,
+        track_grad_norm_depth=1,
+        row_log_interval=1,
+    )
+    result = trainer.fit(model)
+
+    assert result == 1, "Training failed"
+    modules = {name.split('.')[0] for name, _ in model.named_parameters()}
+    expected = {f'grad_2.0_norm_{name}' for name in modules} | {'grad_2.0_norm_total'}
+    for log in trainer.dev_debugger.logged_metrics:
+        assert expected == {k for k in log if k.startswith('grad_')}
+
+
+@pytest.mark.parametrize("depth", [0, -1, 1.5])
+def test_grad_tracking_group_depth_invalid(tmpdir, depth):
+    with pytest.raises(MisconfigurationException, match="track_grad_norm_depth"):
+        Trainer(default_root_dir=tmpdir, track_grad_norm=2, track_grad_norm_depth=depth)
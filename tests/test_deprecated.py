@@ -7,6 +7,8 @@ import torch
 
 from pytorch_lightning import Trainer
 from pytorch_lightning.callbacks import GpuUsageLogger, LearningRateLogger
+from pytorch_lightning.metrics import MSE
+from pytorch_lightning.profiler import SimpleProfiler
 from tests.base import EvalModelTemplate
 
 
@@ -27,6 +29,25 @@ def test_tbd_remove_in_v0_11_0_trainer_gpu():
         gpu_usage = GpuUsageLogger()
 
 
+def test_tbd_remove_in_v0_11_0_simple_profiler_recorded_durations():
+    profiler = SimpleProfiler()
+    for _ in range(3):
+        with profiler.profile('a'):
+            pass
+    with pytest.deprecated_call(match='will be removed in v0.11.0'):
+        durations = profiler.recorded_durations
+    assert len(durations['a']) == profiler.recorded_stats['a'].count == 3
+
+
+def test_tbd_remove_in_v0_11_0_metric_reduction_none():
+    pred, target = torch.tensor([0., 1, 2, 3]), torch.tensor([0., 1, 2, 2])
+    with pytest.deprecated_call(match='will be removed in v0.11.0'):
+        metric = MSE(reduction='none')
+    # the batch values are still elementwise
+    assert torch.equal(metric(pred, target), torch.tensor([0., 0, 0, 1]))
+    assert torch.allclose(metric.compute(), torch.tensor(0.25))
+
+
 def test_tbd_remove_in_v0_10_0_trainer():
     rnd_val = random.random()
     with pytest.deprecated_call(match='will be removed in v0.10.0'):
@@ -1,11 +1,24 @@
+import json
 import os
+import threading
 import time
 from pathlib import Path
+from unittest.mock import patch
 
 import numpy as np
 import pytest
 
-from pytorch_lightning.profiler import AdvancedProfiler, SimpleProfiler
+from pytorch_lightning import Trainer
+from pytorch_lightning.profiler import (
+    AdvancedProfiler,
+    CUDAEventProfiler,
+    SimpleProfiler,
+    TraceProfiler,
+    merge_chrome_traces,
+)
+from pytorch_lightning.profiler.profilers import DurationStats
+from pytorch_lightning.utilities.distributed import rank_zero_only
+from tests.base import EvalModelTemplate
 
 PROFILER_OVERHEAD_MAX_TOLERANCE = 0.0005
 
@@ -90,6 +103,63 @@ def test_simple_profiler_describe(caplog, simple_profiler):
     assert "Profiler Report" in caplog.text
 
 
+def test_simple_profiler_interval_metrics():
+    """Ensure the interval metrics only cover the actions since the last call."""
+    profiler = SimpleProfiler(log_interval_metrics=True)
+    for _ in range(3):
+        with profiler.profile("a"):
+            pass
+
+    metrics = profiler.interval_metrics()
+    assert set(metrics) == {"profiler/a/mean", "profiler/a/p90", "profiler/a/max"}
+    assert metrics["profiler/a/max"] == profiler.recorded_stats["a"].max
+    assert profiler.interval_metrics() == {}
+    assert SimpleProfiler().interval_metrics() == {}
+
+
+def test_simple_profiler_logs_interval_metrics(tmpdir):
+    """Ensure the trainer logs the interval metrics with the training metrics."""
+    os.environ['PL_DEV_DEBUG'] = '1'
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_steps=4,
+        limit_val_batches=0,
+        row_log_interval=2,
+        profiler=SimpleProfiler(log_interval_metrics=True),
+    )
+    trainer.fit(EvalModelTemplate())
+
+    logged = [m for m in trainer.dev_debugger.logged_metrics if 'profiler/model_forward/mean' in m]
+    assert len(logged) == 2
+    assert all(m['profiler/model_forward/max'] >= m['profiler/model_forward/mean'] for m in logged)
+
+
+def test_duration_stats():
+    """Ensure the streaming statistics match the statistics of all durations."""
+    durations = np.random.RandomState(0).lognormal(-5, 1.5, size=10000)
+    durations[:100] = 0
+    stats = DurationStats()
+    for duration in durations:
+        stats.add(duration)
+
+    assert stats.count == len(durations)
+    np.testing.assert_allclose(
+        [stats.total, stats.mean, stats.std, stats.min, stats.max],
+        [durations.sum(), durations.mean(), durations.std(ddof=1), durations.min(), durations.max()],
+    )
+    sorted_durations = np.sort(durations)
+    for q in (0.005, 0.5, 0.9, 0.99):
+        expected = sorted_durations[int(q * (len(durations) - 1))]
+        np.testing.assert_allclose(stats.quantile(q), expected, rtol=0.01)
+
+    # the memory stays bounded
+    bounded_stats = DurationStats(max_buckets=200)
+    for duration in durations:
+        bounded_stats.add(duration)
+    assert len(bounded_stats._buckets) == 200
+    np.testing.assert_allclose(bounded_stats.quantile(0.99), stats.quantile(0.99))
+
+
 def test_simple_profiler_value_errors(simple_profiler):
     """Ensure errors are raised where expected."""
 
@@ -105,6 +175,114 @@ def test_simple_profiler_value_errors(simple_profiler):
     simple_profiler.stop(action)
 
 
+class _FakeCudaEvent:
+    """Stands in for `torch.cuda.Event`, the device only passes the events which were waited for."""
+    host_clock = 0
+    device_clock = 0
+    synchronized = 0
+
+    def __init__(self, enable_timing=False):
+        self.time = None
+
+    def record(self):
+        _FakeCudaEvent.host_clock += 2
+        self.time = _FakeCudaEvent.host_clock
+
+    def query(self):
+        return self.time <= _FakeCudaEvent.device_clock
+
+    def synchronize(self):
+        _FakeCudaEvent.synchronized += 1
+        _FakeCudaEvent.device_clock = max(_FakeCudaEvent.device_clock, self.time)
+
+    def elapsed_time(self, end_event):
+        return float(end_event.time - self.time)
+
+
+def test_cuda_event_profiler_cpu_fallback(tmpdir):
+    """Ensure the profiler reports like the simple profiler without a GPU."""
+    with patch('torch.cuda.is_available', return_value=False):
+        profiler = CUDAEventProfiler()
+    with profiler.profile("a"):
+        pass
+
+    assert profiler.recorded_stats["a"].count == 1
+    assert not profiler.pending_events
+    assert "Mean device" not in profiler.summary()
+
+
+def test_cuda_event_profiler_resolves_lazily():
+    """Ensure the events are only waited for to bound the pending events and for the summary."""
+    with patch('torch.cuda.is_available', return_value=True), patch('torch.cuda.Event', _FakeCudaEvent):
+        profiler = CUDAEventProfiler(max_pending_events=3)
+        for _ in range(5):
+            with profiler.profile("a"):
+                pass
+
+        # the two oldest pairs were waited for
+        assert _FakeCudaEvent.synchronized == 2
+        assert len(profiler.pending_events["a"]) == 3
+        assert profiler.recorded_device_stats["a"].count == 2
+
+        summary = profiler.summary()
+        assert "Mean device" in summary
+        assert not profiler.pending_events["a"]
+        stats = profiler.recorded_device_stats["a"]
+        assert stats.count == 5
+        # milliseconds of the fake clock to seconds
+        assert stats.mean == pytest.approx(2e-3)
+
+
+def test_trace_profiler_ring_buffer_and_nesting(tmpdir):
+    """Ensure the trace keeps the most recent events and nested actions lie within their parent."""
+    profiler = TraceProfiler(os.path.join(tmpdir, "trace.json"), max_events=3)
+    for _ in range(2):
+        with profiler.profile("outer"):
+            with profiler.profile("inner"):
+                time.sleep(0.01)
+
+    assert [e[0] for e in profiler.events] == ["outer", "inner", "outer"]
+    with pytest.raises(ValueError):
+        profiler.stop("outer")
+
+    path = profiler.export()
+    events = json.loads(Path(path).read_text())["traceEvents"]
+    inner, outer = [e for e in events if e["ph"] == "X"][1:]
+    assert inner["tid"] == outer["tid"] == threading.get_ident()
+    assert outer["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert inner["dur"] >= 1e4
+
+
+def test_trace_profiler_ranks_and_merge(tmpdir):
+    """Ensure each rank writes its own trace and the traces merge into one timeline."""
+    profiler = TraceProfiler(os.path.join(tmpdir, "trace.json"))
+    with profiler.profile("a"):
+        pass
+    paths = [profiler.export()]
+    with patch.object(rank_zero_only, 'rank', 1):
+        assert profiler.rank_filename == os.path.join(tmpdir, "trace_rank1.json")
+        paths.append(profiler.export())
+
+    merged = merge_chrome_traces(paths, os.path.join(tmpdir, "merged.json"))
+    events = json.loads(Path(merged).read_text())["traceEvents"]
+    assert sorted(e["pid"] for e in events if e["ph"] == "X") == [0, 1]
+
+
+def test_trace_profiler_trainer(tmpdir):
+    """Ensure the trainer writes the trace with the hooks nested within the training batches."""
+    profiler = TraceProfiler(os.path.join(tmpdir, "trace.json"))
+    trainer = Trainer(default_root_dir=tmpdir, max_steps=2, limit_val_batches=0, profiler=profiler)
+    trainer.fit(EvalModelTemplate())
+
+    events = json.loads(Path(tmpdir, "trace.json").read_text())["traceEvents"]
+    batches = [e for e in events if e["name"] == "run_training_batch"]
+    assert len(batches) == 2
+    batch = batches[0]
+    hooks = [e for e in events if e["name"] == "on_batch_start"]
+    assert batch["ts"] <= hooks[0]["ts"] <= batch["ts"] + batch["dur"]
+    assert any(e["name"] == "get_train_batch" for e in events)
+
+
 @pytest.mark.parametrize(["action", "expected"], [
     pytest.param("a", [3, 1]),
     pytest.param("b", [2]),
@@ -133,6 +133,44 @@ def test_reduce_lr_on_plateau_scheduling(tmpdir):
         'lr schduler was not correctly converted to dict'
 
 
+def test_reduce_lr_on_plateau_step_interval_monitors_batch_metrics(tmpdir):
+    """Test that a step interval `ReduceLROnPlateau` sees the metrics logged by the current batch."""
+    model = EvalModelTemplate()
+    logged_values = []
+    monitored_values = []
+
+    def training_step(batch, batch_idx, optimizer_idx=None):
+        output = EvalModelTemplate.training_step(model, batch, batch_idx)
+        logged_values.append(float(output['log']['train_some_val']))
+        return output
+
+    def configure_optimizers():
+        optimizer = torch.optim.Adam(model.parameters(), lr=model.learning_rate)
+        scheduler = torch.optim.lr_scheduler.ReduceLROnPlateau(optimizer)
+        scheduler_step = scheduler.step
+
+        def step(metrics, *args, **kwargs):
+            monitored_values.append(float(metrics))
+            return scheduler_step(metrics, *args, **kwargs)
+
+        scheduler.step = step
+        return [optimizer], [{'scheduler': scheduler, 'interval': 'step', 'monitor': 'train_some_val'}]
+
+    model.training_step = training_step
+    model.configure_optimizers = configure_optimizers
+
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=4,
+        limit_val_batches=0,
+    )
+    trainer.fit(model)
+
+    assert len(monitored_values) == 4
+    assert monitored_values == pytest.approx(logged_values)
+
+
 def test_optimizer_return_options():
 
     trainer = Trainer()
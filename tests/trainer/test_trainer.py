@@ -7,7 +7,7 @@ import types
 from argparse import Namespace
 from copy import deepcopy
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
 
 import cloudpickle
 import pytest
@@ -16,11 +16,13 @@ from omegaconf import OmegaConf
 
 import tests.base.develop_utils as tutils
 from pytorch_lightning import Callback, LightningModule, Trainer
+from pytorch_lightning.accelerators.base_backend import clip_grad_norm
 from pytorch_lightning.callbacks import EarlyStopping, ModelCheckpoint
 from pytorch_lightning.core.saving import (
     load_hparams_from_tags_csv, load_hparams_from_yaml, save_hparams_to_tags_csv)
 from pytorch_lightning.loggers import TensorBoardLogger
 from pytorch_lightning.trainer.logging import TrainerLoggingMixin
+from pytorch_lightning.trainer.supporters import DeferredScalars
 from pytorch_lightning.utilities.cloud_io import load as pl_load
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests.base import EvalModelTemplate
@@ -800,6 +802,130 @@ def test_nan_params_detection(tmpdir):
     assert not torch.isfinite(params).all()
 
 
+@pytest.mark.parametrize(['terminate_on_nan', 'expected_step', 'expected_param'], [
+    pytest.param(True, 5, 'c_d2.weight'),
+    # later batches spread the nan values to other weights until they are checked
+    pytest.param(4, 7, r'c_d\w*\.\w*'),
+])
+def test_nan_detection_interval(tmpdir, terminate_on_nan, expected_step, expected_param):
+    """Test that the checks of several batches are read at once and the failing parameter is named."""
+
+    class CurrentModel(EvalModelTemplate):
+        test_batch_nan = 5
+
+        def on_after_backward(self):
+            if self.global_step == self.test_batch_nan:
+                torch.nn.init.constant_(self.c_d2.weight, math.inf)
+
+    model = CurrentModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_steps=20,
+        terminate_on_nan=terminate_on_nan,
+    )
+
+    with patch.object(trainer, 'print_nan_gradients', wraps=trainer.print_nan_gradients) as print_nan_gradients:
+        with pytest.raises(ValueError, match=f'.*Detected nan and/or inf values in `{expected_param}`.*'):
+            trainer.fit(model)
+    print_nan_gradients.assert_called_once()
+    # the batches are checked in groups of `terminate_on_nan`
+    assert trainer.global_step == expected_step
+
+
+@pytest.mark.parametrize('max_steps', [None, 6])
+def test_nan_detection_last_batches(tmpdir, max_steps):
+    """Test that the batches since the last check are checked at the end of the training."""
+
+    class CurrentModel(EvalModelTemplate):
+        def training_step(self, batch, batch_idx):
+            output = super().training_step(batch, batch_idx)
+            if self.global_step == 5:
+                output['loss'] *= torch.tensor(math.inf)
+            return output
+
+    model = CurrentModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        max_steps=max_steps,
+        limit_train_batches=6,
+        limit_val_batches=0,
+        terminate_on_nan=4,
+    )
+
+    with pytest.raises(ValueError, match=r'.*The loss returned in `training_step` is nan or inf.*'):
+        trainer.fit(model)
+    assert trainer._nan_flags == []
+
+
+def test_nan_detection_flags_reset(tmpdir):
+    """Test that the flags left from a previous run are not checked."""
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=2,
+        limit_val_batches=0,
+        terminate_on_nan=4,
+    )
+    trainer._nan_flags = [torch.tensor([False, True])]
+    trainer.fit(EvalModelTemplate())
+    assert trainer._nan_flags == []
+
+
+def test_deferred_step_metrics(tmpdir):
+    """Test that step metrics still being copied from the device are logged with the next step or at epoch end."""
+
+    class LoggedStepsCallback(Callback):
+        logged_steps = []
+
+        def on_train_batch_end(self, trainer, *args):
+            # the metrics of this step are only handed to the logger after this hook
+            self.logged_steps.append(trainer.logger.agg_and_log_metrics.call_count)
+
+    callback = LoggedStepsCallback()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=4,
+        limit_val_batches=0,
+        row_log_interval=1,
+        callbacks=[callback],
+    )
+    with patch.object(DeferredScalars, 'is_async', new_callable=PropertyMock, return_value=True), \
+            patch.object(trainer.logger, 'agg_and_log_metrics') as agg_and_log_metrics:
+        trainer.fit(EvalModelTemplate())
+
+    # each step is logged when the next one logs, the last one at the end of the epoch
+    assert callback.logged_steps == [0, 0, 1, 2]
+    assert [c[1]['step'] for c in agg_and_log_metrics.call_args_list] == [0, 1, 2, 3]
+    assert isinstance(trainer.logger_connector.progress_bar_metrics['some_val'], float)
+    assert trainer.logger_connector._deferred_pbar_metrics is None
+
+
+def test_deferred_step_metrics_flushed_on_exception(tmpdir):
+    """Test that the deferred metrics of the last step are logged when the training crashes."""
+
+    class CurrentModel(EvalModelTemplate):
+        def training_step(self, batch, batch_idx):
+            if batch_idx == 2:
+                raise RuntimeError('crash')
+            return super().training_step(batch, batch_idx)
+
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=4,
+        limit_val_batches=0,
+        row_log_interval=1,
+    )
+    with patch.object(DeferredScalars, 'is_async', new_callable=PropertyMock, return_value=True), \
+            patch.object(trainer.logger, 'agg_and_log_metrics') as agg_and_log_metrics:
+        with pytest.raises(RuntimeError, match='crash'):
+            trainer.fit(CurrentModel())
+
+    assert [c[1]['step'] for c in agg_and_log_metrics.call_args_list] == [0, 1]
+
+
 def test_trainer_interrupted_flag(tmpdir):
     """Test the flag denoting that a user interrupted training."""
 
@@ -839,7 +965,14 @@ def test_trainer_interrupted_flag(tmpdir):
     assert isinstance(handle_interrupt_callback.exc_info[1], KeyboardInterrupt)
 
 
-def test_gradient_clipping(tmpdir):
+@pytest.mark.parametrize(['norm_type', 'clip_val'], [
+    pytest.param(1, 1.),
+    pytest.param(2, 1.),
+    pytest.param(3.5, 1.),
+    # the largest absolute gradient can be below 1
+    pytest.param('inf', 1e-3),
+])
+def test_gradient_clipping(tmpdir, norm_type, clip_val):
     """
     Test gradient clipping
     """
@@ -849,13 +982,16 @@ def test_gradient_clipping(tmpdir):
     # test that gradient is clipped correctly
     def _optimizer_step(*args, **kwargs):
         parameters = model.parameters()
-        grad_norm = torch.norm(torch.stack([torch.norm(p.grad.detach(), 2) for p in parameters]), 2)
-        assert (grad_norm - 1.0).abs() < 0.01, "Gradient norm != 1.0: {grad_norm}".format(grad_norm=grad_norm)
+        p_norm = float(norm_type)
+        grad_norm = torch.norm(torch.stack([torch.norm(p.grad.detach(), p_norm) for p in parameters]), p_norm)
+        assert (grad_norm - clip_val).abs() < 0.01 * clip_val, \
+            "Gradient norm != {clip_val}: {grad_norm}".format(clip_val=clip_val, grad_norm=grad_norm)
 
     trainer = Trainer(
         max_steps=1,
         max_epochs=1,
-        gradient_clip_val=1.0,
+        gradient_clip_val=clip_val,
+        gradient_clip_norm_type=norm_type,
         default_root_dir=tmpdir,
     )
 
@@ -866,6 +1002,25 @@ def test_gradient_clipping(tmpdir):
     trainer.fit(model)
 
 
+@pytest.mark.parametrize('norm_type', [1., 2., 3.5, float('inf')])
+def test_clip_grad_norm_matches_torch(norm_type):
+    tutils.reset_seed()
+    params = [torch.nn.Parameter(torch.rand(size, dtype=dtype))
+              for size, dtype in [(3, torch.float), (4, torch.double), (5, torch.float), (2, torch.double)]]
+    for p in params:
+        p.grad = torch.randn_like(p) * 10
+    expected_params = [torch.nn.Parameter(p.detach().clone()) for p in params]
+    for p, expected in zip(params, expected_params):
+        expected.grad = p.grad.clone()
+
+    total_norm = clip_grad_norm(params, max_norm=1., norm_type=norm_type, eps=1e-6)
+    expected_norm = torch.nn.utils.clip_grad_norm_(expected_params, max_norm=1., norm_type=norm_type)
+    assert torch.allclose(total_norm, expected_norm.float())
+    for p, expected in zip(params, expected_params):
+        assert p.grad.dtype == expected.grad.dtype
+        assert torch.allclose(p.grad, expected.grad, atol=1e-6)
+
+
 def test_gpu_choice(tmpdir):
     trainer_options = dict(
         default_root_dir=tmpdir,
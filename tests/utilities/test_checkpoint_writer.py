@@ -0,0 +1,29 @@
+import os
+from unittest import mock
+
+import torch
+
+from pytorch_lightning.utilities.checkpoint_writer import AsyncCheckpointWriter
+
+
+def test_async_checkpoint_writer_close(tmpdir):
+    """Test that the writer only stays registered to be closed at exit while its thread runs."""
+    path = os.path.join(tmpdir, 'model.ckpt')
+    writer = AsyncCheckpointWriter()
+    with mock.patch('atexit.register') as register, mock.patch('atexit.unregister') as unregister:
+        # closing a writer which never started its thread
+        writer.close()
+        unregister.assert_called_once_with(writer.close)
+
+        writer.save({'a': torch.ones(2)}, path)
+        register.assert_called_once_with(writer.close)
+        writer.close()
+        assert writer._thread is None
+        assert unregister.call_count == 2
+        assert torch.equal(torch.load(path)['a'], torch.ones(2))
+
+        # the writer can be used again after closing it
+        writer.save({'a': torch.zeros(2)}, path)
+        writer.close()
+        assert register.call_count == 2
+    assert torch.equal(torch.load(path)['a'], torch.zeros(2))
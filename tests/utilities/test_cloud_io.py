@@ -0,0 +1,109 @@
+import os
+
+import fsspec
+import pytest
+import torch
+from fsspec.implementations.memory import MemoryFile, MemoryFileSystem
+
+from pytorch_lightning.utilities import cloud_io
+from pytorch_lightning.utilities.cloud_io import atomic_save
+
+
+def test_atomic_save_local(tmpdir):
+    path = os.path.join(tmpdir, 'model.ckpt')
+    atomic_save({'a': torch.ones(3)}, path)
+    atomic_save({'a': torch.zeros(3)}, path)
+
+    # overwritten in place and no temporary files left behind
+    assert os.listdir(tmpdir) == ['model.ckpt']
+    assert torch.equal(torch.load(path)['a'], torch.zeros(3))
+
+
+def test_atomic_save_local_url(tmpdir):
+    path = 'file://' + os.path.join(tmpdir, 'model.ckpt')
+    atomic_save({'a': torch.ones(3)}, path)
+    atomic_save({'a': torch.zeros(3)}, path)
+
+    assert os.listdir(tmpdir) == ['model.ckpt']
+    assert torch.equal(torch.load(os.path.join(tmpdir, 'model.ckpt'))['a'], torch.zeros(3))
+
+
+def test_atomic_save_failure_keeps_previous_checkpoint(tmpdir):
+    path = os.path.join(tmpdir, 'model.ckpt')
+    atomic_save({'a': torch.ones(3)}, path)
+
+    class Unpicklable:
+        def __reduce__(self):
+            raise AttributeError('not picklable')
+
+    with pytest.raises(AttributeError):
+        atomic_save({'a': torch.zeros(3), 'b': Unpicklable()}, path)
+
+    assert os.listdir(tmpdir) == ['model.ckpt']
+    assert torch.equal(torch.load(path)['a'], torch.ones(3))
+
+
+def test_atomic_save_remote_filesystem():
+    path = 'memory://checkpoints/model.ckpt'
+    atomic_save({'a': torch.ones(3)}, path)
+    atomic_save({'a': torch.zeros(3)}, path)
+
+    fs = fsspec.filesystem('memory')
+    assert [os.path.basename(f) for f in fs.ls('/checkpoints', detail=False)] == ['model.ckpt']
+    with fs.open(path, 'rb') as f:
+        assert torch.equal(torch.load(f)['a'], torch.zeros(3))
+
+
+def test_atomic_save_remote_failed_move_keeps_previous_checkpoint(monkeypatch):
+    path = 'memory://failed_move/model.ckpt'
+    atomic_save({'a': torch.ones(3)}, path)
+
+    fs = fsspec.filesystem('memory')
+    mv = fs.mv
+
+    def failing_mv(src, dst, **kwargs):
+        if src.endswith('.part'):
+            raise OSError('interrupted')
+        return mv(src, dst, **kwargs)
+
+    monkeypatch.setattr(fs, 'mv', failing_mv)
+    with pytest.raises(OSError, match='interrupted'):
+        atomic_save({'a': torch.zeros(3)}, path)
+
+    assert [os.path.basename(f) for f in fs.ls('/failed_move', detail=False)] == ['model.ckpt']
+    with fs.open(path, 'rb') as f:
+        assert torch.equal(torch.load(f)['a'], torch.ones(3))
+
+
+class ObjectStoreFileSystem(MemoryFileSystem):
+    """Only creates an object on commit when opened with ``autocommit=False``, like object stores."""
+
+    protocol = ('s3',)
+    store = {}
+    pseudo_dirs = ['']
+
+    def _open(self, path, mode='rb', autocommit=True, **kwargs):
+        if mode == 'wb':
+            f = MemoryFile(self, self._strip_protocol(path))
+            if autocommit:
+                f.commit()
+            return f
+        return super()._open(path, mode=mode, **kwargs)
+
+
+def test_atomic_save_object_store_failure_keeps_previous_checkpoint(monkeypatch):
+    fs = ObjectStoreFileSystem()
+    monkeypatch.setattr(cloud_io, 'get_filesystem', lambda path: fs)
+    path = 's3://bucket/model.ckpt'
+    atomic_save({'a': torch.ones(3)}, path)
+
+    def failing_save(checkpoint, f):
+        f.write(b'partial')
+        raise RuntimeError('interrupted')
+
+    monkeypatch.setattr(cloud_io, '_torch_save', failing_save)
+    with pytest.raises(RuntimeError, match='interrupted'):
+        atomic_save({'a': torch.zeros(3)}, path)
+
+    with fs.open(path, 'rb') as f:
+        assert torch.equal(torch.load(f)['a'], torch.ones(3))
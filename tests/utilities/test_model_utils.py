@@ -0,0 +1,26 @@
+from pytorch_lightning.utilities.model_utils import clear_overridden_cache, is_overridden
+from tests.base import EvalModelTemplate
+
+
+def test_is_overridden_instance_and_class_changes():
+    class Model(EvalModelTemplate):
+        def on_batch_start(self):
+            pass
+
+    model = Model()
+    assert is_overridden('on_batch_start', model)
+    assert is_overridden('training_step', model)
+    assert not is_overridden('on_batch_end', model)
+    assert not is_overridden('not_a_hook', model)
+
+    # methods assigned to the instance are not taken from the cache
+    model.on_batch_end = lambda: None
+    assert is_overridden('on_batch_end', model)
+    model.training_step = None
+    assert not is_overridden('training_step', model)
+    assert is_overridden('training_step', Model())
+
+    # methods replaced on the class are picked up once the cache is cleared
+    Model.on_batch_start = EvalModelTemplate.on_batch_start
+    clear_overridden_cache()
+    assert not is_overridden('on_batch_start', Model())